@@ -1,9 +1,34 @@
 """Global module for use with AppDaemon, Alexa Request Objects.
 
+The request objects only keep a reference to the directive,
+fields are read from it when accessed instead of copied on construction.
+
 .. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
 
 """
-from typing import Dict
+from typing import Any, Dict, Optional
+
+
+class _DirectiveField:
+    """Descriptor reading a field from the directive on access.
+
+    Nothing is copied on construction,
+    only the fields actually used by the handler are looked up.
+    """
+
+    def __init__(self, section: str, *path: str) -> None:
+        """Initialize the object with the keys leading to the field."""
+        self.section = section
+        self.path = path
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        """Return the field value from the directive."""
+        if instance is None:
+            return self
+        value = instance._directive[self.section]
+        for key in self.path:
+            value = value[key]
+        return value
 
 
 class GenericRequest:
@@ -18,15 +43,19 @@ class GenericRequest:
     anything.
     """
 
+    __slots__ = ("_rawRequest", "_directive", "_namespace", "_name")
+
+    payloadVersion = _DirectiveField("header", "payloadVersion")
+    messageId = _DirectiveField("header", "messageId")
+
     def __init__(
         self, request: Dict, init_namespace: str, init_name: str
     ) -> None:
         """Initialize the object."""
         self._rawRequest = request
+        self._directive = request["directive"]
         self._namespace = init_namespace
         self._name = init_name
-        self._payloadVersion = request["directive"]["header"]["payloadVersion"]
-        self._messageId = request["directive"]["header"]["messageId"]
 
     @property
     def rawRequest(self) -> Dict:
@@ -43,16 +72,6 @@ def name(self) -> str:
         """str: Return the name."""
         return self._name
 
-    @property
-    def payloadVersion(self) -> str:
-        """str: Return the payload version."""
-        return self._payloadVersion
-
-    @property
-    def messageId(self) -> str:
-        """str: Return the message id."""
-        return self._messageId
-
 
 class EndpointRequest(GenericRequest):
     """Object represnting requests containing endpoint data.
@@ -61,154 +80,99 @@ class EndpointRequest(GenericRequest):
     for other types of requests use any of the folowwing subclassess.
     """
 
-    def __init__(
-        self, request: Dict, init_namespace: str, init_name: str
-    ) -> None:
-        """Initialize the object."""
-        super(EndpointRequest, self).__init__(
-            request, init_namespace, init_name
-        )
-        self._correlationToken = request["directive"]["header"][
-            "correlationToken"
-        ]
-        self._endpointId = request["directive"]["endpoint"]["endpointId"]
-        self._tokenType = request["directive"]["endpoint"]["scope"]["type"]
-        self._token = request["directive"]["endpoint"]["scope"]["token"]
+    __slots__ = ()
 
-    @property
-    def correlationToken(self) -> str:
-        """str: Return the correlation token."""
-        return self._correlationToken
+    correlationToken = _DirectiveField("header", "correlationToken")
+    endpointId = _DirectiveField("endpoint", "endpointId")
+    tokenType = _DirectiveField("endpoint", "scope", "type")
+    token = _DirectiveField("endpoint", "scope", "token")
 
-    @property
-    def endpointId(self) -> str:
-        """str: Return the endpoint id."""
-        return self._endpointId
 
-    @property
-    def tokenType(self) -> str:
-        """str: Return the token type."""
-        return self._tokenType
+class DiscoveryRequest(GenericRequest):
+    """Object represnting discovery requests."""
 
-    @property
-    def token(self) -> str:
-        """str: Return the token value."""
-        return self._token
+    __slots__ = ()
 
+    tokenType = _DirectiveField("payload", "scope", "type")
+    token = _DirectiveField("payload", "scope", "token")
 
-class DiscoveryRequest(GenericRequest):
-    """Object represnting discovery requests."""
 
-    def __init__(
-        self, request: Dict, init_namespace: str, init_name: str
-    ) -> None:
-        """Initialize the object."""
-        super(DiscoveryRequest, self).__init__(
-            request, init_namespace, init_name
-        )
-        self._tokenType = request["directive"]["payload"]["scope"]["type"]
-        self._token = request["directive"]["payload"]["scope"]["token"]
+class AcceptGrantRequest(GenericRequest):
+    """Object represnting the authorization grant request."""
 
-    @property
-    def tokenType(self) -> str:
-        """str: Return the token type."""
-        return self._tokenType
+    __slots__ = ()
 
-    @property
-    def token(self) -> str:
-        """str: Return the token value."""
-        return self._token
+    grantType = _DirectiveField("payload", "grant", "type")
+    code = _DirectiveField("payload", "grant", "code")
+    granteeType = _DirectiveField("payload", "grantee", "type")
+    granteeToken = _DirectiveField("payload", "grantee", "token")
 
 
 class AdjustThermostatTemperatureRequest(EndpointRequest):
     """Object represnting the adjust tempereture by delta request."""
 
-    def __init__(
-        self, request: Dict, init_namespace: str, init_name: str
-    ) -> None:
-        """Initialize the object."""
-        super(AdjustThermostatTemperatureRequest, self).__init__(
-            request, init_namespace, init_name
-        )
-        self._value = request["directive"]["payload"]["targetSetpointDelta"][
-            "value"
-        ]
-        self._scale = request["directive"]["payload"]["targetSetpointDelta"][
-            "scale"
-        ]
-
-    @property
-    def value(self) -> str:
-        """str: Return the tempereture value."""
-        return self._value
+    __slots__ = ()
 
-    @property
-    def scale(self) -> str:
-        """str: Return the tempereture scale."""
-        return self._scale
+    value = _DirectiveField("payload", "targetSetpointDelta", "value")
+    scale = _DirectiveField("payload", "targetSetpointDelta", "scale")
 
 
 class SetThermostatTemperatureRequest(EndpointRequest):
     """Object represnting the set the tempereture to x request."""
 
-    def __init__(
-        self, request: Dict, init_namespace: str, init_name: str
-    ) -> None:
-        """Initialize the object."""
-        super(SetThermostatTemperatureRequest, self).__init__(
-            request, init_namespace, init_name
-        )
-        self._value = request["directive"]["payload"]["targetSetpoint"][
-            "value"
-        ]
-        self._scale = request["directive"]["payload"]["targetSetpoint"][
-            "scale"
-        ]
-
-    @property
-    def value(self) -> str:
-        """str: Return the tempereture value."""
-        return self._value
+    __slots__ = ()
 
-    @property
-    def scale(self) -> str:
-        """str: Return the tempereture scale."""
-        return self._scale
+    value = _DirectiveField("payload", "targetSetpoint", "value")
+    scale = _DirectiveField("payload", "targetSetpoint", "scale")
 
 
 class SetThermostatModeRequest(EndpointRequest):
     """Object represnting the set the mode to to x request."""
 
-    def __init__(
-        self, request: Dict, init_namespace: str, init_name: str
-    ) -> None:
-        """Initialize the object."""
-        super(SetThermostatModeRequest, self).__init__(
-            request, init_namespace, init_name
-        )
-        self._value = request["directive"]["payload"]["thermostatMode"][
-            "value"
-        ]
+    __slots__ = ()
 
-    @property
-    def value(self) -> str:
-        """str: Return the tempereture value."""
-        return self._value
+    value = _DirectiveField("payload", "thermostatMode", "value")
 
 
 class PowerControlRequest(EndpointRequest):
-    """Object represnting the set the mode to to x request."""
+    """Object represnting the turn on or turn off request."""
 
-    def __init__(
-        self, request: Dict, init_namespace: str, init_name: str
-    ) -> None:
-        """Initialize the object."""
-        super(PowerControlRequest, self).__init__(
-            request, init_namespace, init_name
-        )
-        self._powerState = True if self.name == "TurnOn" else False
+    __slots__ = ()
 
     @property
     def powerState(self) -> bool:
         """str: Return True of TurnOn power state."""
-        return self._powerState
+        return self.name == "TurnOn"
+
+
+request_classes = {
+    ("Alexa", "ReportState"): EndpointRequest,
+    ("Alexa.Discovery", "Discover"): DiscoveryRequest,
+    ("Alexa.Authorization", "AcceptGrant"): AcceptGrantRequest,
+    ("Alexa.PowerController", "TurnOn"): PowerControlRequest,
+    ("Alexa.PowerController", "TurnOff"): PowerControlRequest,
+    (
+        "Alexa.ThermostatController",
+        "SetTargetTemperature",
+    ): SetThermostatTemperatureRequest,
+    (
+        "Alexa.ThermostatController",
+        "AdjustTargetTemperature",
+    ): AdjustThermostatTemperatureRequest,
+    (
+        "Alexa.ThermostatController",
+        "SetThermostatMode",
+    ): SetThermostatModeRequest,
+}
+
+
+def create_request(request: Dict) -> GenericRequest:
+    """Use for creating the request object matching the directive.
+
+    Unknown directives are represented by a GenericRequest.
+    """
+    header = request["directive"]["header"]
+    namespace = header["namespace"]
+    name = header["name"]
+    request_class = request_classes.get((namespace, name), GenericRequest)
+    return request_class(request, namespace, name)
@@ -25,6 +25,9 @@ def __init__(
         **kwargs: Optional[Dict],
     ) -> None:
         """Initialize the object."""
+        little_helpers.metrics.inc(
+            "alexa_error_responses_total", type=error_type
+        )
         self.response_header = {
             "namespace": namespace,
             "name": "ErrorResponse",
@@ -138,6 +141,32 @@ def __init__(self, request_object: EndpointRequest, message: str) -> None:
         )
 
 
+class AcceptGrantErrorResponse(GenericErrorResponse):
+    """Object represnting the failed authorization grant error.
+
+    Authorization errors carry no endpoint.
+    """
+
+    def __init__(self, request_object: GenericRequest, message: str) -> None:
+        """Initialize the object."""
+        super(AcceptGrantErrorResponse, self).__init__(
+            request_object,
+            "ACCEPT_GRANT_FAILED",
+            message,
+            namespace="Alexa.Authorization",
+        )
+        del self.response_header["correlationToken"]
+
+    def create_response(self) -> Dict:
+        """Return the dict response."""
+        return {
+            "event": {
+                "header": self.response_header,
+                "payload": self.response_payload,
+            }
+        }
+
+
 class InternalErrorResponse(GenericErrorResponse):
     """Object represnting the internal error."""
 
@@ -1,22 +1,88 @@
 """Global module for use with AppDaemon, Alexa Success Response Objects.
 
+The constant parts of the responses are kept in module level skeletons,
+building a response only fills the message ids, values and timestamps.
+The change report events are also serialized from json templates.
+
 .. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
 
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import little_helpers
-from alexa_request import DiscoveryRequest, EndpointRequest
+from alexa_request import AcceptGrantRequest, DiscoveryRequest, EndpointRequest
+from little_helpers import slot
+
+
+def create_discovery_endpoint(entity: Dict) -> Dict:
+    """Use for creating the discovery endpoint block of a climate entity."""
+    supported_modes = []
+    for mode in entity["attributes"]["operation_list"]:
+        supported_modes.append(mode.upper())
+
+    return {
+        "endpointId": little_helpers.entityId_to_endpointId(
+            entity["entity_id"]
+        ),
+        "friendlyName": entity["attributes"]["friendly_name"],
+        "description": "AC Custom Thermostat by TomerFi",
+        "manufacturerName": "TomerFi",
+        "displayCategories": ["THERMOSTAT", "TEMPERATURE_SENSOR"],
+        "cookie": {},
+        "capabilities": [
+            {
+                "type": "AlexaInterface",
+                "interface": "Alexa.ThermostatController",
+                "version": "3",
+                "properties": {
+                    "supported": [
+                        {"name": "targetSetpoint"},
+                        {"name": "thermostatMode"},
+                    ],
+                    "proactivelyReported": True,
+                    "retrievable": True,
+                },
+                "configuration": {
+                    "supportsScheduling": False,
+                    "supportedModes": supported_modes,
+                },
+            },
+            {
+                "type": "AlexaInterface",
+                "interface": "Alexa.TemperatureSensor",
+                "version": "3",
+                "properties": {
+                    "supported": [{"name": "temperature"}],
+                    "proactivelyReported": True,
+                    "retrievable": True,
+                },
+            },
+            {
+                "type": "AlexaInterface",
+                "interface": "Alexa.PowerController",
+                "version": "3",
+                "properties": {
+                    "supported": [{"name": "powerState"}],
+                    "proactivelyReported": True,
+                    "retrievable": True,
+                },
+            },
+        ],
+    }
 
 
 class DiscoveryResponse:
     """Object represnting the discovery response.
 
     For errors in discovery use the success response with no endpoints.
+    Prebuilt endpoint blocks can be passed instead of the entities.
     """
 
     def __init__(
-        self, request_object: DiscoveryRequest, entities: List[Dict]
+        self,
+        request_object: DiscoveryRequest,
+        entities: List[Dict],
+        endpoints: Optional[List[Dict]] = None,
     ) -> None:
         """Initialize the object."""
         self.response_header = {
@@ -25,64 +91,13 @@ def __init__(
             "messageId": little_helpers.get_uuid_str(),
             "payloadVersion": "3",
         }
-        self.response_payload = {"endpoints": []}  # type: Dict[str, List[Any]]
-
-        for entity in entities:
-            supported_modes = []
-            for mode in entity["attributes"]["operation_list"]:
-                supported_modes.append(mode.upper())
-
-            self.response_payload["endpoints"].append(
-                {
-                    "endpointId": little_helpers.entityId_to_endpointId(
-                        entity["entity_id"]
-                    ),
-                    "friendlyName": entity["attributes"]["friendly_name"],
-                    "description": "AC Custom Thermostat by TomerFi",
-                    "manufacturerName": "TomerFi",
-                    "displayCategories": ["THERMOSTAT", "TEMPERATURE_SENSOR"],
-                    "cookie": {},
-                    "capabilities": [
-                        {
-                            "type": "AlexaInterface",
-                            "interface": "Alexa.ThermostatController",
-                            "version": "3",
-                            "properties": {
-                                "supported": [
-                                    {"name": "targetSetpoint"},
-                                    {"name": "thermostatMode"},
-                                ],
-                                "proactivelyReported": True,
-                                "retrievable": True,
-                            },
-                            "configuration": {
-                                "supportsScheduling": False,
-                                "supportedModes": supported_modes,
-                            },
-                        },
-                        {
-                            "type": "AlexaInterface",
-                            "interface": "Alexa.TemperatureSensor",
-                            "version": "3",
-                            "properties": {
-                                "supported": [{"name": "temperature"}],
-                                "proactivelyReported": True,
-                                "retrievable": True,
-                            },
-                        },
-                        {
-                            "type": "AlexaInterface",
-                            "interface": "Alexa.PowerController",
-                            "version": "3",
-                            "properties": {
-                                "supported": [{"name": "powerState"}],
-                                "proactivelyReported": True,
-                                "retrievable": True,
-                            },
-                        },
-                    ],
-                }
-            )
+        if endpoints is None:
+            endpoints = [
+                create_discovery_endpoint(entity) for entity in entities
+            ]
+        self.response_payload = {
+            "endpoints": endpoints
+        }  # type: Dict[str, List[Any]]
 
     def create_response(self) -> Dict:
         """Return the reponse dict."""
@@ -94,6 +109,131 @@ def create_response(self) -> Dict:
         }
 
 
+class AcceptGrantResponse:
+    """Object represnting the authorization grant response."""
+
+    def __init__(self, request_object: AcceptGrantRequest) -> None:
+        """Initialize the object."""
+        self.response_header = {
+            "namespace": "Alexa.Authorization",
+            "name": "AcceptGrant.Response",
+            "messageId": little_helpers.get_uuid_str(),
+            "payloadVersion": "3",
+        }
+
+    def create_response(self) -> Dict:
+        """Return the reponse dict."""
+        return {"event": {"header": self.response_header, "payload": {}}}
+
+
+reportable_attributes = ("temperature", "current_temperature")
+
+
+def has_reportable_state(entity: Dict) -> bool:
+    """Use for checking the entity state has the reportable attributes.
+
+    Unavailable entities are missing them.
+    """
+    attributes = entity.get("attributes", {})
+    return all(attribute in attributes for attribute in reportable_attributes)
+
+
+_target_setpoint_skeleton = {
+    "namespace": "Alexa.ThermostatController",
+    "name": "targetSetpoint",
+}
+_thermostat_mode_skeleton = {
+    "namespace": "Alexa.ThermostatController",
+    "name": "thermostatMode",
+}
+_temperature_skeleton = {
+    "namespace": "Alexa.TemperatureSensor",
+    "name": "temperature",
+}
+_power_state_skeleton = {
+    "namespace": "Alexa.PowerController",
+    "name": "powerState",
+}
+# the reportable properties of a climate entity, in the reported order
+_state_skeletons = (
+    _target_setpoint_skeleton,
+    _thermostat_mode_skeleton,
+    _temperature_skeleton,
+    _power_state_skeleton,
+)
+_state_templates = [
+    little_helpers.JsonTemplate(
+        dict(
+            skeleton,
+            value=slot("value"),
+            timeOfSample=slot("time_of_sample"),
+            uncertaintyInMilliseconds=slot("uncertainty"),
+        )
+    )
+    for skeleton in _state_skeletons
+]
+
+
+def _create_header_skeleton(name: str) -> Dict:
+    """Use for creating the constant part of a response header."""
+    return {"namespace": "Alexa", "name": name, "payloadVersion": "3"}
+
+
+_state_report_header_skeleton = _create_header_skeleton("StateReport")
+_control_header_skeleton = _create_header_skeleton("Response")
+
+
+def _fill_header(skeleton: Dict, request_object: EndpointRequest) -> Dict:
+    """Use for filling a response header skeleton."""
+    return dict(
+        skeleton,
+        messageId=little_helpers.get_uuid_str(),
+        correlationToken=request_object.correlationToken,
+    )
+
+
+def _fill_property(
+    skeleton: Dict,
+    value: Any,
+    datetime_iso: str,
+    uncertainty_milliseconds: int,
+) -> Dict:
+    """Use for filling a reportable property skeleton."""
+    return dict(
+        skeleton,
+        value=value,
+        timeOfSample=datetime_iso,
+        uncertaintyInMilliseconds=uncertainty_milliseconds,
+    )
+
+
+def get_power_state(entity: Dict) -> str:
+    """Use for getting the powerState value of a climate entity."""
+    return "OFF" if entity["state"].upper() == "OFF" else "ON"
+
+
+def get_state_values(entity: Dict, scale: str) -> List[Any]:
+    """Use for getting the reportable values of a climate entity."""
+    return [
+        {"value": entity["attributes"]["temperature"], "scale": scale},
+        entity["state"].upper(),
+        {"value": entity["attributes"]["current_temperature"], "scale": scale},
+        get_power_state(entity),
+    ]
+
+
+def create_state_properties(
+    entity: Dict, scale: str, datetime_iso: str, uncertainty_milliseconds: int
+) -> List[Dict]:
+    """Use for creating the reportable properties of a climate entity."""
+    return [
+        _fill_property(skeleton, value, datetime_iso, uncertainty_milliseconds)
+        for skeleton, value in zip(
+            _state_skeletons, get_state_values(entity, scale)
+        )
+    ]
+
+
 class StateReportResponse:
     """Object represnting the state report response."""
 
@@ -101,18 +241,15 @@ def __init__(
         self, request_object: EndpointRequest, entity: Dict, scale: str
     ) -> None:
         """Initialize the object."""
-        datetime_iso = little_helpers.get_iso_datetime_utc_tz_str()
+        now = little_helpers.get_utc_now()
+        datetime_iso = little_helpers.get_iso_datetime_utc_tz_str(now)
         uncertainty_milliseconds = little_helpers.get_elapsed_in_milliseconds(
-            entity["last_updated"]
+            entity["last_updated"], now
         )
 
-        self.response_header = {
-            "namespace": "Alexa",
-            "name": "StateReport",
-            "payloadVersion": "3",
-            "messageId": little_helpers.get_uuid_str(),
-            "correlationToken": request_object.correlationToken,
-        }
+        self.response_header = _fill_header(
+            _state_report_header_skeleton, request_object
+        )
 
         self.response_endpoint = {
             "endpointId": little_helpers.entityId_to_endpointId(
@@ -121,44 +258,9 @@ def __init__(
         }
 
         self.response_context = {
-            "properties": [
-                {
-                    "namespace": "Alexa.ThermostatController",
-                    "name": "targetSetpoint",
-                    "value": {
-                        "value": entity["attributes"]["temperature"],
-                        "scale": scale,
-                    },
-                    "timeOfSample": datetime_iso,
-                    "uncertaintyInMilliseconds": uncertainty_milliseconds,
-                },
-                {
-                    "namespace": "Alexa.ThermostatController",
-                    "name": "thermostatMode",
-                    "value": entity["state"].upper(),
-                    "timeOfSample": datetime_iso,
-                    "uncertaintyInMilliseconds": uncertainty_milliseconds,
-                },
-                {
-                    "namespace": "Alexa.TemperatureSensor",
-                    "name": "temperature",
-                    "value": {
-                        "value": entity["attributes"]["current_temperature"],
-                        "scale": scale,
-                    },
-                    "timeOfSample": datetime_iso,
-                    "uncertaintyInMilliseconds": uncertainty_milliseconds,
-                },
-                {
-                    "namespace": "Alexa.PowerController",
-                    "name": "powerState",
-                    "value": (
-                        "OFF" if entity["state"].upper() == "OFF" else "ON"
-                    ),
-                    "timeOfSample": datetime_iso,
-                    "uncertaintyInMilliseconds": uncertainty_milliseconds,
-                },
-            ]
+            "properties": create_state_properties(
+                entity, scale, datetime_iso, uncertainty_milliseconds
+            )
         }
 
     def create_response(self) -> Dict:
@@ -173,23 +275,169 @@ def create_response(self) -> Dict:
         }
 
 
+def get_change_cause(entity: Dict) -> str:
+    """Use for telling the cause of an entity change.
+
+    Changes made by a Home Assistant user carry the user id
+    in the state context, the rest were made on the device itself.
+    """
+    if (entity.get("context") or {}).get("user_id"):
+        return "APP_INTERACTION"
+    return "PHYSICAL_INTERACTION"
+
+
+class ChangeReportEvent:
+    """Object represnting the proactive change report event.
+
+    Properties that changed between the old and new entity states
+    are reported as the change, the rest as the context.
+    Changes made by the directives are answered in their responses,
+    do not report them again.
+    """
+
+    json_template = little_helpers.JsonTemplate(
+        {
+            "context": {"properties": slot("context")},
+            "event": {
+                "header": {
+                    "namespace": "Alexa",
+                    "name": "ChangeReport",
+                    "payloadVersion": "3",
+                    "messageId": slot("message_id"),
+                },
+                "endpoint": {
+                    "scope": {"type": "BearerToken", "token": slot("token")},
+                    "endpointId": slot("endpoint_id"),
+                },
+                "payload": {
+                    "change": {
+                        "cause": {"type": slot("cause")},
+                        "properties": slot("change"),
+                    }
+                },
+            },
+        }
+    )
+
+    def __init__(
+        self,
+        old_entity: Dict,
+        new_entity: Dict,
+        scale: str,
+        token: str,
+        cause: str = "PHYSICAL_INTERACTION",
+    ) -> None:
+        """Initialize the object."""
+        now = little_helpers.get_utc_now()
+        self.datetime_iso = little_helpers.get_iso_datetime_utc_tz_str(now)
+        self.uncertainty_milliseconds = little_helpers.get_elapsed_in_milliseconds(  # noqa: E501
+            new_entity["last_updated"], now
+        )
+
+        # (property index, value) of the changed and unchanged properties
+        self.changed_values = []  # type: List[Tuple[int, Any]]
+        self.unchanged_values = []  # type: List[Tuple[int, Any]]
+        for index, (old_value, value) in enumerate(
+            zip(
+                get_state_values(old_entity, scale),
+                get_state_values(new_entity, scale),
+            )
+        ):
+            if value != old_value:
+                self.changed_values.append((index, value))
+            else:
+                self.unchanged_values.append((index, value))
+
+        self.message_id = little_helpers.get_uuid_str()
+        self.token = token
+        self.endpoint_id = little_helpers.entityId_to_endpointId(
+            new_entity["entity_id"]
+        )
+        self.cause = cause
+
+    def _create_properties(self, values: List[Tuple[int, Any]]) -> List[Dict]:
+        """Use for filling the property skeletons of the values."""
+        return [
+            _fill_property(
+                _state_skeletons[index],
+                value,
+                self.datetime_iso,
+                self.uncertainty_milliseconds,
+            )
+            for index, value in values
+        ]
+
+    def create_event(self) -> Dict:
+        """Return the event dict."""
+        return {
+            "context": {
+                "properties": self._create_properties(self.unchanged_values)
+            },
+            "event": {
+                "header": {
+                    "namespace": "Alexa",
+                    "name": "ChangeReport",
+                    "payloadVersion": "3",
+                    "messageId": self.message_id,
+                },
+                "endpoint": {
+                    "scope": {"type": "BearerToken", "token": self.token},
+                    "endpointId": self.endpoint_id,
+                },
+                "payload": {
+                    "change": {
+                        "cause": {"type": self.cause},
+                        "properties": self._create_properties(
+                            self.changed_values
+                        ),
+                    }
+                },
+            },
+        }
+
+    def create_json(self) -> bytes:
+        """Return the event serialized from the json templates."""
+        time_of_sample = little_helpers.encode_json(self.datetime_iso)
+        uncertainty = little_helpers.encode_json(self.uncertainty_milliseconds)
+
+        def render(values: List[Tuple[int, Any]]) -> str:
+            return little_helpers.JsonFragment(
+                "[{}]".format(
+                    ",".join(
+                        _state_templates[index].render(
+                            value=value,
+                            time_of_sample=time_of_sample,
+                            uncertainty=uncertainty,
+                        )
+                        for index, value in values
+                    )
+                )
+            )
+
+        return self.json_template.render(
+            context=render(self.unchanged_values),
+            message_id=self.message_id,
+            token=self.token,
+            endpoint_id=self.endpoint_id,
+            cause=self.cause,
+            change=render(self.changed_values),
+        ).encode("utf-8")
+
+
 class PowerControlResponse:
     """Object represnting the power control response."""
 
     def __init__(self, request_object: EndpointRequest, entity: Dict) -> None:
         """Initialize the object."""
-        datetime_iso = little_helpers.get_iso_datetime_utc_tz_str()
+        now = little_helpers.get_utc_now()
+        datetime_iso = little_helpers.get_iso_datetime_utc_tz_str(now)
         uncertainty_milliseconds = little_helpers.get_elapsed_in_milliseconds(
-            entity["last_updated"]
+            entity["last_updated"], now
         )
 
-        self.response_header = {
-            "namespace": "Alexa",
-            "name": "Response",
-            "payloadVersion": "3",
-            "messageId": little_helpers.get_uuid_str(),
-            "correlationToken": request_object.correlationToken,
-        }
+        self.response_header = _fill_header(
+            _control_header_skeleton, request_object
+        )
 
         self.response_endpoint = {
             "endpoint": {
@@ -205,15 +453,12 @@ def __init__(self, request_object: EndpointRequest, entity: Dict) -> None:
 
         self.response_context = {
             "properties": [
-                {
-                    "namespace": "Alexa.PowerController",
-                    "name": "powerState",
-                    "value": (
-                        "OFF" if entity["state"].upper() == "OFF" else "ON"
-                    ),
-                    "timeOfSample": datetime_iso,
-                    "uncertaintyInMilliseconds": uncertainty_milliseconds,
-                }
+                _fill_property(
+                    _power_state_skeleton,
+                    get_power_state(entity),
+                    datetime_iso,
+                    uncertainty_milliseconds,
+                )
             ]
         }
 
@@ -236,40 +481,35 @@ def __init__(
         self, request_object: EndpointRequest, entity: Dict, scale: str
     ) -> None:
         """Initialize the object."""
-        datetime_iso = little_helpers.get_iso_datetime_utc_tz_str()
+        now = little_helpers.get_utc_now()
+        datetime_iso = little_helpers.get_iso_datetime_utc_tz_str(now)
         uncertainty_milliseconds = little_helpers.get_elapsed_in_milliseconds(
-            entity["last_updated"]
+            entity["last_updated"], now
         )
 
         self.response_context = {
             "properties": [
-                {
-                    "namespace": "Alexa.ThermostatController",
-                    "name": "targetSetpoint",
-                    "value": {
+                _fill_property(
+                    _target_setpoint_skeleton,
+                    {
                         "value": entity["attributes"]["temperature"],
                         "scale": scale,
                     },
-                    "timeOfSample": datetime_iso,
-                    "uncertaintyInMilliseconds": uncertainty_milliseconds,
-                },
-                {
-                    "namespace": "Alexa.ThermostatController",
-                    "name": "thermostatMode",
-                    "value": entity["state"].upper(),
-                    "timeOfSample": datetime_iso,
-                    "uncertaintyInMilliseconds": uncertainty_milliseconds,
-                },
+                    datetime_iso,
+                    uncertainty_milliseconds,
+                ),
+                _fill_property(
+                    _thermostat_mode_skeleton,
+                    entity["state"].upper(),
+                    datetime_iso,
+                    uncertainty_milliseconds,
+                ),
             ]
         }
 
-        self.response_header = {
-            "namespace": "Alexa",
-            "name": "Response",
-            "payloadVersion": "3",
-            "messageId": little_helpers.get_uuid_str(),
-            "correlationToken": request_object.correlationToken,
-        }
+        self.response_header = _fill_header(
+            _control_header_skeleton, request_object
+        )
 
         self.response_endpoint = {
             "endpointId": little_helpers.entityId_to_endpointId(
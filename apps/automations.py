@@ -3,12 +3,21 @@
 .. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
 
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import appdaemon.plugins.hass.hassapi as hass
 import little_helpers
 
 
+def log_debouncer(app: hass.Hass, debouncer: little_helpers.Debouncer) -> None:
+    """Use for logging the debouncer counters."""
+    app.log(
+        "debounced messages passed {}, suppressed {}".format(
+            debouncer.passed, debouncer.suppressed
+        )
+    )
+
+
 class BatteryLowSendNotification(hass.Hass):
     """Automation for sending notification.
 
@@ -40,6 +49,7 @@ def initialize(self) -> None:
             self.battery_state_changed, self.entity
         )
 
+    @little_helpers.instrumented
     def battery_state_changed(
         self,
         entity: Optional[str],
@@ -97,6 +107,7 @@ def initialize(self) -> None:
             self.state_changes, self.sensor_entity
         )
 
+    @little_helpers.instrumented
     def state_changes(
         self,
         entity: Optional[str],
@@ -106,17 +117,19 @@ def state_changes(
         kwargs: Optional[Dict],
     ) -> None:
         """Use for handling state change events."""
+        old_state = little_helpers.to_bool_state(old)
+        new_state = little_helpers.to_bool_state(new)
         if (
             self.turn_on_closed_to_open
-            and str(old) in little_helpers.false_strings
-            and str(new) in little_helpers.true_strings
+            and old_state is False
+            and new_state is True
         ):
             for switch in self.switch_entities:
                 self.call_service("switch/turn_on", entity_id=switch)
         elif (
             self.turn_off_open_to_closed
-            and str(old) in little_helpers.true_strings
-            and str(new) in little_helpers.false_strings
+            and old_state is True
+            and new_state is False
         ):
             for switch in self.switch_entities:
                 self.call_service("switch/turn_off", entity_id=switch)
@@ -136,6 +149,11 @@ class CallServiceOnMqttMessage(hass.Hass):
             service: 'switch.toggle'
             data:
               entity_id: "switch.bedroom_main_light"
+            debounce_milliseconds: 500
+
+    Note:
+      Repeated payloads within debounce_milliseconds (default 500)
+      are suppressed, gateways publish each rf code multiple times.
 
     """
 
@@ -143,6 +161,9 @@ def initialize(self) -> None:
         """Initialize the automation, and register the listenr."""
         self.service = self.args["service"].replace(".", "/")
         self.data = self.args["data"]
+        self.debouncer = little_helpers.Debouncer(
+            int(self.args.get("debounce_milliseconds", 500))
+        )
         self.message_handler = self.listen_event(
             self.message_arrived,
             "MQTT_MESSAGE",
@@ -151,8 +172,86 @@ def initialize(self) -> None:
             namespace="mqtt",
         )
 
+    @little_helpers.instrumented
     def message_arrived(
         self, event_name: str, data: Optional[Dict], kwargs: Optional[Dict]
     ) -> None:
         """Use for handling mqtt message events."""
-        self.call_service(self.service, **self.data)
+        if self.debouncer.should_pass(self.args["payload"]):
+            self.call_service(self.service, **self.data)
+
+    def terminate(self) -> None:
+        """Cancel listener on termination."""
+        self.cancel_listen_event(self.message_handler)
+        log_debouncer(self, self.debouncer)
+
+
+class CallServiceOnMqttMessageRouter(hass.Hass):
+    """Automation for calling services by payload on shared mqtt topics.
+
+    Replaces a CallServiceOnMqttMessage app per payload,
+    registering one listener per topic and looking up the service
+    and data for the incoming payload in a dict.
+
+    Example:
+      .. code-block:: yaml
+
+          rf_gateway_router:
+            module: automations
+            class: CallServiceOnMqttMessageRouter
+            topics:
+              'omg/rfgw_hallway/433toMQTT':
+                '9127250':
+                  service: 'switch.toggle'
+                  data:
+                    entity_id: "switch.bedroom_main_light"
+            debounce_milliseconds: 500
+
+    Note:
+      Repeated payloads within debounce_milliseconds (default 500)
+      are suppressed per topic, gateways publish each rf code multiple times.
+
+    """
+
+    def initialize(self) -> None:
+        """Initialize the automation, build the index and listeners."""
+        self.debouncer = little_helpers.Debouncer(
+            int(self.args.get("debounce_milliseconds", 500))
+        )
+        self.routes = {}  # type: Dict[str, Dict[str, Tuple[str, Dict]]]
+        for topic, payloads in self.args["topics"].items():
+            self.routes[topic] = {
+                str(payload): (
+                    route["service"].replace(".", "/"),
+                    route.get("data") or {},
+                )
+                for payload, route in payloads.items()
+            }
+
+        self.message_handlers = [
+            self.listen_event(
+                self.message_arrived,
+                "MQTT_MESSAGE",
+                topic=topic,
+                namespace="mqtt",
+            )
+            for topic in self.routes
+        ]
+
+    def terminate(self) -> None:
+        """Cancel listeners on termination."""
+        for handler in self.message_handlers:
+            self.cancel_listen_event(handler)
+        log_debouncer(self, self.debouncer)
+
+    @little_helpers.instrumented
+    def message_arrived(
+        self, event_name: str, data: Dict, kwargs: Optional[Dict]
+    ) -> None:
+        """Use for handling mqtt message events, dispatching by payload."""
+        route = self.routes[data["topic"]].get(data["payload"])
+        if route and self.debouncer.should_pass(
+            (data["topic"], data["payload"])
+        ):
+            service, service_data = route
+            self.call_service(service, **service_data)
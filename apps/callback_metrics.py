@@ -0,0 +1,158 @@
+"""AppDaemon application, instrumented callbacks and apps metrics.
+
+Note:
+  Access uri: https://<your_ha_ip_or_name>/api/appdaemon/callback_metrics
+  Prometheus format:
+    https://<your_ha_ip_or_name>/api/appdaemon/prometheus_metrics
+
+  Legacy password is requierd for appdaemon,
+  Please add '?api_password=YourSecretPassword' to the uri.
+
+  AppDaemon json encodes the api responses and only accepts posts,
+  set prometheus_port for serving the text format to scrapers at
+  http://<appdaemon_host>:<prometheus_port>/metrics.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Dict, List, Optional, Tuple
+
+import appdaemon.plugins.hass.hassapi as hass
+import little_helpers
+
+
+def collect_prometheus() -> str:
+    """Use for rendering the apps and callbacks metrics for prometheus."""
+    counters, histograms = little_helpers.metrics.collect()
+    for callback, stats in list(little_helpers.callback_stats.items()):
+        if not stats.calls:
+            continue
+        labels = (("callback", callback),)
+        counters[("appdaemon_callback_errors_total", labels)] = stats.errors
+        histograms[("appdaemon_callback_seconds", labels)] = list(
+            stats.buckets
+        ) + [stats.total_seconds]
+    return little_helpers.render_prometheus(counters, histograms)
+
+
+class PrometheusServer(ThreadingMixIn, HTTPServer):
+    """Object serving each scrape on its own thread.
+
+    http.server.ThreadingHTTPServer requires python 3.7.
+    """
+
+    daemon_threads = True
+
+
+class PrometheusRequestHandler(BaseHTTPRequestHandler):
+    """Object serving the metrics in the prometheus text format."""
+
+    def do_GET(self) -> None:
+        """Handle scrape requests."""
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = collect_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: List) -> None:
+        """Do not log every scrape."""
+
+
+class CallbackMetrics(hass.Hass):
+    """Application exposing the timing of the instrumented callbacks.
+
+    Enables the little_helpers instrumentation while running,
+    publishing the stats as the attributes of a sensor whose state is
+    the total number of calls, and serving them on an api endpoint.
+
+    The little_helpers.metrics of the apps, like the Alexa directives
+    and the ir packets sent, are served with the callbacks timing in
+    the prometheus text format.
+
+    Example:
+      .. code-block:: yaml
+
+          callback_metrics:
+            module: callback_metrics
+            class: CallbackMetrics
+            sensor_entity: sensor.appdaemon_callbacks
+            update_interval_seconds: 60
+            prometheus_port: 9105
+            global_dependencies: little_helpers
+
+    """
+
+    def initialize(self) -> None:
+        """Initialize the application, enable the instrumentation."""
+        self.sensor_entity = self.args.get(
+            "sensor_entity", "sensor.appdaemon_callbacks"
+        )
+        little_helpers.set_instrumentation(True)
+        self.update_timer = self.run_every(
+            self.update_sensor,
+            self.datetime(),
+            int(self.args.get("update_interval_seconds", 60)),
+        )
+        self.handler = self.register_endpoint(
+            self.metrics_call, "callback_metrics"
+        )
+        self.prometheus_handler = self.register_endpoint(
+            self.prometheus_call, "prometheus_metrics"
+        )
+
+        self.prometheus_server = None  # type: Optional[PrometheusServer]
+        if self.args.get("prometheus_port"):
+            self.prometheus_server = PrometheusServer(
+                ("", int(self.args["prometheus_port"])),
+                PrometheusRequestHandler,
+            )
+            threading.Thread(
+                target=self.prometheus_server.serve_forever,
+                name="prometheus_metrics",
+                daemon=True,
+            ).start()
+
+    def terminate(self) -> None:
+        """Disable the instrumentation and unregister on termination."""
+        little_helpers.set_instrumentation(False)
+        self.cancel_timer(self.update_timer)
+        self.unregister_endpoint(self.handler)
+        self.unregister_endpoint(self.prometheus_handler)
+        if self.prometheus_server:
+            self.prometheus_server.shutdown()
+            self.prometheus_server.server_close()
+
+    def collect(self) -> Dict[str, Dict]:
+        """Return the stats of the callbacks that were called."""
+        return {
+            name: stats.as_dict()
+            for name, stats in sorted(little_helpers.callback_stats.items())
+            if stats.calls
+        }
+
+    def update_sensor(self, kwargs: Optional[Dict]) -> None:
+        """Use for publishing the stats as the sensor attributes."""
+        metrics = self.collect()
+        self.set_state(
+            self.sensor_entity,
+            state=sum(stats["calls"] for stats in metrics.values()),
+            attributes=dict(
+                metrics, friendly_name="AppDaemon Callbacks", unit="calls"
+            ),
+        )
+
+    def metrics_call(self, request: Optional[Dict]) -> Tuple[Dict, int]:
+        """Handle the api calls, return the stats of all the callbacks."""
+        return self.collect(), 200
+
+    def prometheus_call(self, request: Optional[Dict]) -> Tuple[str, int]:
+        """Handle the api calls, return the prometheus text format."""
+        return collect_prometheus(), 200
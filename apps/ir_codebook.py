@@ -0,0 +1,176 @@
+"""Global module for use with AppDaemon, IR packets binary codebooks.
+
+A codebook file holds the raw broadlink bytes of a single device packets,
+preceded by an index of offsets, the file is memory mapped and each packet
+is only base64 encoded when requested.
+
+File layout (little endian):
+  header: magic (4 bytes), version (uint16), entries count (uint32).
+  index: per entry, offset (uint32), length (uint32),
+         key length (uint16) and the utf-8 key.
+  data: the raw packets bytes.
+
+Generate the codebooks from the ir packets dictionaries with:
+  python3 tools/ir_packets_source.py [target_dir]
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import mmap
+import os
+import struct
+from base64 import b64decode, b64encode
+from typing import Dict, KeysView, Mapping, Optional, Tuple
+
+CODEBOOK_MAGIC = b"IRCB"
+CODEBOOK_VERSION = 1
+CODEBOOK_SUFFIX = ".irc"
+CODEBOOKS_DIR = os.path.join(os.path.dirname(__file__), "codebooks")
+
+KEY_SEPARATOR = "/"
+
+_header_struct = struct.Struct("<4sHI")
+_entry_struct = struct.Struct("<IIH")
+
+PacketKey = Tuple[str, Optional[str], Optional[int]]
+
+
+def key_to_str(mode: str, speed: Optional[str], temp: Optional[int]) -> str:
+    """Use for converting a packet key to its codebook representation."""
+    return KEY_SEPARATOR.join(
+        (mode, speed or "", "" if temp is None else str(temp))
+    )
+
+
+def str_to_key(key: str) -> PacketKey:
+    """Use for converting a codebook key to a packet key."""
+    mode, speed, temp = key.split(KEY_SEPARATOR)
+    return mode, speed or None, int(temp) if temp else None
+
+
+def decode_packet(packet: str) -> bytes:
+    """Use for decoding base64 packets, some are stored without padding."""
+    return b64decode(packet + "=" * (-len(packet) % 4))
+
+
+def codebook_path(device_type: str, directory: str = CODEBOOKS_DIR) -> str:
+    """Use for getting the codebook file path of a device type."""
+    return os.path.join(directory, device_type + CODEBOOK_SUFFIX)
+
+
+def write_codebook(path: str, packets: Mapping[PacketKey, str]) -> None:
+    """Use for writing base64 packets as a binary codebook file."""
+    keys = [key_to_str(*key).encode("utf-8") for key in packets]
+    raw_packets = [decode_packet(packet) for packet in packets.values()]
+
+    offset = _header_struct.size + sum(
+        _entry_struct.size + len(key) for key in keys
+    )
+    index = []
+    for key, raw in zip(keys, raw_packets):
+        index.append(_entry_struct.pack(offset, len(raw), len(key)) + key)
+        offset += len(raw)
+
+    # replacing instead of truncating, the old file might still be mapped
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as codebook_file:
+        codebook_file.write(
+            _header_struct.pack(CODEBOOK_MAGIC, CODEBOOK_VERSION, len(keys))
+        )
+        codebook_file.writelines(index)
+        codebook_file.writelines(raw_packets)
+    os.replace(temp_path, path)
+
+
+class IrCodebook:
+    """Object representing a memory mapped codebook of a single device.
+
+    Only the index is parsed on load,
+    packets are sliced from the mapping and encoded on demand.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the object, map the file and parse the index."""
+        with open(path, "rb") as codebook_file:
+            self._mapping = mmap.mmap(
+                codebook_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        magic, version, count = _header_struct.unpack_from(self._mapping)
+        if magic != CODEBOOK_MAGIC or version != CODEBOOK_VERSION:
+            self._mapping.close()
+            raise Exception("{} is not a supported codebook.".format(path))
+
+        self._index = {}  # type: Dict[PacketKey, Tuple[int, int]]
+        position = _header_struct.size
+        for _ in range(count):
+            offset, length, key_length = _entry_struct.unpack_from(
+                self._mapping, position
+            )
+            key_start = position + _entry_struct.size
+            position = key_start + key_length
+            key = self._mapping[key_start:position].decode("utf-8")
+            self._index[str_to_key(key)] = (offset, length)
+
+    def __contains__(self, key: PacketKey) -> bool:
+        """Return True if the packet key is in the codebook."""
+        return key in self._index
+
+    def __len__(self) -> int:
+        """Return the number of packets in the codebook."""
+        return len(self._index)
+
+    def keys(self) -> KeysView[PacketKey]:
+        """Return the packet keys of the codebook."""
+        return self._index.keys()
+
+    def get_raw_packet(self, key: PacketKey) -> bytes:
+        """Return the raw broadlink bytes of the packet."""
+        offset, length = self._index[key]
+        end = offset + length
+        return self._mapping[offset:end]
+
+    def get_packet(self, key: PacketKey) -> str:
+        """Return the packet base64 encoded, as expected by broadlink."""
+        return b64encode(self.get_raw_packet(key)).decode("ascii")
+
+    def close(self) -> None:
+        """Close the memory mapping."""
+        self._mapping.close()
+
+
+def load_codebooks(directory: str = CODEBOOKS_DIR) -> Dict[str, IrCodebook]:
+    """Use for loading all the codebooks found in directory by device type."""
+    codebooks = {}  # type: Dict[str, IrCodebook]
+    if os.path.isdir(directory):
+        for file_name in sorted(os.listdir(directory)):
+            device_type, suffix = os.path.splitext(file_name)
+            if suffix == CODEBOOK_SUFFIX:
+                codebooks[device_type] = IrCodebook(
+                    os.path.join(directory, file_name)
+                )
+    return codebooks
+
+
+def verify_codebook(path: str, packets: Mapping[PacketKey, str]) -> None:
+    """Use for asserting every packet in the codebook is byte identical.
+
+    Raises:
+      Exception: When a packet is missing, redundant or different.
+
+    """
+    codebook = IrCodebook(path)
+    try:
+        if set(codebook.keys()) != set(packets):
+            raise Exception("{} keys do not match.".format(path))
+        for key, packet in packets.items():
+            if codebook.get_raw_packet(key) != decode_packet(packet):
+                raise Exception("{} differs for {}.".format(path, key))
+            if decode_packet(codebook.get_packet(key)) != decode_packet(
+                packet
+            ):
+                raise Exception(
+                    "{} encoding differs for {}.".format(path, key)
+                )
+    finally:
+        codebook.close()
@@ -3,14 +3,512 @@
 .. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
 
 """
-from typing import Dict, Optional
+import itertools
+import queue
+import socket
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import appdaemon.plugins.hass.hassapi as hass
+import ir_codebook
 import ir_packets_manager
 import little_helpers
 
+SENDER_SERVICE = "service"
+SENDER_UDP = "udp"
 
-class HandleMqttFan(hass.Hass):
+PRIORITY_OFF = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_STOP = 2
+
+
+class ServicePacketSender:
+    """Object sending base64 packets with the broadlink/send service."""
+
+    name = SENDER_SERVICE
+
+    def __init__(self, app: hass.Hass, host: str) -> None:
+        """Initialize the object."""
+        self.app = app
+        self.host = host
+
+    def encode(self, packet: str) -> Any:
+        """Return the payload for the packet, the service takes base64."""
+        return packet
+
+    def send(self, payload: Any) -> None:
+        """Send the payload to the transmitter."""
+        self.app.call_service("broadlink/send", host=self.host, packet=payload)
+
+    async def async_send(self, payload: Any) -> None:
+        """Send the payload to the transmitter from async apps."""
+        await self.app.call_service(
+            "broadlink/send", host=self.host, packet=payload
+        )
+
+    def close(self) -> None:
+        """Nothing to release, the service is called through the app."""
+
+
+class UdpPacketSender:
+    """Object sending raw packets bytes to a local transmitter stand-in.
+
+    Bypasses Home Assistant, for local stand-ins accepting the raw packet
+    bytes as udp datagrams. Real broadlink devices only accept the
+    authenticated and encrypted broadlink protocol and ignore these
+    datagrams, use the service sender for them.
+    """
+
+    name = SENDER_UDP
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialize the object."""
+        self.address = (host, port)
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def encode(self, packet: str) -> Any:
+        """Return the payload for the packet, the raw broadlink bytes."""
+        return ir_codebook.decode_packet(packet)
+
+    def send(self, payload: Any) -> None:
+        """Send the payload to the transmitter."""
+        self.socket.sendto(payload, self.address)
+
+    async def async_send(self, payload: Any) -> None:
+        """Send the payload to the transmitter from async apps."""
+        self.send(payload)
+
+    def close(self) -> None:
+        """Close the socket."""
+        self.socket.close()
+
+
+def create_packet_sender(app: hass.Hass, args: Dict) -> Any:
+    """Use for creating the packet sender configured in the arguments.
+
+    Args (keys of args):
+      ir_transmitter_ip: the transmitter host.
+      ir_sender: optional, 'service' (default) or 'udp'.
+      ir_sender_port: required for the 'udp' sender, the stand-in port.
+
+    """
+    sender = args.get("ir_sender", SENDER_SERVICE)
+    if sender == SENDER_SERVICE:
+        return ServicePacketSender(app, args["ir_transmitter_ip"])
+    elif sender == SENDER_UDP:
+        return UdpPacketSender(
+            args["ir_transmitter_ip"], int(args["ir_sender_port"])
+        )
+    raise Exception("unknown ir sender {}.".format(sender))
+
+
+def ac_packet_key(
+    ac_type: str,
+    mode: str,
+    speed: Optional[str] = None,
+    temp: Optional[float] = None,
+) -> Tuple:
+    """Use for creating the ir packets manager key of an AC packet."""
+    if mode in ir_packets_manager.modes_requiring_settings:
+        return (ac_type, mode, speed, None if temp is None else round(temp))
+    return (ac_type, mode, None, None)
+
+
+def climate_state_from_entity(entity_data: Dict) -> Dict[str, Any]:
+    """Use for extracting the mode, fan and temperature of a climate entity."""
+    return {
+        "mode": entity_data["state"],
+        "speed": entity_data["attributes"].get("fan_mode"),
+        "temp": entity_data["attributes"].get("temperature"),
+    }
+
+
+class PacketCache:
+    """Object representing a bounded lru cache of encoded packet payloads.
+
+    Keyed by the ir packets manager keys (device_type, mode, speed, temp).
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the object."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._payloads = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, loader: Callable[[], Any]) -> Any:
+        """Return the cached payload for key, loading it on a miss."""
+        with self._lock:
+            if key in self._payloads:
+                self._payloads.move_to_end(key)
+                self.hits += 1
+                return self._payloads[key]
+            self.misses += 1
+
+        payload = loader()
+        with self._lock:
+            self._payloads[key] = payload
+            if len(self._payloads) > self.max_size:
+                self._payloads.popitem(last=False)
+        return payload
+
+
+# shared by all apps using the same transmitter and sender
+packet_caches = {}  # type: Dict[Tuple[str, str], PacketCache]
+packet_caches_lock = threading.Lock()
+
+
+def get_packet_cache(args: Dict, sender: Any) -> Optional[PacketCache]:
+    """Use for getting the transmitter packet cache if configured.
+
+    Args (keys of args):
+      ir_transmitter_ip: the transmitter host.
+      packet_cache_size: optional, the max number of cached packets.
+
+    """
+    if not args.get("packet_cache_size"):
+        return None
+    with packet_caches_lock:
+        return packet_caches.setdefault(
+            (args["ir_transmitter_ip"], sender.name),
+            PacketCache(int(args["packet_cache_size"])),
+        )
+
+
+class TransmitterQueue:
+    """Object serializing the payloads sent to a single transmitter.
+
+    A single worker thread sends the queued payloads one at a time,
+    off commands first, putting blocks up to the timeout when the queue
+    is full before dropping the payload.
+
+    An off command supersedes the payloads queued before it for the same
+    device type, those are skipped so the device is left off.
+    """
+
+    def __init__(self, host: str, max_depth: int, put_timeout: float) -> None:
+        """Initialize the object and start the worker."""
+        self.host = host
+        self.put_timeout = put_timeout
+        self.users = 0
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self.superseded = 0
+        self.max_depth = 0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self._queue = queue.PriorityQueue(max_depth)  # type: queue.Queue
+        self._sequence = itertools.count()
+        # device type to the sequence of its last off payload, recorded
+        # before the put so the worker can never send a payload it
+        # superseded, and to its off payloads queued and being queued
+        self._off_sequences = {}  # type: Dict[str, int]
+        self._queued_off_sequences = {}  # type: Dict[str, int]
+        self._putting_off_sequences = {}  # type: Dict[str, Set[int]]
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run, name="ir_transmitter_" + host, daemon=True
+        )
+        self._worker.start()
+
+    def put(
+        self, sender: Any, payload: Any, priority: int, device_type: str
+    ) -> bool:
+        """Queue the payload, return False if dropped on a full queue."""
+        is_off = priority == PRIORITY_OFF
+        with self._lock:
+            sequence = next(self._sequence)
+            if is_off:
+                self._off_sequences[device_type] = sequence
+                self._putting_off_sequences.setdefault(device_type, set()).add(
+                    sequence
+                )
+        try:
+            self._queue.put(
+                (
+                    priority,
+                    sequence,
+                    time.monotonic(),
+                    sender,
+                    payload,
+                    device_type,
+                ),
+                timeout=self.put_timeout,
+            )
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                if is_off:
+                    self._undo_off_sequence(device_type, sequence)
+            return False
+        with self._lock:
+            if is_off:
+                self._putting_off_sequences[device_type].discard(sequence)
+                self._queued_off_sequences[device_type] = max(
+                    sequence, self._queued_off_sequences.get(device_type, -1)
+                )
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    def _undo_off_sequence(self, device_type: str, sequence: int) -> None:
+        """Forget a dropped off payload, call with the lock held."""
+        self._putting_off_sequences[device_type].discard(sequence)
+        sequences = set(self._putting_off_sequences[device_type])
+        if device_type in self._queued_off_sequences:
+            sequences.add(self._queued_off_sequences[device_type])
+        if sequences:
+            self._off_sequences[device_type] = max(sequences)
+        else:
+            del self._off_sequences[device_type]
+
+    def close_sender(self, sender: Any) -> None:
+        """Close the sender once its queued payloads were sent."""
+        self._queue.put(
+            (PRIORITY_DEFAULT, next(self._sequence), 0, sender, None, None)
+        )
+
+    def stop(self) -> None:
+        """Stop the worker once the queued payloads were sent."""
+        self._queue.put(
+            (PRIORITY_STOP, next(self._sequence), 0, None, None, None)
+        )
+
+    def stats(self) -> str:
+        """Return the queue counters as a log friendly string."""
+        with self._lock:
+            return (
+                "transmitter {} sent {}, dropped {}, failed {}, "
+                "superseded {}, max depth {}, avg latency {}ms, "
+                "max latency {}ms"
+            ).format(
+                self.host,
+                self.sent,
+                self.dropped,
+                self.failed,
+                self.superseded,
+                self.max_depth,
+                round(self.total_latency * 1000 / max(self.sent, 1)),
+                round(self.max_latency * 1000),
+            )
+
+    def _run(self) -> None:
+        """Send the queued payloads until stopped."""
+        while True:
+            (
+                priority,
+                sequence,
+                queued_at,
+                sender,
+                payload,
+                device_type,
+            ) = self._queue.get()
+            if sender is None:
+                return
+            if payload is None:
+                sender.close()
+                continue
+            with self._lock:
+                superseded = priority != PRIORITY_OFF and sequence < (
+                    self._off_sequences.get(device_type, -1)
+                )
+                if superseded:
+                    self.superseded += 1
+            if superseded:
+                continue
+            try:
+                sender.send(payload)
+            except Exception:
+                little_helpers.metrics.inc(
+                    "ir_packets_failed_total",
+                    transmitter=self.host,
+                    device_type=device_type,
+                )
+                with self._lock:
+                    self.failed += 1
+                continue
+            latency = time.monotonic() - queued_at
+            little_helpers.metrics.inc(
+                "ir_packets_sent_total",
+                transmitter=self.host,
+                device_type=device_type,
+            )
+            little_helpers.metrics.observe(
+                "ir_send_seconds",
+                latency,
+                transmitter=self.host,
+                device_type=device_type,
+            )
+            with self._lock:
+                self.sent += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+
+
+# shared by all apps using the same transmitter
+transmitter_queues = {}  # type: Dict[str, TransmitterQueue]
+transmitter_queues_lock = threading.Lock()
+
+
+def acquire_transmitter_queue(args: Dict) -> Optional[TransmitterQueue]:
+    """Use for getting the transmitter send queue if configured.
+
+    Release the queue with release_transmitter_queue when done.
+
+    Args (keys of args):
+      ir_transmitter_ip: the transmitter host.
+      send_queue_size: optional, the max number of queued payloads.
+      send_queue_timeout_milliseconds: optional, how long to wait for
+        a full queue before dropping the payload, default 1000.
+
+    """
+    if not args.get("send_queue_size"):
+        return None
+    host = args["ir_transmitter_ip"]
+    with transmitter_queues_lock:
+        if host not in transmitter_queues:
+            transmitter_queues[host] = TransmitterQueue(
+                host,
+                int(args["send_queue_size"]),
+                int(args.get("send_queue_timeout_milliseconds", 1000)) / 1000,
+            )
+        transmitter_queues[host].users += 1
+        return transmitter_queues[host]
+
+
+def release_transmitter_queue(transmitter_queue: TransmitterQueue) -> None:
+    """Use for releasing the queue, stopped when no longer used."""
+    with transmitter_queues_lock:
+        transmitter_queue.users -= 1
+        if transmitter_queue.users == 0:
+            del transmitter_queues[transmitter_queue.host]
+            transmitter_queue.stop()
+
+
+def send_packet_measured(
+    sender: Any, payload: Any, host: str, device_type: str
+) -> None:
+    """Use for sending a payload directly, collecting the send metrics."""
+    started = time.monotonic()
+    try:
+        sender.send(payload)
+    except Exception:
+        little_helpers.metrics.inc(
+            "ir_packets_failed_total",
+            transmitter=host,
+            device_type=device_type,
+        )
+        raise
+    little_helpers.metrics.inc(
+        "ir_packets_sent_total", transmitter=host, device_type=device_type
+    )
+    little_helpers.metrics.observe(
+        "ir_send_seconds",
+        time.monotonic() - started,
+        transmitter=host,
+        device_type=device_type,
+    )
+
+
+class PacketChannel:
+    """Object sending packets to a transmitter through the configured path.
+
+    Combines the sender with the optional packet cache and send queue.
+    """
+
+    def __init__(self, app: hass.Hass, args: Dict) -> None:
+        """Initialize the object."""
+        self.app = app
+        self.host = args["ir_transmitter_ip"]
+        self.sender = create_packet_sender(app, args)
+        self.cache = get_packet_cache(args, self.sender)
+        self.queue = acquire_transmitter_queue(args)
+
+    def send(self, key: Tuple, loader: Callable[[], str]) -> None:
+        """Send the packet identified by key, cached if possible.
+
+        The loader is only called on cache misses, returning the base64
+        packet. Off packets are sent ahead of other queued packets,
+        skipping the ones queued before them for the same device type.
+        """
+        if self.cache:
+            payload = self.cache.get(key, lambda: self.sender.encode(loader()))
+        else:
+            payload = self.sender.encode(loader())
+
+        if self.queue:
+            priority = (
+                PRIORITY_OFF
+                if key[1] == ir_packets_manager.MODE_OFF
+                else PRIORITY_DEFAULT
+            )
+            if not self.queue.put(self.sender, payload, priority, key[0]):
+                little_helpers.metrics.inc(
+                    "ir_packets_dropped_total",
+                    transmitter=self.host,
+                    device_type=key[0],
+                )
+                self.app.log(
+                    "send queue for {} is full, dropped {}.".format(
+                        self.queue.host, key
+                    ),
+                    level="WARNING",
+                )
+        else:
+            send_packet_measured(self.sender, payload, self.host, key[0])
+
+    def close(self) -> None:
+        """Log the counters, release the send queue and close the sender.
+
+        With a send queue, the sender is closed once its queued payloads
+        were sent.
+        """
+        if self.cache:
+            self.app.log(
+                "packet cache hits {}, misses {}".format(
+                    self.cache.hits, self.cache.misses
+                )
+            )
+        if self.queue:
+            self.app.log(self.queue.stats())
+            self.queue.close_sender(self.sender)
+            release_transmitter_queue(self.queue)
+            self.queue = None
+        else:
+            self.sender.close()
+
+
+class PacketSenderApp(hass.Hass):
+    """Base automation for sending ir packets, with optional caching.
+
+    Optional arguments:
+      ir_sender: 'service' (default) or 'udp' for a local stand-in.
+      ir_sender_port: required for the 'udp' sender.
+      packet_cache_size: the max number of cached payloads per transmitter.
+      send_queue_size: the max number of queued payloads per transmitter,
+        sending one at a time from a dedicated thread.
+      send_queue_timeout_milliseconds: how long to wait for a full queue.
+
+    """
+
+    def init_packet_sender(self) -> None:
+        """Create the packet channel for the configured transmitter."""
+        self.packet_channel = PacketChannel(self, self.args)
+
+    def send_packet(self, key: Tuple, loader: Callable[[], str]) -> None:
+        """Send the packet identified by key, loader fetches its base64."""
+        self.packet_channel.send(key, loader)
+
+    def close_packet_sender(self) -> None:
+        """Log the counters and release the packet channel."""
+        self.packet_channel.close()
+
+
+class HandleMqttFan(PacketSenderApp):
     """Automation for converting and sending Fan MQTT messages as ir packets.
 
     Example:
@@ -33,6 +531,7 @@ def initialize(self) -> None:
         self.ir_transmitter_ip = self.args["ir_transmitter_ip"]
         self.fan_type = self.args["fan_type"]
         self.command = self.args["command"]
+        self.init_packet_sender()
 
         if self.args["payload"]:
             self.fan_handler = self.listen_event(
@@ -53,21 +552,107 @@ def initialize(self) -> None:
     def terminate(self) -> None:
         """Cancel listener on termination."""
         self.cancel_listen_event(self.fan_handler)
+        self.close_packet_sender()
 
+    @little_helpers.instrumented
     def message_arrived(
         self, event_name: str, data: Optional[Dict], kwargs: Optional[Dict]
     ) -> None:
         """Use for handling mqtt message events."""
-        self.call_service(
-            "broadlink/send",
-            host=self.ir_transmitter_ip,
-            packet=ir_packets_manager.get_fan_packet(
+        self.send_packet(
+            (self.fan_type, self.command, None, None),
+            lambda: ir_packets_manager.get_fan_packet(
                 self.fan_type, self.command
             ),
         )
 
 
-class HandleMqttACUnit(hass.Hass):
+class HandleMqttFanRouter(hass.Hass):
+    """Automation for routing all the fans MQTT messages as ir packets.
+
+    Replaces a HandleMqttFan app per topic and payload,
+    registering a single listener for all the mqtt messages and
+    dispatching each (topic, payload) to its fan command with a single
+    dict lookup, which also drops the messages of other topics.
+    AppDaemon matches every message against one listener,
+    however many fans are routed.
+    The sender, cache and queue arguments of HandleMqttFan can be set
+    for all fans or per fan.
+
+    Example:
+      .. code-block:: yaml
+
+          ceiling_fans_router:
+            module: ir_packets_control
+            class: HandleMqttFanRouter
+            fan_type: "hyundai_ceiling_fan"
+            on_command: 'low'
+            fans:
+              nursery:
+                ir_transmitter_ip: "192.168.0.170"
+                command_topic: 'tomerfi_custom_fan/nursery/command'
+                speed_topic: 'tomerfi_custom_fan/nursery/speed'
+            global_dependencies: ir_packets_manager
+
+    """
+
+    def initialize(self) -> None:
+        """Initialize the automation, build the routes and listeners."""
+        self.routes = {}  # type: Dict[Tuple[str, str], Tuple[Any, ...]]
+        self.channels = []  # type: List[PacketChannel]
+        for fan_args in self.args["fans"].values():
+            args = dict(self.args)
+            args.update(fan_args)
+            fan_type = args["fan_type"]
+            on_command = args.get("on_command", ir_packets_manager.COMMAND_LOW)
+            channel = PacketChannel(self, args)
+            self.channels.append(channel)
+
+            payload_to_command = {
+                args["command_topic"]: {
+                    "off": ir_packets_manager.COMMAND_OFF,
+                    "on": on_command,
+                },
+                args["speed_topic"]: {
+                    speed: speed
+                    for speed in (
+                        ir_packets_manager.COMMAND_LOW,
+                        ir_packets_manager.COMMAND_MEDIUM,
+                        ir_packets_manager.COMMAND_HIGH,
+                    )
+                },
+            }
+            for topic, commands in payload_to_command.items():
+                for payload, command in commands.items():
+                    self.routes[(topic, payload)] = (
+                        channel,
+                        (fan_type, command, None, None),
+                    )
+
+        self.fan_handler = self.listen_event(
+            self.message_arrived, "MQTT_MESSAGE", namespace="mqtt"
+        )
+
+    def terminate(self) -> None:
+        """Cancel listener on termination."""
+        self.cancel_listen_event(self.fan_handler)
+        for channel in self.channels:
+            channel.close()
+
+    @little_helpers.instrumented
+    def message_arrived(
+        self, event_name: str, data: Dict, kwargs: Optional[Dict]
+    ) -> None:
+        """Use for handling mqtt message events, dispatching by route."""
+        route = self.routes.get((data["topic"], data["payload"]))
+        if route:
+            channel, key = route
+            channel.send(
+                key, lambda: ir_packets_manager.get_fan_packet(key[0], key[1])
+            )
+
+
+class HandleMqttACUnit(PacketSenderApp):
     """Automation for converting and sending AC MQTT messages as ir packets.
 
     Example:
@@ -83,11 +668,32 @@ class HandleMqttACUnit(hass.Hass):
             mode_command_topic: "tomerfi_custom_ac/nursery/mode"
             temperature_command_topic: "tomerfi_custom_ac/nursery/temperature"
             fan_mode_command_topic: "tomerfi_custom_ac/nursery/fan"
+            coalesce_milliseconds: 1000
+
+    Note:
+      Commands arriving within coalesce_milliseconds of each other
+      (default 0, disabled) are collapsed into one packet
+      representing the final desired mode, fan and temperature.
+
+      The mode, fan and temperature are kept locally,
+      updated from the commands sent and the climate entity state changes.
 
     """
 
     def initialize(self) -> None:
         """Initialize the automation, and register the listenr."""
+        self.coalesce_window = (
+            int(self.args.get("coalesce_milliseconds", 0)) / 1000
+        )
+        self.pending_command = None  # type: Optional[Dict[str, Any]]
+        self.pending_since = 0.0
+        self.pending_count = 0
+        self.pending_timer = None  # type: Any
+        self.pending_lock = threading.Lock()
+        self.commands_received = 0
+        self.commands_collapsed = 0
+        self.max_command_latency = 0.0
+
         self.climate_entity = self.args["climate_entity"]
         self.default_mode_for_on = self.args["default_mode_for_on"]
         self.ir_transmitter_ip = self.args["ir_transmitter_ip"]
@@ -95,6 +701,14 @@ def initialize(self) -> None:
         self.mode_command_topic = self.args["mode_command_topic"]
         self.temperature_command_topic = self.args["temperature_command_topic"]
         self.fan_mode_command_topic = self.args["fan_mode_command_topic"]
+        self.init_packet_sender()
+
+        self.climate_state = climate_state_from_entity(
+            self.get_state(self.climate_entity, attribute="all")
+        )
+        self.climate_state_handler = self.listen_state(
+            self.climate_state_changed, self.climate_entity, attribute="all"
+        )
 
         self.mode_command_handler = self.listen_event(
             self.on_mode_command,
@@ -120,59 +734,114 @@ def terminate(self) -> None:
         self.cancel_listen_event(self.mode_command_handler)
         self.cancel_listen_event(self.temperature_command_handler)
         self.cancel_listen_event(self.fan_mode_command_handler)
+        self.cancel_listen_state(self.climate_state_handler)
+        if self.pending_timer:
+            self.cancel_timer(self.pending_timer)
+        self.close_packet_sender()
+        self.log(
+            "ir commands received {}, collapsed {}, max latency {}ms".format(
+                self.commands_received,
+                self.commands_collapsed,
+                round(self.max_command_latency * 1000),
+            )
+        )
+
+    @little_helpers.instrumented
+    def climate_state_changed(
+        self,
+        entity: Optional[str],
+        attribute: Optional[str],
+        old: Optional[Dict],
+        new: Optional[Dict],
+        kwargs: Optional[Dict],
+    ) -> None:
+        """Use for keeping the local state in sync with the climate entity."""
+        if new:
+            with self.pending_lock:
+                self.climate_state.update(climate_state_from_entity(new))
 
+    @little_helpers.instrumented
     def on_mode_command(
         self, event_name: str, data: Dict, kwargs: Optional[Dict]
     ) -> None:
         """Use for handling mqtt message events for ac mode changes."""
-        if data["payload"] in little_helpers.false_strings:
-            packet = ir_packets_manager.get_ac_packet(
-                self.ac_type, data["off"]
-            )
-
+        if little_helpers.to_bool_state(data["payload"]) is False:
+            self._queue_command(mode=ir_packets_manager.MODE_OFF)
         else:
-            entity_data = self.get_state(self.climate_entity, attribute="all")
-            packet = ir_packets_manager.get_ac_packet(
-                self.ac_type,
-                data["payload"],
-                entity_data["attributes"]["fan_mode"],
-                entity_data["attributes"]["temperature"],
-            )
-
-        self._send_packet(packet)
+            self._queue_command(mode=data["payload"])
 
+    @little_helpers.instrumented
     def on_temperature_command(
         self, event_name: str, data: Dict, kwargs: Optional[Dict]
     ) -> None:
         """Use for handling mqtt message events for ac temperature changes."""
-        entity_data = self.get_state(self.climate_entity, attribute="all")
-        self._send_packet(
-            ir_packets_manager.get_ac_packet(
-                self.ac_type,
-                entity_data["state"],
-                entity_data["attributes"]["fan_mode"],
-                float(data["payload"]),
-            )
-        )
+        self._queue_command(temp=float(data["payload"]))
 
+    @little_helpers.instrumented
     def on_fan_mode_command(
         self, event_name: str, data: Dict, kwargs: Optional[Dict]
     ) -> None:
         """Use for handling mqtt message events for ac fan changes."""
-        entity_data = self.get_state(self.climate_entity, attribute="all")
-        self._send_packet(
-            ir_packets_manager.get_ac_packet(
-                self.ac_type,
-                entity_data["state"],
-                data["payload"],
-                entity_data["attributes"]["temperature"],
+        self._queue_command(speed=data["payload"])
+
+    def _queue_command(self, **desired: Any) -> None:
+        """Use for merging the command into the pending desired state.
+
+        Each command restarts the coalesce window,
+        the pending state is sent once the window passes without commands.
+        """
+        with self.pending_lock:
+            self.commands_received += 1
+            if self.pending_command is None:
+                self.pending_command = {}
+                self.pending_since = time.monotonic()
+                self.pending_count = 0
+            self.pending_command.update(desired)
+            self.pending_count += 1
+            if self.coalesce_window:
+                if self.pending_timer:
+                    self.cancel_timer(self.pending_timer)
+                self.pending_timer = self.run_in(
+                    self._flush_command, self.coalesce_window
+                )
+                return
+        self._flush_command({})
+
+    @little_helpers.instrumented
+    def _flush_command(self, kwargs: Optional[Dict]) -> None:
+        """Use for sending the pending desired state as a single packet."""
+        with self.pending_lock:
+            desired = self.pending_command
+            self.pending_command = None
+            self.pending_timer = None
+            if desired is None:
+                return
+            self.commands_collapsed += self.pending_count - 1
+            self.max_command_latency = max(
+                self.max_command_latency, time.monotonic() - self.pending_since
             )
-        )
+            self.climate_state.update(desired)
+            mode = self.climate_state["mode"]
+            speed = self.climate_state["speed"]
+            temp = self.climate_state["temp"]
 
-    def _send_packet(self, packet: str) -> None:
+        if mode == ir_packets_manager.MODE_OFF:
+            self._send_packet(ir_packets_manager.MODE_OFF)
+        else:
+            self._send_packet(mode, speed, temp)
+
+    def _send_packet(
+        self,
+        mode: str,
+        speed: Optional[str] = None,
+        temp: Optional[float] = None,
+    ) -> None:
         """Use as helper function to send ir packets with broadlink."""
-        self.call_service(
-            "broadlink/send", host=self.ir_transmitter_ip, packet=packet
+        self.send_packet(
+            ac_packet_key(self.ac_type, mode, speed, temp),
+            lambda: ir_packets_manager.get_ac_packet(
+                self.ac_type, mode, speed, temp
+            ),
         )
 
 
@@ -188,30 +857,130 @@ class TemperatureSensorToMqtt(hass.Hass):
             sensor_entity: sensor.nursery_broadlink_a1_temperature
             topic: "tomerfi_custom_ac/nursery/current_temperature"
 
+    Multiple rooms can share one app, replacing sensor_entity and topic
+    with a sensors list, all with the same publishing policy:
+
+      .. code-block:: yaml
+
+          temperature_sensors_to_mqtt:
+            module: ir_packets_control
+            class: TemperatureSensorToMqtt
+            sensors:
+              - sensor_entity: sensor.nursery_broadlink_a1_temperature
+                topic: "tomerfi_custom_ac/nursery/current_temperature"
+            min_delta: 0.3
+            flush_interval_seconds: 10
+            heartbeat_seconds: 600
+            retain: true
+
+    Note:
+      min_delta: changes smaller than this from the last published value
+        are suppressed (default 0, publish every change).
+      flush_interval_seconds: when set, changes are held and the latest
+        value per topic is published once per interval (default 0,
+        publish immediately).
+      heartbeat_seconds: when set, the last value is republished if
+        nothing was published for this long (default 0, disabled).
+      retain: publish retained messages (default false).
+
     """
 
     def initialize(self) -> None:
         """Initialize the automation, and register the listenr."""
-        self.sensor_entity = self.args["sensor_entity"]
-        self.topic = self.args["topic"]
-
-        self.state_handler = self.listen_state(
-            self.state_changed, entity=self.sensor_entity
-        )
+        sensors = self.args.get("sensors") or [self.args]
+        self.sensors = {
+            sensor["sensor_entity"]: sensor["topic"] for sensor in sensors
+        }
+        self.min_delta = float(self.args.get("min_delta", 0))
+        self.flush_interval = int(self.args.get("flush_interval_seconds", 0))
+        self.heartbeat = int(self.args.get("heartbeat_seconds", 0))
+        self.retain = bool(self.args.get("retain", False))
+
+        self.published = 0
+        self.suppressed = 0
+        self.last_published = {}  # type: Dict[str, Tuple[str, float]]
+        self.pending = {}  # type: Dict[str, str]
+        self.publish_lock = threading.Lock()
+
+        self.state_handlers = [
+            self.listen_state(self.state_changed, entity=entity, topic=topic)
+            for entity, topic in self.sensors.items()
+        ]
+
+        self.flush_timer = None
+        tick = self.flush_interval or self.heartbeat
+        if tick:
+            self.flush_timer = self.run_every(
+                self.flush, self.datetime() + timedelta(seconds=tick), tick
+            )
 
     def terminate(self) -> None:
-        """Cancel listener on termination."""
-        self.cancel_listen_state(self.state_handler)
+        """Cancel listeners on termination."""
+        for handler in self.state_handlers:
+            self.cancel_listen_state(handler)
+        if self.flush_timer:
+            self.cancel_timer(self.flush_timer)
+        self.log(
+            "temperature samples published {}, suppressed {}".format(
+                self.published, self.suppressed
+            )
+        )
 
+    @little_helpers.instrumented
     def state_changed(
         self,
         entity: Optional[str],
         attribute: Optional[str],
         old: str,
         new: str,
-        kwargs: Optional[Dict],
+        kwargs: Dict,
     ) -> None:
         """Use for handling state change events."""
+        topic = kwargs["topic"]
+        with self.publish_lock:
+            if not self._is_significant(topic, new):
+                self.suppressed += 1
+                # the held value is no longer significant either
+                if self.pending.pop(topic, None) is not None:
+                    self.suppressed += 1
+                return
+            if self.flush_interval:
+                if topic in self.pending:
+                    self.suppressed += 1
+                self.pending[topic] = new
+                return
+        self._publish(topic, new)
+
+    @little_helpers.instrumented
+    def flush(self, kwargs: Optional[Dict]) -> None:
+        """Use for publishing the held values and the due heartbeats."""
+        now = time.monotonic()
+        with self.publish_lock:
+            batch = self.pending
+            self.pending = {}
+            if self.heartbeat:
+                for topic, (value, at) in self.last_published.items():
+                    if topic not in batch and now - at >= self.heartbeat:
+                        batch[topic] = value
+
+        for topic, value in batch.items():
+            self._publish(topic, value)
+
+    def _is_significant(self, topic: str, value: str) -> bool:
+        """Use for checking the value against the last published one."""
+        if topic not in self.last_published:
+            return True
+        last_value = self.last_published[topic][0]
+        try:
+            return abs(float(value) - float(last_value)) >= self.min_delta
+        except (TypeError, ValueError):
+            return value != last_value
+
+    def _publish(self, topic: str, value: str) -> None:
+        """Use for publishing the value and recording it."""
         self.call_service(
-            "mqtt/publish", **{"topic": self.topic, "payload": new}
+            "mqtt/publish", topic=topic, payload=value, retain=self.retain
         )
+        with self.publish_lock:
+            self.published += 1
+            self.last_published[topic] = (value, time.monotonic())
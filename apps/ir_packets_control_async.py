@@ -0,0 +1,345 @@
+"""Automation classes for use with AppDaemon, async IR automations.
+
+Async variants of the ir_packets_control automations,
+the callbacks run on AppDaemon's event loop awaiting the service calls
+instead of occupying a worker thread each.
+
+Note:
+  Requires AppDaemon 4, which runs async def callbacks on the event loop.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import appdaemon.plugins.hass.hassapi as hass
+import ir_packets_control
+import ir_packets_manager
+import little_helpers
+
+# sends to the same transmitter are serialized, shared by all async apps
+transmitter_locks = {}  # type: Dict[str, asyncio.Lock]
+
+
+class AsyncPacketChannel:
+    """Object sending packets to a transmitter from async apps.
+
+    Uses the sender and packet cache of the ir_packets_control apps,
+    serializing the sends per transmitter with an asyncio lock.
+    """
+
+    def __init__(self, app: hass.Hass, args: Dict) -> None:
+        """Initialize the object."""
+        self.app = app
+        self.host = args["ir_transmitter_ip"]
+        self.sender = ir_packets_control.create_packet_sender(app, args)
+        self.cache = ir_packets_control.get_packet_cache(args, self.sender)
+        self.lock = transmitter_locks.setdefault(
+            args["ir_transmitter_ip"], asyncio.Lock()
+        )
+
+    async def send(self, key: Tuple, loader: Callable[[], str]) -> None:
+        """Send the packet identified by key, cached if possible."""
+        if self.cache:
+            payload = self.cache.get(key, lambda: self.sender.encode(loader()))
+        else:
+            payload = self.sender.encode(loader())
+
+        async with self.lock:
+            started = time.monotonic()
+            try:
+                await self.sender.async_send(payload)
+            except Exception:
+                little_helpers.metrics.inc(
+                    "ir_packets_failed_total",
+                    transmitter=self.host,
+                    device_type=key[0],
+                )
+                raise
+            little_helpers.metrics.inc(
+                "ir_packets_sent_total",
+                transmitter=self.host,
+                device_type=key[0],
+            )
+            little_helpers.metrics.observe(
+                "ir_send_seconds",
+                time.monotonic() - started,
+                transmitter=self.host,
+                device_type=key[0],
+            )
+
+    def close(self) -> None:
+        """Log the cache counters and close the sender."""
+        if self.cache:
+            self.app.log(
+                "packet cache hits {}, misses {}".format(
+                    self.cache.hits, self.cache.misses
+                )
+            )
+        self.sender.close()
+
+
+class AsyncHandleMqttFan(hass.Hass):
+    """Async automation for sending Fan MQTT messages as ir packets.
+
+    Example:
+      .. code-block:: yaml
+
+          nursery_ceiling_fan_off:
+            module: ir_packets_control_async
+            class: AsyncHandleMqttFan
+            topic: 'tomerfi_custom_fan/nursery/command'
+            payload: 'off'
+            ir_transmitter_ip: "192.168.0.170"
+            fan_type: "hyundai_ceiling_fan"
+            command: 'off'
+            global_dependencies: ir_packets_manager
+
+    """
+
+    async def initialize(self) -> None:
+        """Initialize the automation, and register the listenr."""
+        self.fan_type = self.args["fan_type"]
+        self.command = self.args["command"]
+        self.packet_channel = AsyncPacketChannel(self, self.args)
+
+        filters = {"topic": self.args["topic"], "namespace": "mqtt"}
+        if self.args.get("payload"):
+            filters["payload"] = self.args["payload"]
+        self.fan_handler = await self.listen_event(
+            self.message_arrived, "MQTT_MESSAGE", **filters
+        )
+
+    async def terminate(self) -> None:
+        """Cancel listener on termination."""
+        await self.cancel_listen_event(self.fan_handler)
+        self.packet_channel.close()
+
+    @little_helpers.instrumented
+    async def message_arrived(
+        self, event_name: str, data: Optional[Dict], kwargs: Optional[Dict]
+    ) -> None:
+        """Use for handling mqtt message events."""
+        await self.packet_channel.send(
+            (self.fan_type, self.command, None, None),
+            lambda: ir_packets_manager.get_fan_packet(
+                self.fan_type, self.command
+            ),
+        )
+
+
+class AsyncHandleMqttACUnit(hass.Hass):
+    """Async automation for sending AC MQTT messages as ir packets.
+
+    Accepts the same arguments as HandleMqttACUnit,
+    except for the send queue arguments.
+
+    Example:
+      .. code-block:: yaml
+
+          nursery_ac_automation:
+            module: ir_packets_control_async
+            class: AsyncHandleMqttACUnit
+            climate_entity: climate.nursery_air_conditioner
+            ir_transmitter_ip: "192.168.0.170"
+            ac_type: "elco_small"
+            default_mode_for_on: "cool"
+            mode_command_topic: "tomerfi_custom_ac/nursery/mode"
+            temperature_command_topic: "tomerfi_custom_ac/nursery/temperature"
+            fan_mode_command_topic: "tomerfi_custom_ac/nursery/fan"
+            coalesce_milliseconds: 500
+
+    """
+
+    async def initialize(self) -> None:
+        """Initialize the automation, and register the listenr."""
+        self.coalesce_window = (
+            int(self.args.get("coalesce_milliseconds", 0)) / 1000
+        )
+        self.pending_command = None  # type: Optional[Dict[str, Any]]
+        self.pending_since = 0.0
+        self.pending_count = 0
+        self.pending_task = None  # type: Optional[asyncio.Future]
+        self.commands_received = 0
+        self.commands_collapsed = 0
+        self.max_command_latency = 0.0
+
+        self.climate_entity = self.args["climate_entity"]
+        self.ac_type = self.args["ac_type"]
+        self.packet_channel = AsyncPacketChannel(self, self.args)
+
+        self.climate_state = ir_packets_control.climate_state_from_entity(
+            await self.get_state(self.climate_entity, attribute="all")
+        )
+        self.climate_state_handler = await self.listen_state(
+            self.climate_state_changed, self.climate_entity, attribute="all"
+        )
+
+        self.mode_command_handler = await self.listen_event(
+            self.on_mode_command,
+            "MQTT_MESSAGE",
+            topic=self.args["mode_command_topic"],
+            namespace="mqtt",
+        )
+        self.temperature_command_handler = await self.listen_event(
+            self.on_temperature_command,
+            "MQTT_MESSAGE",
+            topic=self.args["temperature_command_topic"],
+            namespace="mqtt",
+        )
+        self.fan_mode_command_handler = await self.listen_event(
+            self.on_fan_mode_command,
+            "MQTT_MESSAGE",
+            topic=self.args["fan_mode_command_topic"],
+            namespace="mqtt",
+        )
+
+    async def terminate(self) -> None:
+        """Cancel listeners on termination."""
+        await self.cancel_listen_event(self.mode_command_handler)
+        await self.cancel_listen_event(self.temperature_command_handler)
+        await self.cancel_listen_event(self.fan_mode_command_handler)
+        await self.cancel_listen_state(self.climate_state_handler)
+        if self.pending_task:
+            self.pending_task.cancel()
+        self.packet_channel.close()
+        self.log(
+            "ir commands received {}, collapsed {}, max latency {}ms".format(
+                self.commands_received,
+                self.commands_collapsed,
+                round(self.max_command_latency * 1000),
+            )
+        )
+
+    @little_helpers.instrumented
+    async def climate_state_changed(
+        self,
+        entity: Optional[str],
+        attribute: Optional[str],
+        old: Optional[Dict],
+        new: Optional[Dict],
+        kwargs: Optional[Dict],
+    ) -> None:
+        """Use for keeping the local state in sync with the climate entity."""
+        if new:
+            self.climate_state.update(
+                ir_packets_control.climate_state_from_entity(new)
+            )
+
+    @little_helpers.instrumented
+    async def on_mode_command(
+        self, event_name: str, data: Dict, kwargs: Optional[Dict]
+    ) -> None:
+        """Use for handling mqtt message events for ac mode changes."""
+        if little_helpers.to_bool_state(data["payload"]) is False:
+            await self._queue_command(mode=ir_packets_manager.MODE_OFF)
+        else:
+            await self._queue_command(mode=data["payload"])
+
+    @little_helpers.instrumented
+    async def on_temperature_command(
+        self, event_name: str, data: Dict, kwargs: Optional[Dict]
+    ) -> None:
+        """Use for handling mqtt message events for ac temperature changes."""
+        await self._queue_command(temp=float(data["payload"]))
+
+    @little_helpers.instrumented
+    async def on_fan_mode_command(
+        self, event_name: str, data: Dict, kwargs: Optional[Dict]
+    ) -> None:
+        """Use for handling mqtt message events for ac fan changes."""
+        await self._queue_command(speed=data["payload"])
+
+    async def _queue_command(self, **desired: Any) -> None:
+        """Use for merging the command into the pending desired state.
+
+        All callbacks run on the event loop, no locking is required.
+        """
+        self.commands_received += 1
+        if self.pending_command is None:
+            self.pending_command = {}
+            self.pending_since = time.monotonic()
+            self.pending_count = 0
+        self.pending_command.update(desired)
+        self.pending_count += 1
+
+        if self.coalesce_window:
+            if self.pending_task:
+                self.pending_task.cancel()
+            self.pending_task = asyncio.ensure_future(
+                self._flush_command_later()
+            )
+        else:
+            await self._flush_command()
+
+    async def _flush_command_later(self) -> None:
+        """Use for flushing the pending state once the window passes."""
+        await asyncio.sleep(self.coalesce_window)
+        self.pending_task = None
+        await self._flush_command()
+
+    async def _flush_command(self) -> None:
+        """Use for sending the pending desired state as a single packet."""
+        desired = self.pending_command
+        self.pending_command = None
+        if desired is None:
+            return
+        self.commands_collapsed += self.pending_count - 1
+        self.max_command_latency = max(
+            self.max_command_latency, time.monotonic() - self.pending_since
+        )
+        self.climate_state.update(desired)
+
+        mode = self.climate_state["mode"]
+        speed = self.climate_state["speed"]
+        temp = self.climate_state["temp"]
+        if mode == ir_packets_manager.MODE_OFF:
+            speed, temp = None, None
+        await self.packet_channel.send(
+            ir_packets_control.ac_packet_key(self.ac_type, mode, speed, temp),
+            lambda: ir_packets_manager.get_ac_packet(
+                self.ac_type, mode, speed, temp
+            ),
+        )
+
+
+class AsyncTemperatureSensorToMqtt(hass.Hass):
+    """Async automation for publishing sensor state changes as mqtt messages.
+
+    Example:
+      .. code-block:: yaml
+
+          nursery_temperature_sensor_to_mqtt:
+            module: ir_packets_control_async
+            class: AsyncTemperatureSensorToMqtt
+            sensor_entity: sensor.nursery_broadlink_a1_temperature
+            topic: "tomerfi_custom_ac/nursery/current_temperature"
+
+    """
+
+    async def initialize(self) -> None:
+        """Initialize the automation, and register the listenr."""
+        self.topic = self.args["topic"]
+        self.state_handler = await self.listen_state(
+            self.state_changed, entity=self.args["sensor_entity"]
+        )
+
+    async def terminate(self) -> None:
+        """Cancel listener on termination."""
+        await self.cancel_listen_state(self.state_handler)
+
+    @little_helpers.instrumented
+    async def state_changed(
+        self,
+        entity: Optional[str],
+        attribute: Optional[str],
+        old: str,
+        new: str,
+        kwargs: Optional[Dict],
+    ) -> None:
+        """Use for handling state change events."""
+        await self.call_service(
+            "mqtt/publish", **{"topic": self.topic, "payload": new}
+        )
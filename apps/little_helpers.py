@@ -3,11 +3,17 @@
 .. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
 
 """
+import asyncio
+import json
+import re
+import threading
+import time
+from bisect import bisect_left
 from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from uuid import uuid4
 
-import pytz
-
 true_strings = [
     "True",
     "true",
@@ -37,20 +43,79 @@
 ]
 
 
-def get_elapsed_in_milliseconds(from_datetime: str) -> int:
+def _normalize_bool_string(value: str) -> str:
+    """Use for folding the spellings of a boolean string to a single one."""
+    return value.strip().casefold().replace(" ", "_")
+
+
+_normalized_true_strings = frozenset(
+    _normalize_bool_string(value) for value in true_strings
+)
+_normalized_false_strings = frozenset(
+    _normalize_bool_string(value) for value in false_strings
+)
+
+
+@lru_cache(maxsize=256)
+def _classify_bool_string(value: str) -> Optional[bool]:
+    """Use for classifying a string, cached by the raw string."""
+    normalized = _normalize_bool_string(value)
+    if normalized in _normalized_true_strings:
+        return True
+    if normalized in _normalized_false_strings:
+        return False
+    return None
+
+
+def to_bool_state(value: Any) -> Optional[bool]:
+    """Use for classifying a state or payload as a boolean.
+
+    Any spelling of true_strings or false_strings is accepted,
+    regardless of case, surrounding whitespace or spaces vs underscores.
+
+    Returns:
+      True or False, None if the value is neither.
+
+    """
+    return _classify_bool_string(str(value))
+
+
+def get_utc_now() -> datetime:
+    """Use for getting the current time, share it across a single request."""
+    return datetime.now(timezone.utc)
+
+
+_iso_format = "%Y-%m-%dT%H:%M:%S%z"
+_iso_format_micro = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+@lru_cache(maxsize=256)
+def parse_iso_datetime(iso_datetime: str) -> datetime:
+    """Use for parsing HA iso format timestamps, like last_updated.
+
+    Cached by the raw string,
+    an entity is reported many times between updates.
+    The colon is removed from the utc offset, %z requires python 3.7
+    for parsing it and the apps run on python 3.6.
+    """
+    if iso_datetime[-3:-2] == ":":
+        iso_datetime = iso_datetime[:-3] + iso_datetime[-2:]
+    return datetime.strptime(
+        iso_datetime, _iso_format_micro if "." in iso_datetime else _iso_format
+    )
+
+
+def get_elapsed_in_milliseconds(
+    from_datetime: str, now: Optional[datetime] = None
+) -> int:
     """Use for calculating time diffrence in milliseconds.
 
     From the time passed as datetime string argument until now.
     """
-    fixed_from = (
-        from_datetime.rsplit(":", 1)[0] + from_datetime.rsplit(":", 1)[1]
-    )
+    if now is None:
+        now = get_utc_now()
     return int(
-        (
-            datetime.now(pytz.utc)
-            - datetime.strptime(fixed_from, "%Y-%m-%dT%H:%M:%S.%f%z")
-        ).total_seconds()
-        * 1000
+        (now - parse_iso_datetime(from_datetime)).total_seconds() * 1000
     )
 
 
@@ -59,9 +124,11 @@ def get_uuid_str() -> str:
     return str(uuid4())
 
 
-def get_iso_datetime_utc_tz_str():
+def get_iso_datetime_utc_tz_str(now: Optional[datetime] = None) -> str:
     """Use for creting a string time object timezone'd in iso format."""
-    return str(datetime.utcnow().replace(tzinfo=timezone.utc).isoformat())
+    if now is None:
+        now = get_utc_now()
+    return now.isoformat()
 
 
 def entityId_to_endpointId(entityId: str) -> str:
@@ -72,3 +139,359 @@ def entityId_to_endpointId(entityId: str) -> str:
 def endpointId_to_entityId(endpointId: str) -> str:
     """Use for converting Alexa endpoint to HA entity id."""
     return endpointId.replace("_", ".", 1)
+
+
+def slot(name: str) -> str:
+    """Use for marking a variable field in a JsonTemplate document."""
+    return "@@{}@@".format(name)
+
+
+_slot_pattern = re.compile(r'"@@(\w+)@@"')
+_compact_encoder = json.JSONEncoder(separators=(",", ":"))
+
+
+class JsonFragment(str):
+    """Object marking an already serialized value for JsonTemplate."""
+
+
+def encode_json(value: Any) -> JsonFragment:
+    """Use for serializing a value once, to render it in templates."""
+    return JsonFragment(_compact_encoder.encode(value))
+
+
+class JsonTemplate:
+    """Object representing a pre-serialized json document.
+
+    The constant parts of the document are serialized once,
+    rendering only serializes the values of the slots,
+    JsonFragment values are inserted as is.
+
+    Example:
+      .. code-block:: python
+
+          template = JsonTemplate({"id": slot("id"), "type": "constant"})
+          template.render(id="abc")  # '{"id":"abc","type":"constant"}'
+
+    """
+
+    def __init__(self, document: Dict) -> None:
+        """Initialize the object, serialize and split the document."""
+        parts = _slot_pattern.split(_compact_encoder.encode(document))
+        self.head = parts[0]
+        self.slots = list(zip(parts[1::2], parts[2::2]))
+
+    def render(self, **values: Any) -> str:
+        """Return the serialized document with the slots filled."""
+        rendered = [self.head]
+        for name, fragment in self.slots:
+            value = values[name]
+            rendered.append(
+                value
+                if isinstance(value, JsonFragment)
+                else _compact_encoder.encode(value)
+            )
+            rendered.append(fragment)
+        return "".join(rendered)
+
+
+class Debouncer:
+    """Object for suppressing repeated keys within a time window.
+
+    Each repeat extends the window,
+    so a burst of copies is collapsed no matter its length.
+    Expired keys are purged once per window.
+    """
+
+    def __init__(self, window_milliseconds: int) -> None:
+        """Initialize the object."""
+        self.window = window_milliseconds / 1000
+        self.passed = 0
+        self.suppressed = 0
+        self._last_seen = {}  # type: Dict[Hashable, float]
+        self._last_purge = time.monotonic()
+        self._lock = threading.Lock()
+
+    def should_pass(self, key: Hashable) -> bool:
+        """Return False if the key was seen within the window."""
+        now = time.monotonic()
+        with self._lock:
+            last_seen = self._last_seen.get(key)
+            self._last_seen[key] = now
+            if now - self._last_purge > self.window:
+                self._last_purge = now
+                self._last_seen = {
+                    seen_key: seen
+                    for seen_key, seen in self._last_seen.items()
+                    if now - seen <= self.window
+                }
+            if last_seen is not None and now - last_seen <= self.window:
+                self.suppressed += 1
+                return False
+            self.passed += 1
+            return True
+
+
+class TrafficCapture:
+    """Object appending timestamped records to a jsonl capture file.
+
+    Several apps may capture into the same file,
+    each record is a single line stamped with the wall clock time
+    under the "t" key and its kind under the "kind" key.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the object, open the file for appending."""
+        self._file = open(path, "a", buffering=1)
+        self._lock = threading.Lock()
+
+    def write(self, kind: str, **fields: Any) -> None:
+        """Use for appending a record to the capture file."""
+        line = json.dumps(dict(fields, t=time.time(), kind=kind), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """Close the capture file."""
+        self._file.close()
+
+
+latency_buckets_milliseconds = (1, 5, 25, 100, 500, 2500)
+
+
+class CallbackStats:
+    """Object accumulating the timing of an instrumented callback."""
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        # the last bucket counts the calls above the last bound
+        self.buckets = [0] * (len(latency_buckets_milliseconds) + 1)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float, failed: bool) -> None:
+        """Use for accounting a single call."""
+        bucket = bisect_left(latency_buckets_milliseconds, seconds * 1000)
+        with self._lock:
+            self.calls += 1
+            if failed:
+                self.errors += 1
+            self.total_seconds += seconds
+            if seconds > self.max_seconds:
+                self.max_seconds = seconds
+            self.buckets[bucket] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stats, the histogram keyed by the bucket bounds."""
+        with self._lock:
+            histogram = {
+                "le_{}ms".format(bound): count
+                for bound, count in zip(
+                    latency_buckets_milliseconds, self.buckets
+                )
+            }
+            histogram["inf"] = self.buckets[-1]
+            return {
+                "calls": self.calls,
+                "errors": self.errors,
+                "total_ms": round(self.total_seconds * 1000, 1),
+                "max_ms": round(self.max_seconds * 1000, 1),
+                "histogram": histogram,
+            }
+
+
+# callback qualified name -> its stats, shared by all the apps
+callback_stats = {}  # type: Dict[str, CallbackStats]
+_instrumentation_enabled = False
+
+
+def set_instrumentation(enabled: bool) -> None:
+    """Use for starting or stopping the instrumented callbacks timing."""
+    global _instrumentation_enabled
+    _instrumentation_enabled = enabled
+
+
+def instrumented(callback: Callable) -> Callable:
+    """Use for timing an AppDaemon callback, sync or async.
+
+    Counts the calls, the exceptions and the time spent under the
+    callback qualified name in callback_stats.
+    While disabled, the only overhead is checking the flag.
+
+    Example:
+      .. code-block:: python
+
+          @little_helpers.instrumented
+          def state_changed(self, entity, attribute, old, new, kwargs):
+              ...
+
+    """
+    stats = callback_stats.setdefault(callback.__qualname__, CallbackStats())
+
+    if asyncio.iscoroutinefunction(callback):
+
+        @wraps(callback)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _instrumentation_enabled:
+                return await callback(*args, **kwargs)
+            started = time.monotonic()
+            try:
+                result = await callback(*args, **kwargs)
+            except Exception:
+                stats.add(time.monotonic() - started, True)
+                raise
+            stats.add(time.monotonic() - started, False)
+            return result
+
+        return async_wrapper
+
+    @wraps(callback)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _instrumentation_enabled:
+            return callback(*args, **kwargs)
+        started = time.monotonic()
+        try:
+            result = callback(*args, **kwargs)
+        except Exception:
+            stats.add(time.monotonic() - started, True)
+            raise
+        stats.add(time.monotonic() - started, False)
+        return result
+
+    return wrapper
+
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class MetricsRegistry:
+    """Object collecting counters and latency histograms without locking.
+
+    Each thread updates its own shard, the shards are merged on scrape.
+    The histograms use the latency_buckets_milliseconds bounds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self._local = threading.local()
+        self._shards = []  # type: List[Tuple[Dict, Dict]]
+
+    def _get_shard(self) -> Tuple[Dict, Dict]:
+        """Return the counters and histograms of the current thread."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = ({}, {})
+            self._local.shard = shard
+            # appending is atomic, no lock needed for registering
+            self._shards.append(shard)
+        return shard
+
+    def inc(self, metric: str, amount: float = 1, **labels: str) -> None:
+        """Use for incrementing a counter."""
+        counters = self._get_shard()[0]
+        key = (metric, tuple(sorted(labels.items())))
+        counters[key] = counters.get(key, 0) + amount
+
+    def observe(self, metric: str, seconds: float, **labels: str) -> None:
+        """Use for adding a latency sample to a histogram."""
+        histograms = self._get_shard()[1]
+        key = (metric, tuple(sorted(labels.items())))
+        histogram = histograms.get(key)
+        if histogram is None:
+            # the bucket counts, the count above the last bound and the sum
+            histogram = [0.0] * (len(latency_buckets_milliseconds) + 2)
+            histograms[key] = histogram
+        histogram[
+            bisect_left(latency_buckets_milliseconds, seconds * 1000)
+        ] += 1
+        histogram[-1] += seconds
+
+    def collect(self) -> Tuple[Dict[MetricKey, float], Dict[MetricKey, List]]:
+        """Return the counters and histograms merged from all the threads."""
+        counters = {}  # type: Dict[MetricKey, float]
+        histograms = {}  # type: Dict[MetricKey, List]
+        for shard_counters, shard_histograms in list(self._shards):
+            for key, value in list(shard_counters.items()):
+                counters[key] = counters.get(key, 0) + value
+            for key, histogram in list(shard_histograms.items()):
+                merged = histograms.setdefault(key, [0.0] * len(histogram))
+                for index, value in enumerate(list(histogram)):
+                    merged[index] += value
+        return counters, histograms
+
+
+# shared by all the apps, rendered by the metrics app
+metrics = MetricsRegistry()
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    """Use for formatting prometheus labels, escaping the values."""
+    if not labels:
+        return ""
+    return "{{{}}}".format(
+        ",".join(
+            '{}="{}"'.format(
+                name,
+                str(value)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+                .replace("\n", "\\n"),
+            )
+            for name, value in labels
+        )
+    )
+
+
+def _format_number(value: float) -> str:
+    """Use for formatting prometheus sample values."""
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+def render_prometheus(
+    counters: Dict[MetricKey, float], histograms: Dict[MetricKey, List]
+) -> str:
+    """Use for rendering collected metrics in the prometheus text format.
+
+    Histograms are expected in the MetricsRegistry layout.
+    """
+    lines = []  # type: List[str]
+    typed = set()
+    for (name, labels), value in sorted(counters.items()):
+        if name not in typed:
+            typed.add(name)
+            lines.append("# TYPE {} counter".format(name))
+        lines.append(
+            "{}{} {}".format(
+                name, _format_labels(labels), _format_number(value)
+            )
+        )
+    for (name, labels), histogram in sorted(histograms.items()):
+        if name not in typed:
+            typed.add(name)
+            lines.append("# TYPE {} histogram".format(name))
+        cumulative = 0.0
+        bounds = [
+            str(bound / 1000) for bound in latency_buckets_milliseconds
+        ] + ["+Inf"]
+        for bound, count in zip(bounds, histogram):
+            cumulative += count
+            lines.append(
+                "{}_bucket{} {}".format(
+                    name,
+                    _format_labels(labels + (("le", bound),)),
+                    _format_number(cumulative),
+                )
+            )
+        lines.append(
+            "{}_sum{} {}".format(
+                name, _format_labels(labels), _format_number(histogram[-1])
+            )
+        )
+        lines.append(
+            "{}_count{} {}".format(
+                name, _format_labels(labels), _format_number(cumulative)
+            )
+        )
+    return "\n".join(lines) + "\n"
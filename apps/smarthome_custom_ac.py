@@ -6,16 +6,196 @@
   Legacy password is requierd for appdaemon,
   Please add '?api_password=YourSecretPassword' to the uri.
 
+  Proactive state reporting is enabled by setting change_report_url,
+  changes are coalesced per endpoint for change_report_milliseconds
+  (default 1000) and posted as ChangeReport events.
+  Changes within directive_change_milliseconds (default 5000) of a
+  directive setting the endpoint were reported in the directive response
+  and are not posted again.
+
+  The Alexa event gateway requires a Login with Amazon token,
+  set lwa_client_id and lwa_client_secret of the skill messaging
+  credentials, the token is obtained on the AcceptGrant directive sent
+  when the skill is enabled and refreshed before it expires.
+  The refresh token is kept in lwa_token_file, if set, so it survives
+  restarts, otherwise the skill needs to be enabled again after one.
+  The static change_report_token is only accepted by a stand-in gateway.
+
+  PowerController directives arriving within power_batch_milliseconds
+  (default 0, disabled) of each other, like the ones of a routine
+  turning off all the units, are set with a single service call.
+  AppDaemon serves the api calls from its worker threads,
+  each directive waits for the batch before returning its own response.
+
+  Setting capture_file appends the directives to a traffic capture,
+  see traffic_replay, with the tokens and the grant code redacted.
+
+  The directive counts and latencies are collected into
+  little_helpers.metrics, served by the callback_metrics app.
+
 .. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
 
 """
-from typing import Any, Dict, Optional, Tuple
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import alexa_request
 import alexa_response_error
 import alexa_response_success
 import appdaemon.plugins.hass.hassapi as hassapi
 import little_helpers
+import requests
+
+lwa_token_url = "https://api.amazon.com/auth/o2/token"
+# seconds before the access token expires it is refreshed
+lwa_token_margin_seconds = 60
+
+DirectiveHandler = Callable[..., Optional[Dict]]
+DirectiveHandlers = Dict[str, Dict[str, DirectiveHandler]]
+
+
+def directive(namespace: str, *names: str) -> Callable:
+    """Use for registering a method as the handler of Alexa directives.
+
+    The registered methods are collected into the
+    (namespace, name) dispatch table on initialize.
+
+    Example:
+      .. code-block:: python
+
+          @directive("Alexa.PowerController", "TurnOn", "TurnOff")
+          def _handle_power_control(self, request_object):
+              ...
+
+    """
+
+    def register(handler: DirectiveHandler) -> DirectiveHandler:
+        handler._alexa_directives = [  # type: ignore
+            (namespace, name) for name in names
+        ]
+        return handler
+
+    return register
+
+
+# (section, key, field) of the secrets in the directives
+secret_fields = (
+    ("endpoint", "scope", "token"),
+    ("payload", "scope", "token"),
+    ("payload", "grantee", "token"),
+    ("payload", "grant", "code"),
+)
+
+
+def redact_tokens(request: Dict) -> Dict:
+    """Use for copying a directive without its tokens and grant code.
+
+    Only the blocks holding the secrets are copied,
+    the rest of the copy is shared with the request.
+    """
+    directive = dict(request["directive"])
+    for section, key, field in secret_fields:
+        block = directive.get(section, {}).get(key)
+        if block and field in block:
+            directive[section] = dict(
+                directive[section], **{key: dict(block, **{field: "REDACTED"})}
+            )
+    return dict(request, directive=directive)
+
+
+class LwaToken:
+    """Object keeping the Login with Amazon token of the event gateway.
+
+    The AcceptGrant code is exchanged for an access token and a refresh
+    token, the access token is refreshed when it's about to expire.
+    """
+
+    def __init__(
+        self, client_id: str, client_secret: str, token_file: Optional[str]
+    ) -> None:
+        """Initialize the object, loading the kept refresh token."""
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token_file = token_file
+        self._access_token = None  # type: Optional[str]
+        self._expires = 0.0
+        self._refresh_token = None  # type: Optional[str]
+        self._lock = threading.Lock()
+        if token_file and os.path.exists(token_file):
+            with open(token_file) as kept_file:
+                self._refresh_token = json.load(kept_file)["refresh_token"]
+
+    def accept_grant(self, code: str) -> None:
+        """Use for exchanging the grant code for the tokens.
+
+        Raises:
+          Exception: When the exchange failed.
+
+        """
+        with self._lock:
+            self._request_token(
+                {"grant_type": "authorization_code", "code": code}
+            )
+
+    def get(self) -> str:
+        """Return the access token, refreshing it if about to expire.
+
+        Raises:
+          Exception: When no grant was accepted or the refresh failed.
+
+        """
+        with self._lock:
+            if self._access_token and time.monotonic() < self._expires:
+                return self._access_token
+            if not self._refresh_token:
+                raise Exception("no grant accepted, enable the skill.")
+            self._request_token(
+                {
+                    "grant_type": "refresh_token",
+                    "refresh_token": self._refresh_token,
+                }
+            )
+            return self._access_token  # type: ignore
+
+    def _request_token(self, data: Dict) -> None:
+        """Use for requesting the tokens, call with the lock held."""
+        response = requests.post(
+            lwa_token_url,
+            data=dict(
+                data,
+                client_id=self.client_id,
+                client_secret=self.client_secret,
+            ),
+            timeout=10,
+        )
+        response.raise_for_status()
+        tokens = response.json()
+        self._access_token = tokens["access_token"]
+        self._expires = (
+            time.monotonic()
+            + int(tokens["expires_in"])
+            - lwa_token_margin_seconds
+        )
+        if tokens["refresh_token"] != self._refresh_token:
+            self._refresh_token = tokens["refresh_token"]
+            if self.token_file:
+                with open(self.token_file, "w") as kept_file:
+                    json.dump(
+                        {"refresh_token": self._refresh_token}, kept_file
+                    )
+
+
+class PowerBatch:
+    """Object collecting the entities of a pending operation mode change."""
+
+    def __init__(self) -> None:
+        """Initialize the object."""
+        self.entity_ids = []  # type: List[str]
+        self.error = None  # type: Optional[Exception]
+        self.done = threading.Event()
 
 
 class AlexaCustomAC(hassapi.Hass):
@@ -23,82 +203,342 @@ class AlexaCustomAC(hassapi.Hass):
 
     Bridging Home Assistant climate entities
     as smart thermostats for Alexa usage.
+
+    New Alexa interfaces are supported by adding methods
+    registered with the directive decorator.
     """
 
     def initialize(self) -> None:
         """Initialize the application.
 
-        Collect the arguments and register the endpoint.
+        Collect the arguments, build the dispatch table
+        and register the endpoint.
         """
         self.entities = self.args["entities"]
         self.default_mode_for_on = self.args["default_mode_for_on"]
         self.scale = self.args["scale"] if "scale" in self.args else "CELSIUS"
 
+        self.directive_to_handler = {}  # type: DirectiveHandlers
+        for attribute_name in dir(type(self)):
+            attribute = getattr(type(self), attribute_name, None)
+            for namespace, name in getattr(attribute, "_alexa_directives", []):
+                self.directive_to_handler.setdefault(namespace, {})[
+                    name
+                ] = getattr(self, attribute_name)
+
+        self.change_report_url = self.args.get("change_report_url")
+        self.change_report_token = self.args.get("change_report_token", "")
+        self.lwa_token = None  # type: Optional[LwaToken]
+        if self.args.get("lwa_client_id"):
+            self.lwa_token = LwaToken(
+                self.args["lwa_client_id"],
+                self.args["lwa_client_secret"],
+                self.args.get("lwa_token_file"),
+            )
+        self.directive_change_window = (
+            int(self.args.get("directive_change_milliseconds", 5000)) / 1000
+        )
+        # entity id -> until when its changes are caused by a directive
+        self.directed_entities = {}  # type: Dict[str, float]
+        self.change_report_window = (
+            int(self.args.get("change_report_milliseconds", 1000)) / 1000
+        )
+        # entity id -> (state before the burst, latest state)
+        self.pending_changes = {}  # type: Dict[str, Tuple[Dict, Dict]]
+        self.pending_changes_lock = threading.Lock()
+        self.change_report_timer = None  # type: Any
+        self.change_reports_sent = 0
+        self.change_reports_failed = 0
+        self.changes_coalesced = 0
+        self.changes_by_directives = 0
+
+        self.power_batch_window = (
+            int(self.args.get("power_batch_milliseconds", 0)) / 1000
+        )
+        # operation mode -> the batch collecting entities for it
+        self.power_batches = {}  # type: Dict[str, PowerBatch]
+        self.power_batches_lock = threading.Lock()
+        self.power_directives = 0
+        self.power_service_calls = 0
+
+        # mirror of the bridged entities, kept in sync with listen_state
+        self.entity_states = {
+            entity: self.get_state(entity, attribute="all")
+            for entity in self.entities
+        }  # type: Dict[str, Optional[Dict]]
+        # discovery endpoint blocks, rebuilt when the discovered data changes
+        self.discovery_endpoints = {}  # type: Dict[str, Dict]
+        self.discovery_handlers = [
+            self.listen_state(self.entity_changed, entity, attribute="all")
+            for entity in self.entities
+        ]
+
+        self.capture = None  # type: Optional[little_helpers.TrafficCapture]
+        if self.args.get("capture_file"):
+            self.capture = little_helpers.TrafficCapture(
+                self.args["capture_file"]
+            )
+
         self.handler = self.register_endpoint(self.api_call, "AlexaCustomAC")
 
     def terminate(self) -> None:
         """Unregister the endpoint on termination."""
         self.unregister_endpoint(self.handler)
+        for handler in self.discovery_handlers:
+            self.cancel_listen_state(handler)
+        if self.change_report_timer:
+            self.cancel_timer(self.change_report_timer)
+        if self.capture:
+            self.capture.close()
+        if self.change_report_url:
+            self.log(
+                "change reports sent {}, failed {}, coalesced {}, "
+                "by directives {}".format(
+                    self.change_reports_sent,
+                    self.change_reports_failed,
+                    self.changes_coalesced,
+                    self.changes_by_directives,
+                )
+            )
+        if self.power_batch_window:
+            self.log(
+                "power directives {}, service calls {}".format(
+                    self.power_directives, self.power_service_calls
+                )
+            )
 
-    def _handle_namespace_alexa(
-        self, request: Dict, init_namespace: str, init_name: str
+    @little_helpers.instrumented
+    def entity_changed(
+        self,
+        entity: str,
+        attribute: Optional[str],
+        old: Optional[Dict],
+        new: Optional[Dict],
+        kwargs: Optional[Dict],
+    ) -> None:
+        """Update the mirror, invalidate discovery and report the change."""
+        if new:
+            self.entity_states[entity] = new
+
+        old_attributes = old["attributes"] if old else {}
+        new_attributes = new["attributes"] if new else {}
+        for discovered in ("friendly_name", "operation_list"):
+            if old_attributes.get(discovered) != new_attributes.get(
+                discovered
+            ):
+                self.discovery_endpoints.pop(entity, None)
+                break
+
+        if self.change_report_url and old and new:
+            self._queue_change_report(entity, old, new)
+
+    def _mark_directed(self, entity_ids: List[str]) -> None:
+        """Use for attributing the coming changes to a directive."""
+        if not self.change_report_url:
+            return
+        until = time.monotonic() + self.directive_change_window
+        with self.pending_changes_lock:
+            for entity_id in entity_ids:
+                self.directed_entities[entity_id] = until
+
+    def _queue_change_report(self, entity: str, old: Dict, new: Dict) -> None:
+        """Coalesce the entity changes until the report window passes.
+
+        Changes caused by a directive were already answered
+        with the new state, the pending change of the entity is dropped.
+        """
+        with self.pending_changes_lock:
+            until = self.directed_entities.get(entity)
+            if until is not None:
+                if time.monotonic() < until:
+                    self.pending_changes.pop(entity, None)
+                    self.changes_by_directives += 1
+                    return
+                del self.directed_entities[entity]
+            if entity in self.pending_changes:
+                self.changes_coalesced += 1
+                old = self.pending_changes[entity][0]
+            self.pending_changes[entity] = (old, new)
+            if self.change_report_timer is None:
+                self.change_report_timer = self.run_in(
+                    self._send_change_reports, self.change_report_window
+                )
+
+    @little_helpers.instrumented
+    def _send_change_reports(self, kwargs: Optional[Dict]) -> None:
+        """Post a ChangeReport event for each of the changed endpoints."""
+        with self.pending_changes_lock:
+            pending_changes = self.pending_changes
+            self.pending_changes = {}
+            self.change_report_timer = None
+
+        try:
+            token = (
+                self.lwa_token.get()
+                if self.lwa_token
+                else self.change_report_token
+            )
+        except Exception as ex:
+            self.change_reports_failed += len(pending_changes)
+            self.log(
+                "change reports token unavailable, {}".format(ex),
+                level="WARNING",
+            )
+            return
+
+        for entity, (old, new) in pending_changes.items():
+            if not (
+                alexa_response_success.has_reportable_state(old)
+                and alexa_response_success.has_reportable_state(new)
+            ):
+                continue
+            try:
+                event_object = alexa_response_success.ChangeReportEvent(
+                    old,
+                    new,
+                    self.scale,
+                    token,
+                    alexa_response_success.get_change_cause(new),
+                )
+                if not event_object.changed_values:
+                    continue
+                response = requests.post(
+                    self.change_report_url,
+                    data=event_object.create_json(),
+                    headers={
+                        "Authorization": "Bearer {}".format(token),
+                        "Content-Type": "application/json",
+                    },
+                    timeout=10,
+                )
+                response.raise_for_status()
+                self.change_reports_sent += 1
+            except Exception as ex:
+                # a failed endpoint must not lose the rest of the batch
+                self.change_reports_failed += 1
+                self.log(
+                    "change report for {} failed, {}".format(entity, ex),
+                    level="WARNING",
+                )
+
+    def _set_operation_mode(self, entity_id: str, operation_mode: str) -> None:
+        """Set the operation mode, batched with concurrent directives.
+
+        The first directive of a batch waits for the window to pass
+        and sets the mode for all the collected entities at once,
+        the others wait for it to finish.
+
+        Raises:
+          Exception: When the service call of the batch failed.
+
+        """
+        self._mark_directed([entity_id])
+        if not self.power_batch_window:
+            self.power_directives += 1
+            self.power_service_calls += 1
+            self.call_service(
+                "climate/set_operation_mode",
+                entity_id=entity_id,
+                operation_mode=operation_mode,
+            )
+            return
+
+        with self.power_batches_lock:
+            self.power_directives += 1
+            batch = self.power_batches.get(operation_mode)
+            is_first = batch is None
+            if batch is None:
+                batch = PowerBatch()
+                self.power_batches[operation_mode] = batch
+                self.power_service_calls += 1
+            batch.entity_ids.append(entity_id)
+
+        if not is_first:
+            batch.done.wait()
+            if batch.error:
+                raise Exception("batched service call failed.") from (
+                    batch.error
+                )
+            return
+
+        time.sleep(self.power_batch_window)
+        with self.power_batches_lock:
+            del self.power_batches[operation_mode]
+        try:
+            self.call_service(
+                "climate/set_operation_mode",
+                entity_id=batch.entity_ids,
+                operation_mode=operation_mode,
+            )
+        except Exception as ex:
+            batch.error = ex
+            raise
+        finally:
+            batch.done.set()
+
+    def _get_entity_state(self, entity_id: str) -> Dict:
+        """Return a copy of the entity state, from the mirror if bridged.
+
+        The copy is safe for the handlers to modify.
+        """
+        entity_state = self.entity_states.get(entity_id)
+        if entity_state is None:
+            entity_state = self.get_state(entity_id, attribute="all")
+            if entity_id in self.entity_states:
+                self.entity_states[entity_id] = entity_state
+            if entity_state is None:
+                raise Exception("unknown entity {}".format(entity_id))
+        return dict(entity_state, attributes=dict(entity_state["attributes"]))
+
+    def _get_discovery_endpoint(self, entity: str) -> Dict:
+        """Return the cached discovery endpoint, building it if missing."""
+        endpoint = self.discovery_endpoints.get(entity)
+        if endpoint is None:
+            endpoint = alexa_response_success.create_discovery_endpoint(
+                self._get_entity_state(entity)
+            )
+            self.discovery_endpoints[entity] = endpoint
+        return endpoint
+
+    @directive("Alexa", "ReportState")
+    def _handle_report_state(
+        self, request_object: alexa_request.EndpointRequest
     ) -> Dict:
-        """Handle calls with the Alexa namespace.
+        """Handle ReportState calls with the Alexa namespace.
 
         Args:
-          request: Dictionary reprensting the original request.
-          init_namespace: The initial namespace of the request.
-          init_name: The initial name of the request.
+          request_object: The request object of the directive.
 
         Returns:
           Dict: a dictionary representation of the response.
-          int: the http response code.
 
         Raises:
           Exception: When failed to construct a response.
 
         """
         try:
-            if init_name == "ReportState":
-                endpoint_request_object = alexa_request.EndpointRequest(
-                    request, init_namespace, init_name
-                )
-                entity_id = little_helpers.endpointId_to_entityId(
-                    endpoint_request_object.endpointId
-                )
-                entity_state = self.get_state(entity_id, attribute="all")
-                success_response_object = alexa_response_success.StateReportResponse(  # noqa: E501
-                    endpoint_request_object, entity_state, self.scale
-                )
-                response = success_response_object.create_response()
-            else:
-                generic_request_object = alexa_request.GenericRequest(
-                    request, init_namespace, init_name
-                )
-                msg_literal = "name {} is unknown for namespace {}.".format(
-                    init_name, init_namespace
-                )
-                invalid_response_object = alexa_response_error.InvalidDirectiveErrorResponse(  # noqa: E501
-                    generic_request_object, msg_literal
-                )
-                response = invalid_response_object.create_response()
-            return response
+            entity_id = little_helpers.endpointId_to_entityId(
+                request_object.endpointId
+            )
+            entity_state = self._get_entity_state(entity_id)
+            success_response_object = alexa_response_success.StateReportResponse(  # noqa: E501
+                request_object, entity_state, self.scale
+            )
+            return success_response_object.create_response()
         except Exception as ex:
             raise Exception("ReportState directive failed.") from ex
 
-    def _handle_namespace_alexa_discovery(
-        self, request: Dict, init_namespace: str, init_name: str
+    @directive("Alexa.Discovery", "Discover")
+    def _handle_discover(
+        self, request_object: alexa_request.DiscoveryRequest
     ) -> Optional[Dict]:
-        """Handle calls with the Alexa.Discovery namespace.
+        """Handle Discover calls with the Alexa.Discovery namespace.
 
         Args:
-          request: Dictionary reprensting the original request.
-          init_namespace: The initial namespace of the request.
-          init_name: The initial name of the request.
+          request_object: The request object of the directive.
 
         Returns:
           Dict: a dictionary representation of the response.
-          int: the http response code.
 
         Raises:
           Exception: When failed to construct a response.
@@ -110,222 +550,258 @@ def _handle_namespace_alexa_discovery(
 
         """
         try:
-            if init_name == "Discover":
-                request_object = alexa_request.DiscoveryRequest(
-                    request, init_namespace, init_name
-                )
-                endpoints_list = [
-                    self.get_state(entity, attribute="all")
-                    for entity in self.entities
-                ]
-                response_object = alexa_response_success.DiscoveryResponse(
-                    request_object, endpoints_list
-                )
-                return response_object.create_response()
-            else:
-                return None
+            endpoints_list = [
+                self._get_discovery_endpoint(entity)
+                for entity in self.entities
+            ]
+            response_object = alexa_response_success.DiscoveryResponse(
+                request_object, [], endpoints_list
+            )
+            return response_object.create_response()
         except Exception as ex:
             raise Exception("Discovery directive failed.") from ex
 
-    def _handle_namespace_alexa_power_controller(
-        self, request: Dict, init_namespace: str, init_name: str
+    @directive("Alexa.Authorization", "AcceptGrant")
+    def _handle_accept_grant(
+        self, request_object: alexa_request.AcceptGrantRequest
+    ) -> Dict:
+        """Handle AcceptGrant calls with the Alexa.Authorization namespace.
+
+        Args:
+          request_object: The request object of the directive.
+
+        Returns:
+          Dict: a dictionary representation of the response.
+
+        """
+        if not self.lwa_token:
+            message = "lwa_client_id is not configured"
+        else:
+            try:
+                self.lwa_token.accept_grant(request_object.code)
+                response_object = alexa_response_success.AcceptGrantResponse(
+                    request_object
+                )
+                return response_object.create_response()
+            except Exception as ex:
+                self.log("AcceptGrant failed, {}".format(ex), level="WARNING")
+                message = "failed obtaining the token"
+        error_response_object = alexa_response_error.AcceptGrantErrorResponse(
+            request_object, message
+        )
+        return error_response_object.create_response()
+
+    @directive("Alexa.PowerController", "TurnOn", "TurnOff")
+    def _handle_power_control(
+        self, request_object: alexa_request.PowerControlRequest
     ) -> Dict:
         """Handle calls with the Alexa.PowerController namespace.
 
         Args:
-          request: Dictionary reprensting the original request.
-          init_namespace: The initial namespace of the request.
-          init_name: The initial name of the request.
+          request_object: The request object of the directive.
 
         Returns:
           Dict: a dictionary representation of the response.
-          int: the http response code.
 
         Raises:
           Exception: When failed to construct a response.
 
         """
         try:
-            if init_name == "TurnOn" or init_name == "TurnOff":
-                request_object = alexa_request.PowerControlRequest(
-                    request, init_namespace, init_name
-                )
-                entity_id = little_helpers.endpointId_to_entityId(
-                    request_object.endpointId
-                )
-                if entity_id in self.entities:
-                    self.call_service(
-                        "climate/set_operation_mode",
-                        entity_id=entity_id,
-                        operation_mode=(
-                            self.default_mode_for_on
-                            if init_name == "TurnOn"
-                            else "off"
-                        ),
-                    )
-                    entity_state = self.get_state(entity_id, attribute="all")
-                    success_response_object = alexa_response_success.PowerControlResponse(  # noqa: E501
-                        request_object, entity_state
-                    )
-                    response = success_response_object.create_response()
-                else:
-                    msg_literal = "unknown endpoint {}".format(
-                        self.request_object.endpointId
-                    )
-                    no_endpoint_response_object = alexa_response_error.NoSuchEndpointErrorResponse(  # noqa: E501
-                        request_object, msg_literal
-                    )
-                    response = no_endpoint_response_object.create_response()
-            else:
-                generic_request_object = alexa_request.GenericRequest(
-                    request, init_namespace, init_name
-                )
-                msg_literal = "name {} is unknown for namespace {}.".format(
-                    init_name, init_namespace
+            entity_id = little_helpers.endpointId_to_entityId(
+                request_object.endpointId
+            )
+            if entity_id in self.entities:
+                operation_mode = (
+                    self.default_mode_for_on
+                    if request_object.powerState
+                    else "off"
                 )
-                invalid_response_object = alexa_response_error.InvalidDirectiveErrorResponse(  # noqa: E501
-                    generic_request_object, msg_literal
+                self._set_operation_mode(entity_id, operation_mode)
+                entity_state = self._get_entity_state(entity_id)
+                entity_state["state"] = operation_mode
+                success_response_object = alexa_response_success.PowerControlResponse(  # noqa: E501
+                    request_object, entity_state
                 )
-                response = invalid_response_object.create_response()
-            return response
+                return success_response_object.create_response()
+
+            msg_literal = "unknown endpoint {}".format(
+                request_object.endpointId
+            )
+            no_endpoint_response_object = alexa_response_error.NoSuchEndpointErrorResponse(  # noqa: E501
+                request_object, msg_literal
+            )
+            return no_endpoint_response_object.create_response()
         except Exception as ex:
             raise Exception("PowerControl directive failed.") from ex
 
-    def _handle_namespace_alexa_thermostat_controller(
-        self, request: Dict, init_namespace: str, init_name: str
+    def _check_thermostat_target(
+        self, request_object: Any, entity_state: Dict, targetTemp: float
+    ) -> Optional[Dict]:
+        """Return an error response if the thermostat can't be set.
+
+        Args:
+          request_object: the thermostat request object.
+          entity_state: the climate entity state.
+          targetTemp: the requested temperature.
+
+        Returns:
+          Dict: a dictionary representation of the error response,
+          None if the target is valid.
+
+        """
+        if entity_state["state"].lower() == "off":
+            response_object = alexa_response_error.ThermostatIsOffErrorResponse(  # noqa: E501
+                request_object, "endpoint is off"
+            )
+            return response_object.create_response()
+
+        if (
+            targetTemp < entity_state["attributes"]["min_temp"]
+            or targetTemp > entity_state["attributes"]["max_temp"]
+        ):
+            min_temp = str(entity_state["attributes"]["min_temp"])
+            max_temp = str(entity_state["attributes"]["max_temp"])
+            out_of_range_response_object = alexa_response_error.TemperatureOutOfRangeErrorResponse(  # noqa: E501
+                request_object, "out of range", min_temp, max_temp, self.scale
+            )
+            return out_of_range_response_object.create_response()
+        return None
+
+    def _set_thermostat(
+        self,
+        request_object: Any,
+        entity_state: Dict,
+        service_name: str,
+        kwargs: Dict,
+    ) -> Dict:
+        """Call the climate service and return the success response."""
+        self._mark_directed([kwargs["entity_id"]])
+        self.call_service(service_name, **kwargs)
+        success_response_object = alexa_response_success.ThermostatControlResponse(  # noqa: E501
+            request_object, entity_state, self.scale
+        )
+        return success_response_object.create_response()
+
+    @directive("Alexa.ThermostatController", "SetTargetTemperature")
+    def _handle_set_target_temperature(
+        self, request_object: alexa_request.SetThermostatTemperatureRequest
     ) -> Dict:
-        """Handle calls with the Alexa.ThermostatController namespace.
+        """Handle SetTargetTemperature calls.
 
         Args:
-          request: Dictionary reprensting the original request.
-          init_namespace: The initial namespace of the request.
-          init_name: The initial name of the request.
+          request_object: The request object of the directive.
 
         Returns:
           Dict: a dictionary representation of the response.
-          int: the http response code.
 
         Raises:
           Exception: When failed to construct a response.
 
         """
         try:
-            if init_name == "SetTargetTemperature":
-                request_object = alexa_request.SetThermostatTemperatureRequest(
-                    request, init_namespace, init_name
-                )  # type: Any
-                entity_id = little_helpers.endpointId_to_entityId(
-                    request_object.endpointId
-                )
-                entity_state = self.get_state(entity_id, attribute="all")
-                if entity_state["state"].lower() == "off":
-                    response_object = alexa_response_error.ThermostatIsOffErrorResponse(  # noqa: E501
-                        request_object, "endpoint is off"
-                    )
-                    return response_object.create_response()
-
-                targetTemp = round(float(request_object.value), 1)
-                if (
-                    targetTemp < entity_state["attributes"]["min_temp"]
-                    or targetTemp > entity_state["attributes"]["max_temp"]
-                ):
-                    min_temp = str(entity_state["attributes"]["min_temp"])
-                    max_temp = str(entity_state["attributes"]["max_temp"])
-                    out_of_range_response_object = alexa_response_error.TemperatureOutOfRangeErrorResponse(  # noqa: E501
-                        request_object,
-                        "out of range",
-                        min_temp,
-                        max_temp,
-                        self.scale,
-                    )
-                    return out_of_range_response_object.create_response()
-
-                service_name = "climate/set_temperature"
-                kwargs = {
+            entity_id = little_helpers.endpointId_to_entityId(
+                request_object.endpointId
+            )
+            entity_state = self._get_entity_state(entity_id)
+            targetTemp = round(float(request_object.value), 1)
+            error_response = self._check_thermostat_target(
+                request_object, entity_state, targetTemp
+            )
+            if error_response:
+                return error_response
+
+            entity_state["attributes"]["temperature"] = targetTemp
+            return self._set_thermostat(
+                request_object,
+                entity_state,
+                "climate/set_temperature",
+                {
                     "entity_id": entity_state["entity_id"],
                     "temperature": targetTemp,
-                }
+                },
+            )
+        except Exception as ex:
+            raise Exception("ThermostatController directive failed.") from ex
 
-                entity_state["attributes"]["temperature"] = targetTemp
+    @directive("Alexa.ThermostatController", "AdjustTargetTemperature")
+    def _handle_adjust_target_temperature(
+        self, request_object: alexa_request.AdjustThermostatTemperatureRequest
+    ) -> Dict:
+        """Handle AdjustTargetTemperature calls.
 
-            elif init_name == "AdjustTargetTemperature":
-                request_object = alexa_request.AdjustThermostatTemperatureRequest(  # noqa: E501
-                    request, init_namespace, init_name
-                )
-                entity_id = little_helpers.endpointId_to_entityId(
-                    request_object.endpointId
-                )
-                entity_state = self.get_state(entity_id, attribute="all")
-                if entity_state["state"].lower() == "off":
-                    response_object = alexa_response_error.ThermostatIsOffErrorResponse(  # noqa: E501
-                        request_object, "endpoint is off"
-                    )
-                    return response_object.create_response()
+        Args:
+          request_object: The request object of the directive.
 
-                targetTemp = entity_state["attributes"]["temperature"] + (
-                    round(float(request_object.value), 1)
-                )
-                if (
-                    targetTemp < entity_state["attributes"]["min_temp"]
-                    or targetTemp > entity_state["attributes"]["max_temp"]
-                ):
-                    min_temp = str(entity_state["attributes"]["min_temp"])
-                    max_temp = str(entity_state["attributes"]["max_temp"])
-                    out_of_range_response_object = alexa_response_error.TemperatureOutOfRangeErrorResponse(  # noqa: E501
-                        request_object,
-                        "out of range",
-                        min_temp,
-                        max_temp,
-                        self.scale,
-                    )
-                    return out_of_range_response_object.create_response()
+        Returns:
+          Dict: a dictionary representation of the response.
 
-                service_name = "climate/set_temperature"
-                kwargs = {
+        Raises:
+          Exception: When failed to construct a response.
+
+        """
+        try:
+            entity_id = little_helpers.endpointId_to_entityId(
+                request_object.endpointId
+            )
+            entity_state = self._get_entity_state(entity_id)
+            targetTemp = entity_state["attributes"]["temperature"] + (
+                round(float(request_object.value), 1)
+            )
+            error_response = self._check_thermostat_target(
+                request_object, entity_state, targetTemp
+            )
+            if error_response:
+                return error_response
+
+            entity_state["attributes"]["temperature"] = targetTemp
+            return self._set_thermostat(
+                request_object,
+                entity_state,
+                "climate/set_temperature",
+                {
                     "entity_id": entity_state["entity_id"],
                     "temperature": targetTemp,
-                }
-
-                entity_state["attributes"]["temperature"] = targetTemp
+                },
+            )
+        except Exception as ex:
+            raise Exception("ThermostatController directive failed.") from ex
 
-            elif init_name == "SetThermostatMode":
-                mode_request_object = alexa_request.SetThermostatModeRequest(
-                    request, init_namespace, init_name
-                )
-                entity_id = little_helpers.endpointId_to_entityId(
-                    mode_request_object.endpointId
-                )
-                entity_state = self.get_state(entity_id, attribute="all")
+    @directive("Alexa.ThermostatController", "SetThermostatMode")
+    def _handle_set_thermostat_mode(
+        self, request_object: alexa_request.SetThermostatModeRequest
+    ) -> Dict:
+        """Handle SetThermostatMode calls.
 
-                service_name = "climate/set_operation_mode"
-                kwargs = {
-                    "entity_id": entity_state["entity_id"],
-                    "operation_mode": mode_request_object.value.lower(),
-                }
+        Args:
+          request_object: The request object of the directive.
 
-                entity_state["state"] = mode_request_object.value.lower()
+        Returns:
+          Dict: a dictionary representation of the response.
 
-            else:
-                generic_request_object = alexa_request.GenericRequest(
-                    request, init_namespace, init_name
-                )
-                msg_literal = "name {} is unknown for namespace {}.".format(
-                    init_name, init_namespace
-                )
-                invalid_response_object = alexa_response_error.InvalidDirectiveErrorResponse(  # noqa: E501
-                    generic_request_object, msg_literal
-                )
-                return invalid_response_object.create_response()
+        Raises:
+          Exception: When failed to construct a response.
 
-            self.call_service(service_name, **kwargs)
-            success_response_object = alexa_response_success.ThermostatControlResponse(  # noqa: E501
-                request_object, entity_state, self.scale
+        """
+        try:
+            entity_id = little_helpers.endpointId_to_entityId(
+                request_object.endpointId
+            )
+            entity_state = self._get_entity_state(entity_id)
+            entity_state["state"] = request_object.value.lower()
+            return self._set_thermostat(
+                request_object,
+                entity_state,
+                "climate/set_operation_mode",
+                {
+                    "entity_id": entity_state["entity_id"],
+                    "operation_mode": request_object.value.lower(),
+                },
             )
-            return success_response_object.create_response()
-
         except Exception as ex:
             raise Exception("ThermostatController directive failed.") from ex
 
+    @little_helpers.instrumented
     def api_call(self, request: Dict) -> Tuple[Optional[Dict], int]:
         """Handle all api calls.
 
@@ -337,38 +813,58 @@ def api_call(self, request: Dict) -> Tuple[Optional[Dict], int]:
           Exception: When failed to construct a response.
 
         """
-        init_namespace = request["directive"]["header"]["namespace"]
-        init_name = request["directive"]["header"]["name"]
-        directive_to_handler = {
-            "Alexa": self._handle_namespace_alexa,
-            "Alexa.Discovery": self._handle_namespace_alexa_discovery,
-            "Alexa.PowerController": (
-                self._handle_namespace_alexa_power_controller
-            ),
-            "Alexa.ThermostatController": (
-                self._handle_namespace_alexa_thermostat_controller
-            ),
-        }
+        if self.capture:
+            self.capture.write(
+                "directive", app=self.name, request=redact_tokens(request)
+            )
+        request_object = alexa_request.create_request(request)
+        started = time.monotonic()
+        response = self._dispatch(request_object)
+        little_helpers.metrics.inc(
+            "alexa_directives_total",
+            namespace=request_object.namespace,
+            name=request_object.name,
+        )
+        little_helpers.metrics.observe(
+            "alexa_directive_seconds",
+            time.monotonic() - started,
+            namespace=request_object.namespace,
+            name=request_object.name,
+        )
+        return response
+
+    def _dispatch(
+        self, request_object: alexa_request.GenericRequest
+    ) -> Tuple[Optional[Dict], int]:
+        """Return the response of the directive handler, or the error one."""
+        init_namespace = request_object.namespace
+        init_name = request_object.name
         try:
-            if init_namespace in directive_to_handler:
-                response_dict = directive_to_handler[init_namespace](
-                    request, init_namespace, init_name
+            name_to_handler = self.directive_to_handler.get(init_namespace, {})
+            handler = name_to_handler.get(init_name)
+            if handler:
+                return handler(request_object), 200
+
+            if init_namespace == "Alexa.Discovery":
+                # no error responses for discovery requests
+                return None, 200
+            if name_to_handler:
+                msg_literal = "name {} is unknown for namespace {}.".format(
+                    init_name, init_namespace
                 )
             else:
-                request_object = alexa_request.GenericRequest(
-                    request, init_namespace, init_name
-                )
                 msg_literal = "namespace {} is unknown.".format(init_namespace)
-                response_object = alexa_response_error.InvalidDirectiveErrorResponse(  # noqa: E501
-                    request_object, msg_literal
-                )
-                response_dict = response_object.create_response()
-            return response_dict, 200
+            response_object = alexa_response_error.InvalidDirectiveErrorResponse(  # noqa: E501
+                request_object, msg_literal
+            )
+            return response_object.create_response(), 200
         except Exception as ex:
-            request_object = alexa_request.GenericRequest(
-                request, init_namespace, init_name
+            # the generic request reads no directive fields,
+            # so building the error response can not fail on a bad directive
+            generic_request_object = alexa_request.GenericRequest(
+                request_object.rawRequest, init_namespace, init_name
             )
             error_response_object = alexa_response_error.InternalErrorResponse(
-                request_object, str(ex)
+                generic_request_object, str(ex)
             )
             return error_response_object.create_response(), 200
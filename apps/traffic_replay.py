@@ -0,0 +1,104 @@
+"""Automation classes for use with AppDaemon, traffic capture.
+
+Capture format, one json object per line:
+  {"t": 1571234567.5, "kind": "mqtt", "topic": "...", "payload": "..."}
+  {"t": ..., "kind": "state", "entity_id": "...", "state": "...",
+   "attributes": {...}}
+  {"t": ..., "kind": "directive", "app": "...", "request": {...}}
+  {"t": ..., "kind": "service", "domain": "...", "service": "...",
+   "service_data": {...}}
+
+The mqtt, state and directive records are the inputs fed to the apps,
+the service records are the calls the apps made in response to them.
+Directives are captured by AlexaCustomAC with its capture_file argument.
+
+Note:
+  The captures are replayed offline by bench/replay.py,
+  into the apps running in the benchmarks harness,
+  never into the live AppDaemon driving the real devices.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+from typing import Dict, Optional
+
+import appdaemon.plugins.hass.hassapi as hass
+import little_helpers
+
+
+class TrafficRecorder(hass.Hass):
+    """Automation for capturing the apps traffic into a jsonl file.
+
+    Records every mqtt message, the state changes of the listed entities
+    and every service call made in Home Assistant.
+
+    Example:
+      .. code-block:: yaml
+
+          evening_traffic_recorder:
+            module: traffic_replay
+            class: TrafficRecorder
+            capture_file: "/conf/captures/evening.jsonl"
+            entities:
+              - sensor.nursery_broadlink_a1_temperature
+              - binary_sensor.nursery_door
+
+    """
+
+    def initialize(self) -> None:
+        """Initialize the automation, and register the listenrs."""
+        self.capture = little_helpers.TrafficCapture(self.args["capture_file"])
+        self.mqtt_handler = self.listen_event(
+            self.mqtt_message, "MQTT_MESSAGE", namespace="mqtt"
+        )
+        self.service_handler = self.listen_event(
+            self.service_called, "call_service"
+        )
+        self.state_handlers = [
+            self.listen_state(self.state_changed, entity, attribute="all")
+            for entity in self.args.get("entities", [])
+        ]
+
+    def terminate(self) -> None:
+        """Cancel listeners and close the capture on termination."""
+        self.cancel_listen_event(self.mqtt_handler)
+        self.cancel_listen_event(self.service_handler)
+        for handler in self.state_handlers:
+            self.cancel_listen_state(handler)
+        self.capture.close()
+
+    def mqtt_message(
+        self, event_name: str, data: Dict, kwargs: Optional[Dict]
+    ) -> None:
+        """Use for capturing mqtt messages."""
+        self.capture.write(
+            "mqtt", topic=data["topic"], payload=data["payload"]
+        )
+
+    def service_called(
+        self, event_name: str, data: Dict, kwargs: Optional[Dict]
+    ) -> None:
+        """Use for capturing service calls."""
+        self.capture.write(
+            "service",
+            domain=data["domain"],
+            service=data["service"],
+            service_data=data.get("service_data", {}),
+        )
+
+    def state_changed(
+        self,
+        entity: str,
+        attribute: Optional[str],
+        old: Optional[Dict],
+        new: Optional[Dict],
+        kwargs: Optional[Dict],
+    ) -> None:
+        """Use for capturing state changes."""
+        if new:
+            self.capture.write(
+                "state",
+                entity_id=entity,
+                state=new["state"],
+                attributes=new["attributes"],
+            )
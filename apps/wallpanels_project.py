@@ -4,9 +4,39 @@
 
 """
 import json
-from typing import Dict, Optional
+import threading
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
 
 import appdaemon.plugins.hass.hassapi as hass
+import little_helpers
+
+# battery value, charging, acPlugged and usbPlugged
+BatteryReading = Tuple[Any, bool, bool, bool]
+
+# the attributes written from the reading, the others are kept
+reading_attributes = ("charging", "acPlugged", "usbPlugged")
+
+
+def is_reading_state(entity_state: Dict, reading: BatteryReading) -> bool:
+    """Use for checking if the entity state is the written reading."""
+    value, *plugged = reading
+    attributes = entity_state.get("attributes", {})
+    return entity_state.get("state") == str(value) and all(
+        attributes.get(name) == flag
+        for name, flag in zip(reading_attributes, plugged)
+    )
+
+
+def other_attributes(entity_state: Optional[Dict]) -> Dict[str, Any]:
+    """Use for getting the entity attributes not written from readings."""
+    if not entity_state:
+        return {}
+    return {
+        name: value
+        for name, value in entity_state.get("attributes", {}).items()
+        if name not in reading_attributes
+    }
 
 
 class WallPanelsExtractAttributesFromMessage(hass.Hass):
@@ -22,19 +52,65 @@ class WallPanelsExtractAttributesFromMessage(hass.Hass):
             class: WallPanelsExtractAttributesFromMessage
             sensor_entity: "sensor.wallpanel_nursery_battery"
             sensor_topic: "wallpanel/nursery_dash/sensor/battery"
+            flush_interval_seconds: 60
+
+    Note:
+      Readings identical to the last published one are not written,
+      unless the entity state in HA was replaced since, like after an
+      HA restart or when the mqtt sensor rewrites the entity.
+      flush_interval_seconds: when set, changes are held and the latest
+        reading is written once per interval (default 0, write
+        immediately).
 
     """
 
     def initialize(self) -> None:
         """Initialize the automation, and register the listenr."""
         self.entity = self.args["sensor_entity"]
+        self.flush_interval = int(self.args.get("flush_interval_seconds", 0))
+
+        # the other attributes of the entity, kept when writing
+        self.attributes = other_attributes(
+            self.get_state(self.entity, attribute="all")
+        )
+        self.last_payload = None  # type: Optional[str]
+        self.last_published = None  # type: Optional[BatteryReading]
+        self.pending = None  # type: Optional[BatteryReading]
+        self.published = 0
+        self.suppressed = 0
+        self.publish_lock = threading.Lock()
+
         self.battery_handler = self.listen_event(
             self.mqtt_battery_message,
             "MQTT_MESSAGE",
             topic=self.args["sensor_topic"],
             namespace="mqtt",
         )
+        self.state_handler = self.listen_state(
+            self.entity_changed, self.entity, attribute="all"
+        )
 
+        self.flush_timer = None
+        if self.flush_interval:
+            self.flush_timer = self.run_every(
+                self.flush,
+                self.datetime() + timedelta(seconds=self.flush_interval),
+                self.flush_interval,
+            )
+
+    def terminate(self) -> None:
+        """Cancel listener on termination."""
+        self.cancel_listen_event(self.battery_handler)
+        self.cancel_listen_state(self.state_handler)
+        if self.flush_timer:
+            self.cancel_timer(self.flush_timer)
+        self.log(
+            "battery states written {}, suppressed {}".format(
+                self.published, self.suppressed
+            )
+        )
+
+    @little_helpers.instrumented
     def mqtt_battery_message(
         self, event_name: str, data: Dict, kwargs: Optional[Dict]
     ) -> None:
@@ -43,17 +119,86 @@ def mqtt_battery_message(
         Origin payload example:
         {"value":47,"unit":"%","charging":false,"acPlugged":false,"usbPlugged":false}
         """
+        with self.publish_lock:
+            # a repeated payload can't change the outcome, skip parsing it
+            if data["payload"] == self.last_payload:
+                self.suppressed += 1
+                return
+            self.last_payload = data["payload"]
+
         payload_data = json.loads(data["payload"])
+        reading = (
+            payload_data["value"],
+            payload_data["charging"],
+            payload_data["acPlugged"],
+            payload_data["usbPlugged"],
+        )
 
-        entity_state = payload_data["value"]
-        entity_attributes = self.get_state(self.entity, attribute="all")[
-            "attributes"
-        ]
+        with self.publish_lock:
+            if reading == self.last_published:
+                self.suppressed += 1
+                # the held reading was reverted, no need to write it
+                if self.pending is not None:
+                    self.suppressed += 1
+                    self.pending = None
+                return
+            if self.flush_interval:
+                if self.pending is not None:
+                    self.suppressed += 1
+                self.pending = reading
+                return
+        self._publish(reading)
 
-        entity_attributes["charging"] = payload_data["charging"]
-        entity_attributes["acPlugged"] = payload_data["acPlugged"]
-        entity_attributes["usbPlugged"] = payload_data["usbPlugged"]
+    @little_helpers.instrumented
+    def entity_changed(
+        self,
+        entity: str,
+        attribute: Optional[str],
+        old: Optional[Dict],
+        new: Optional[Dict],
+        kwargs: Optional[Dict],
+    ) -> None:
+        """Use for tracking the entity state as kept by HA.
 
-        self.set_state(
-            self.entity, state=entity_state, attributes=entity_attributes
-        )
+        Refreshes the other attributes, and forgets the last published
+        reading when HA's state is no longer it, so the next reading is
+        written even if it is identical.
+        """
+        with self.publish_lock:
+            self.attributes = other_attributes(new)
+            if self.last_published is None:
+                return
+            if not new or not is_reading_state(new, self.last_published):
+                self.last_published = None
+                self.last_payload = None
+
+    @little_helpers.instrumented
+    def flush(self, kwargs: Optional[Dict]) -> None:
+        """Use for writing the held reading."""
+        with self.publish_lock:
+            reading = self.pending
+            self.pending = None
+        if reading is not None:
+            self._publish(reading)
+
+    def _publish(self, reading: BatteryReading) -> None:
+        """Use for writing the reading as the entity state and attributes."""
+        value, charging, ac_plugged, usb_plugged = reading
+        # recorded before writing, HA reports the write back to entity_changed
+        with self.publish_lock:
+            self.last_published = reading
+            attributes = dict(
+                self.attributes,
+                charging=charging,
+                acPlugged=ac_plugged,
+                usbPlugged=usb_plugged,
+            )
+        try:
+            self.set_state(self.entity, state=value, attributes=attributes)
+        except Exception:
+            with self.publish_lock:
+                self.last_published = None
+                self.last_payload = None
+            raise
+        with self.publish_lock:
+            self.published += 1
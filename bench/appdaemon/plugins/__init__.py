@@ -0,0 +1 @@
+"""Offline stand-in of the AppDaemon package, for the benchmarks only."""
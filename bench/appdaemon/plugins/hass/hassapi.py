@@ -0,0 +1,156 @@
+"""Offline stand-in of the AppDaemon hass.Hass api, for the benchmarks only.
+
+Implements the part of the api used by the apps, delegating to the
+harness.FakeHomeAssistant the app was created with, which records the
+calls and dispatches the events, state changes and timers.
+
+Like AppDaemon 4, the methods return awaitables when called from
+the event loop, so the async apps can await them.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import asyncio
+import datetime as dt
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+
+def _in_event_loop() -> bool:
+    """Use for checking if called from a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _sync_wrapper(method: Callable) -> Callable:
+    """Use for returning an awaitable result when called from the loop."""
+
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = method(*args, **kwargs)
+        if not _in_event_loop():
+            return result
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return future
+
+    return wrapper
+
+
+class Hass:
+    """Object standing in for appdaemon.plugins.hass.hassapi.Hass."""
+
+    def __init__(self, hub: Any, name: str, args: Dict) -> None:
+        """Initialize the object."""
+        self.hub = hub
+        self.name = name
+        self.args = args
+
+    def log(self, msg: str, level: str = "INFO") -> None:
+        """Log the message through the harness."""
+        self.hub.log(self.name, msg, level)
+
+    def datetime(self) -> dt.datetime:
+        """Return the current local time."""
+        return dt.datetime.now()
+
+    def get_app(self, name: str) -> Any:
+        """Return the app created with the name."""
+        return self.hub.apps[name]
+
+    @_sync_wrapper
+    def listen_event(
+        self, callback: Callable, event: str, **kwargs: Any
+    ) -> Any:
+        """Register the callback for the event, kwargs filter the data."""
+        return self.hub.listen_event(callback, event, kwargs)
+
+    @_sync_wrapper
+    def cancel_listen_event(self, handle: Any) -> None:
+        """Cancel the event listener."""
+        self.hub.cancel_listener(handle)
+
+    @_sync_wrapper
+    def listen_state(
+        self,
+        callback: Callable,
+        entity: Optional[str] = None,
+        attribute: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Register the callback for the entity state changes."""
+        return self.hub.listen_state(callback, entity, attribute, kwargs)
+
+    @_sync_wrapper
+    def cancel_listen_state(self, handle: Any) -> None:
+        """Cancel the state listener."""
+        self.hub.cancel_listener(handle)
+
+    @_sync_wrapper
+    def get_state(
+        self, entity: Optional[str] = None, attribute: Optional[str] = None
+    ) -> Any:
+        """Return the entity state, its attribute or all of it."""
+        return self.hub.get_state(entity, attribute)
+
+    @_sync_wrapper
+    def set_state(self, entity: str, **kwargs: Any) -> Dict:
+        """Set the entity state and attributes."""
+        return self.hub.set_state(
+            entity, kwargs.get("state"), kwargs.get("attributes")
+        )
+
+    def call_service(self, service: str, **kwargs: Any) -> Any:
+        """Record the service call, taking the configured service latency.
+
+        From the event loop the latency is awaited instead of slept.
+        """
+        if _in_event_loop():
+            return self._async_call_service(service, kwargs)
+        if self.hub.service_latency:
+            time.sleep(self.hub.service_latency)
+        self.hub.record_service_call(self.name, service, kwargs)
+        return None
+
+    async def _async_call_service(self, service: str, kwargs: Dict) -> None:
+        """Record the service call from the event loop."""
+        if self.hub.service_latency:
+            await asyncio.sleep(self.hub.service_latency)
+        self.hub.record_service_call(self.name, service, kwargs)
+
+    @_sync_wrapper
+    def register_endpoint(self, callback: Callable, name: str) -> str:
+        """Register the api endpoint."""
+        self.hub.endpoints[name] = callback
+        return name
+
+    @_sync_wrapper
+    def unregister_endpoint(self, handle: str) -> None:
+        """Unregister the api endpoint."""
+        self.hub.endpoints.pop(handle, None)
+
+    @_sync_wrapper
+    def run_in(self, callback: Callable, delay: float, **kwargs: Any) -> Any:
+        """Schedule the callback once after delay seconds."""
+        return self.hub.schedule(callback, delay, None, kwargs)
+
+    @_sync_wrapper
+    def run_every(
+        self,
+        callback: Callable,
+        start: dt.datetime,
+        interval: float,
+        **kwargs: Any,
+    ) -> Any:
+        """Schedule the callback every interval seconds from start."""
+        delay = max((start - dt.datetime.now()).total_seconds(), 0)
+        return self.hub.schedule(callback, delay, interval, kwargs)
+
+    @_sync_wrapper
+    def cancel_timer(self, handle: Any) -> None:
+        """Cancel the timer."""
+        self.hub.cancel_timer(handle)
@@ -0,0 +1,136 @@
+"""Benchmark of the AlexaCustomAC api calls.
+
+Times the end-to-end api_call of every directive type, from the raw
+request to the response dictionary, including the request parsing, the
+dispatch, the service call and the response construction.
+The power directives are not batched, the batching window would only
+add its sleep.
+
+Every directive is timed answered from the entity mirror, and with the
+mirror emptied, reading the entity with get_state on every call as
+before the mirror, reporting the best mean and the p50 and p99 of the
+single calls.
+
+Usage:
+  python bench/bench_alexa_api_call.py --number 2000
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+from typing import Dict, List, Tuple
+
+import harness  # sets the stand-in and apps import paths first
+import little_helpers
+import load
+
+ENTITY = "climate.living_room_ac"
+
+
+def create_requests() -> List[Tuple[str, Dict]]:
+    """Use for creating a request per directive type."""
+    endpoint_id = little_helpers.entityId_to_endpointId(ENTITY)
+    requests = [
+        (
+            "{}.{}".format(namespace, name),
+            load.create_directive(namespace, name, endpoint_id, payload),
+        )
+        for namespace, name, payload in load.alexa_directives
+    ]
+    requests.append(
+        (
+            "Alexa.Discovery.Discover",
+            load.create_directive(
+                "Alexa.Discovery",
+                "Discover",
+                "",
+                {"scope": {"type": "BearerToken", "token": "token"}},
+            ),
+        )
+    )
+    requests.append(
+        (
+            "unknown endpoint",
+            load.create_directive(
+                "Alexa.PowerController", "TurnOn", "climate#unknown", {}
+            ),
+        )
+    )
+    requests.append(
+        (
+            "unknown directive",
+            load.create_directive("Alexa.Unknown", "Unknown", endpoint_id, {}),
+        )
+    )
+    return requests
+
+
+def main() -> None:
+    """Use for running the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--number", type=int, default=2000, help="api calls per round"
+    )
+    args = parser.parse_args()
+
+    hub = harness.FakeHomeAssistant(threads=0)
+    hub.add_entity(ENTITY, "cool", **load.climate_attributes())
+    hub.create_app(
+        "alexa_custom_ac",
+        {
+            "module": "smarthome_custom_ac",
+            "class": "AlexaCustomAC",
+            "entities": [ENTITY],
+            "default_mode_for_on": "cool",
+            "scale": "CELSIUS",
+        },
+    )
+
+    app = hub.apps["alexa_custom_ac"]
+    mirror = app.entity_states
+    # an empty mirror reads every entity with get_state, as before it
+    no_mirror = {}  # type: Dict[str, Dict]
+
+    rows = []
+    for directive, request in create_requests():
+
+        def api_call(request: Dict = request) -> Dict:
+            response, code = hub.call_endpoint("AlexaCustomAC", request)
+            return response
+
+        response = api_call()
+        event = response["event"] if response else {}
+        row = [directive, event.get("header", {}).get("name", "-")]
+        for entity_states in (mirror, no_mirror):
+            app.entity_states = entity_states
+            row.append(round(harness.measure(api_call, args.number), 2))
+            row.extend(
+                round(microseconds, 2)
+                for microseconds in harness.measure_percentiles(
+                    api_call, args.number
+                )
+            )
+        app.entity_states = mirror
+        row.append(round(harness.peak_allocation(api_call, 100), 1))
+        rows.append(row)
+    hub.close()
+    if hub.errors:
+        raise Exception("api call failed, {!r}.".format(hub.errors[0]))
+    harness.print_table(
+        (
+            "directive",
+            "response",
+            "us mirror",
+            "p50",
+            "p99",
+            "us get_state",
+            "p50",
+            "p99",
+            "peak KB per 100",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
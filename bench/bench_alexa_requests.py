@@ -0,0 +1,137 @@
+"""Benchmark of the Alexa request objects construction.
+
+Times alexa_request.create_request for every directive type, alone and
+followed by reading every directive field of the request object once,
+against an eager reference copying every field on construction, as the
+request objects did before reading the fields lazily.
+
+Usage:
+  python bench/bench_alexa_requests.py --number 100000
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+from typing import Any, Dict, List, Tuple
+
+import harness  # isort:skip, sets the apps import path first
+import alexa_request
+import little_helpers
+import load
+
+
+def directive_fields(request_class: type) -> List[Tuple[str, Any]]:
+    """Use for listing the directive fields of a request class."""
+    fields = {}  # type: Dict[str, Any]
+    for klass in reversed(request_class.__mro__):
+        for name, field in vars(klass).items():
+            if isinstance(field, alexa_request._DirectiveField):
+                fields[name] = field
+    return sorted(fields.items())
+
+
+# the directive fields copied by the eager reference, per request class
+eager_fields = {
+    request_class: directive_fields(request_class)
+    for request_class in set(alexa_request.request_classes.values())
+}
+
+
+class EagerRequest:
+    """Object copying every directive field on construction."""
+
+    def __init__(self, request: Dict) -> None:
+        """Initialize the object."""
+        directive = request["directive"]
+        self.rawRequest = request
+        self.namespace = directive["header"]["namespace"]
+        self.name = directive["header"]["name"]
+        request_class = alexa_request.request_classes[
+            (self.namespace, self.name)
+        ]
+        for name, field in eager_fields[request_class]:
+            value = directive[field.section]
+            for key in field.path:
+                value = value[key]
+            setattr(self, name, value)
+
+
+def create_requests() -> List[Tuple[str, Dict]]:
+    """Use for creating a request per directive type."""
+    endpoint_id = little_helpers.entityId_to_endpointId(
+        "climate.living_room_ac"
+    )
+    requests = [
+        (
+            "{}.{}".format(namespace, name),
+            load.create_directive(namespace, name, endpoint_id, payload),
+        )
+        for namespace, name, payload in load.alexa_directives
+    ]
+    requests.append(
+        (
+            "Alexa.Discovery.Discover",
+            load.create_directive(
+                "Alexa.Discovery",
+                "Discover",
+                "",
+                {"scope": {"type": "BearerToken", "token": "token"}},
+            ),
+        )
+    )
+    return requests
+
+
+def main() -> None:
+    """Use for running the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--number", type=int, default=100000, help="requests per round"
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for directive, request in create_requests():
+        request_object = alexa_request.create_request(request)
+        names = [name for name, _ in directive_fields(type(request_object))]
+        eager = EagerRequest(request)
+        for name in names:
+            if getattr(request_object, name) != getattr(eager, name):
+                raise Exception("{} {} differs.".format(directive, name))
+
+        def construct(request: Dict = request) -> Any:
+            return alexa_request.create_request(request)
+
+        def construct_and_read(request: Dict = request) -> List:
+            request_object = alexa_request.create_request(request)
+            return [getattr(request_object, name) for name in names]
+
+        def construct_eager(request: Dict = request) -> List:
+            request_object = EagerRequest(request)
+            return [getattr(request_object, name) for name in names]
+
+        rows.append(
+            (
+                directive,
+                type(request_object).__name__,
+                len(names),
+                round(harness.measure(construct, args.number), 3),
+                round(harness.measure(construct_and_read, args.number), 3),
+                round(harness.measure(construct_eager, args.number), 3),
+            )
+        )
+    harness.print_table(
+        (
+            "directive",
+            "request class",
+            "fields",
+            "us create",
+            "us create and read",
+            "us eager copy",
+        ),
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
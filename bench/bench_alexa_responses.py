@@ -0,0 +1,227 @@
+"""Benchmark of the Alexa responses construction and serialization.
+
+Builds 10k responses of every response type, then json encodes them as
+AppDaemon does with the api results, and reports the time and the peak
+allocations of each step.
+
+Then builds 10k ChangeReport events of a single and of all the properties
+changing, serialized with json.dumps of create_event, as posted before,
+and with create_json, rendering the json templates as posted now.
+
+Usage:
+  python bench/bench_alexa_responses.py --number 10000
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+import harness  # isort:skip, sets the apps import path first
+import alexa_request
+import alexa_response_error
+import alexa_response_success
+import little_helpers
+import load
+
+ENTITY = "climate.living_room_ac"
+
+
+def create_entity() -> Dict:
+    """Use for creating the state of the climate entity."""
+    return {
+        "entity_id": ENTITY,
+        "state": "cool",
+        "attributes": load.climate_attributes(),
+        "last_updated": little_helpers.get_iso_datetime_utc_tz_str(
+            little_helpers.get_utc_now()
+        ),
+    }
+
+
+def create_request(namespace: str, name: str, payload: Dict) -> Any:
+    """Use for creating the request object of a directive."""
+    return alexa_request.create_request(
+        load.create_directive(
+            namespace,
+            name,
+            little_helpers.entityId_to_endpointId(ENTITY),
+            payload,
+        )
+    )
+
+
+def create_responses() -> List[Tuple[str, Callable[[], Any]]]:
+    """Use for creating a response factory per response type."""
+    entity = create_entity()
+    report = create_request("Alexa", "ReportState", {})
+    power = create_request("Alexa.PowerController", "TurnOn", {})
+    thermostat = create_request(*load.alexa_directives[3])
+    discovery = alexa_request.create_request(
+        load.create_directive(
+            "Alexa.Discovery",
+            "Discover",
+            "",
+            {"scope": {"type": "BearerToken", "token": "token"}},
+        )
+    )
+    endpoints = [alexa_response_success.create_discovery_endpoint(entity)]
+    return [
+        (
+            "StateReportResponse",
+            lambda: alexa_response_success.StateReportResponse(
+                report, entity, "CELSIUS"
+            ),
+        ),
+        (
+            "PowerControlResponse",
+            lambda: alexa_response_success.PowerControlResponse(power, entity),
+        ),
+        (
+            "ThermostatControlResponse",
+            lambda: alexa_response_success.ThermostatControlResponse(
+                thermostat, entity, "CELSIUS"
+            ),
+        ),
+        (
+            "DiscoveryResponse",
+            lambda: alexa_response_success.DiscoveryResponse(
+                discovery, [], endpoints
+            ),
+        ),
+        (
+            "TemperatureOutOfRangeErrorResponse",
+            lambda: alexa_response_error.TemperatureOutOfRangeErrorResponse(
+                thermostat, "out of range", 16, 30, "CELSIUS"
+            ),
+        ),
+        (
+            "InternalErrorResponse",
+            lambda: alexa_response_error.InternalErrorResponse(
+                report, "failed"
+            ),
+        ),
+    ]
+
+
+def create_change_reports() -> List[Tuple[str, Callable[[], Any]]]:
+    """Use for creating a change report factory per changed properties."""
+    old = create_entity()
+    mode_changed = dict(old, state="heat")
+    all_changed = dict(
+        old,
+        state="off",
+        attributes=dict(
+            old["attributes"], temperature=20, current_temperature=22
+        ),
+    )
+    return [
+        (
+            "mode changed",
+            lambda: alexa_response_success.ChangeReportEvent(
+                old, mode_changed, "CELSIUS", "token"
+            ),
+        ),
+        (
+            "all changed",
+            lambda: alexa_response_success.ChangeReportEvent(
+                old, all_changed, "CELSIUS", "token"
+            ),
+        ),
+    ]
+
+
+def run(func: Callable[[], List]) -> Tuple[List, float, float]:
+    """Use for running a step, return its result, milliseconds and KB.
+
+    The time is the best of three rounds, the peak allocations are
+    measured on a separate round.
+    """
+    milliseconds = []
+    for _ in range(3):
+        started = time.perf_counter()
+        result = func()
+        milliseconds.append((time.perf_counter() - started) * 1000)
+    del result
+    tracemalloc.start()
+    try:
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+    return result, min(milliseconds), peak
+
+
+def main() -> None:
+    """Use for running the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--number", type=int, default=10000, help="responses per type"
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for name, create in create_responses():
+        responses, build_ms, build_kb = run(
+            lambda: [create().create_response() for _ in range(args.number)]
+        )
+        encoded, encode_ms, encode_kb = run(
+            lambda: [json.dumps(response) for response in responses]
+        )
+        rows.append(
+            (
+                name,
+                round(build_ms, 1),
+                round(build_kb),
+                round(encode_ms, 1),
+                round(encode_kb),
+                len(encoded[0]),
+            )
+        )
+    harness.print_table(
+        (
+            "{} responses".format(args.number),
+            "build ms",
+            "build peak KB",
+            "json ms",
+            "json peak KB",
+            "bytes",
+        ),
+        rows,
+    )
+
+    print()
+    report_rows = []
+    for name, create in create_change_reports():
+        event = create()
+        if json.loads(event.create_json()) != event.create_event():
+            raise Exception("{} json differs.".format(name))
+        for serializer, serialize in (
+            ("json.dumps", lambda: json.dumps(create().create_event())),
+            ("create_json", lambda: create().create_json()),
+        ):
+            _, milliseconds, peak = run(
+                lambda: [serialize() for _ in range(args.number)]
+            )
+            report_rows.append(
+                (
+                    "{}, {}".format(name, serializer),
+                    round(milliseconds, 1),
+                    round(peak),
+                )
+            )
+    harness.print_table(
+        (
+            "{} change reports".format(args.number),
+            "build and json ms",
+            "peak KB",
+        ),
+        report_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Load test of the threaded and the async ir apps.
+
+Creates an AC unit, a fan and a temperature sensor app per room,
+with the ir_packets_control apps on the worker threads or the
+ir_packets_control_async apps on the event loop, feeds them bursts of
+commands and sensor changes with every service call taking the
+configured latency, and compares the throughput.
+
+Usage:
+  python bench/bench_async_load.py --rooms 10 50 --rounds 5 \
+    --service-latency-ms 50 --threads 10
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import harness  # sets the stand-in and apps import paths first
+import ir_packets_control_async
+
+# the module and classes of the ac, fan and sensor apps per variant
+variants = {
+    "threaded": (
+        "ir_packets_control",
+        "HandleMqttACUnit",
+        "HandleMqttFan",
+        "TemperatureSensorToMqtt",
+    ),
+    "async": (
+        "ir_packets_control_async",
+        "AsyncHandleMqttACUnit",
+        "AsyncHandleMqttFan",
+        "AsyncTemperatureSensorToMqtt",
+    ),
+}
+
+
+def create_room(
+    hub: harness.FakeHomeAssistant, variant: str, room: int
+) -> List[Callable[[int], Any]]:
+    """Use for creating the apps of a room, return the room inputs."""
+    module, ac_class, fan_class, sensor_class = variants[variant]
+    prefix = "room_{}".format(room)
+    climate_entity = "climate.{}_ac".format(prefix)
+    sensor_entity = "sensor.{}_temperature".format(prefix)
+    transmitter = "10.0.{}.{}".format(room // 250, room % 250 + 1)
+    hub.add_entity(
+        climate_entity,
+        "off",
+        fan_mode="low",
+        temperature=24,
+        current_temperature=26,
+    )
+    hub.add_entity(sensor_entity, 24.0)
+
+    hub.create_app(
+        prefix + "_ac",
+        {
+            "module": module,
+            "class": ac_class,
+            "climate_entity": climate_entity,
+            "ir_transmitter_ip": transmitter,
+            "ac_type": "elco_small",
+            "default_mode_for_on": "cool",
+            "mode_command_topic": prefix + "/ac/mode",
+            "temperature_command_topic": prefix + "/ac/temperature",
+            "fan_mode_command_topic": prefix + "/ac/fan",
+        },
+    )
+    hub.create_app(
+        prefix + "_fan",
+        {
+            "module": module,
+            "class": fan_class,
+            "topic": prefix + "/fan/speed",
+            "payload": "",
+            "ir_transmitter_ip": transmitter,
+            "fan_type": "hyundai_ceiling_fan",
+            "command": "low",
+        },
+    )
+    hub.create_app(
+        prefix + "_sensor",
+        {
+            "module": module,
+            "class": sensor_class,
+            "sensor_entity": sensor_entity,
+            "topic": prefix + "/current_temperature",
+        },
+    )
+
+    modes = ("cool", "heat")
+    return [
+        lambda n: hub.mqtt_message(prefix + "/ac/mode", modes[n % 2]),
+        lambda n: hub.mqtt_message(prefix + "/ac/temperature", str(20 + n)),
+        lambda n: hub.mqtt_message(prefix + "/ac/fan", "medium"),
+        lambda n: hub.mqtt_message(prefix + "/fan/speed", "low"),
+        lambda n: hub.set_state(sensor_entity, 24 + n / 10, None),
+    ]
+
+
+def run_load(
+    variant: str, rooms: int, rounds: int, latency: float, threads: int
+) -> Tuple[int, int, float]:
+    """Use for feeding the rooms, return the events, calls and seconds."""
+    # the transmitter locks are bound to the event loop of the last hub
+    ir_packets_control_async.transmitter_locks.clear()
+    hub = harness.FakeHomeAssistant(threads, latency)
+    inputs = []  # type: List[Callable[[int], Any]]
+    for room in range(rooms):
+        inputs.extend(create_room(hub, variant, room))
+
+    started = time.monotonic()
+    for n in range(rounds):
+        for feed in inputs:
+            feed(n)
+    hub.drain()
+    elapsed = time.monotonic() - started
+
+    hub.close()
+    if hub.errors:
+        raise Exception(
+            "{} failed, {!r}.".format(variant, hub.errors[0])
+        ) from hub.errors[0]
+    return rounds * len(inputs), len(hub.service_calls), elapsed
+
+
+def main() -> None:
+    """Use for running the load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rooms", type=int, nargs="+", default=[10, 50])
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="events per input"
+    )
+    parser.add_argument(
+        "--service-latency-ms",
+        type=float,
+        default=50,
+        help="time each service call takes",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=10, help="callback worker threads"
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for rooms in args.rooms:
+        calls = {}  # type: Dict[str, int]
+        for variant in variants:
+            events, calls[variant], elapsed = run_load(
+                variant,
+                rooms,
+                args.rounds,
+                args.service_latency_ms / 1000,
+                args.threads,
+            )
+            rows.append(
+                (
+                    rooms,
+                    variant,
+                    events,
+                    calls[variant],
+                    round(elapsed, 2),
+                    round(events / elapsed),
+                )
+            )
+        if len(set(calls.values())) != 1:
+            raise Exception("the variants made different service calls.")
+    harness.print_table(
+        ("rooms", "apps", "events", "calls", "seconds", "events/s"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark of the fan mqtt messages dispatch.
+
+Compares a HandleMqttFan app per fan topic and payload with a single
+HandleMqttFanRouter, for 10, 100 and 1000 mapped fans.
+The time per message includes matching the message against the
+registered listeners, as AppDaemon does, and sending the packet.
+
+Usage:
+  python bench/bench_fan_dispatch.py --fans 10 100 1000
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+from typing import Callable, List, Tuple
+
+import harness  # sets the stand-in and apps import paths first
+
+FAN_TYPE = "hyundai_ceiling_fan"
+
+# (topic suffix, payload, command) of the HandleMqttFan apps of a fan
+fan_apps = [
+    ("command", "off", "off"),
+    ("command", "on", "low"),
+    ("speed", "low", "low"),
+    ("speed", "medium", "medium"),
+    ("speed", "high", "high"),
+]
+
+
+def fan_topic(fan: int, suffix: str) -> str:
+    """Use for creating the fan command or speed topic."""
+    return "tomerfi_custom_fan/fan_{}/{}".format(fan, suffix)
+
+
+def create_fan_apps(hub: harness.FakeHomeAssistant, fans: int) -> None:
+    """Use for creating a HandleMqttFan app per fan topic and payload."""
+    for fan in range(fans):
+        for suffix, payload, command in fan_apps:
+            hub.create_app(
+                "fan_{}_{}".format(fan, payload),
+                {
+                    "module": "ir_packets_control",
+                    "class": "HandleMqttFan",
+                    "topic": fan_topic(fan, suffix),
+                    "payload": payload,
+                    "ir_transmitter_ip": "192.168.0.170",
+                    "fan_type": FAN_TYPE,
+                    "command": command,
+                },
+            )
+
+
+def create_fan_router(hub: harness.FakeHomeAssistant, fans: int) -> None:
+    """Use for creating a single HandleMqttFanRouter for all the fans."""
+    hub.create_app(
+        "ceiling_fans_router",
+        {
+            "module": "ir_packets_control",
+            "class": "HandleMqttFanRouter",
+            "fan_type": FAN_TYPE,
+            "on_command": "low",
+            "ir_transmitter_ip": "192.168.0.170",
+            "fans": {
+                "fan_{}".format(fan): {
+                    "command_topic": fan_topic(fan, "command"),
+                    "speed_topic": fan_topic(fan, "speed"),
+                }
+                for fan in range(fans)
+            },
+        },
+    )
+
+
+def measure_dispatch(
+    create: Callable[[harness.FakeHomeAssistant, int], None],
+    fans: int,
+    number: int,
+) -> Tuple[int, float, int]:
+    """Use for timing the dispatch of the fans messages.
+
+    Returns the number of listeners, the microseconds per message and
+    the number of packets sent per message.
+    """
+    hub = harness.FakeHomeAssistant(threads=0)
+    create(hub, fans)
+    messages = [
+        (fan_topic(fan, suffix), payload)
+        for fan in range(0, fans, max(fans // 10, 1))
+        for suffix, payload, _ in fan_apps
+    ]  # type: List[Tuple[str, str]]
+    index = [0]
+
+    def dispatch() -> None:
+        hub.mqtt_message(*messages[index[0] % len(messages)])
+        index[0] += 1
+
+    for _ in range(len(messages)):
+        dispatch()
+    sent_per_message = len(hub.service_calls) // len(messages)
+    microseconds = harness.measure(dispatch, number)
+    listeners = len(hub.listeners)
+    hub.close()
+    return listeners, microseconds, sent_per_message
+
+
+def main() -> None:
+    """Use for running the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--fans", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument(
+        "--number", type=int, default=200, help="messages per round"
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for fans in args.fans:
+        for name, create in (
+            ("app per payload", create_fan_apps),
+            ("router", create_fan_router),
+        ):
+            listeners, microseconds, sent = measure_dispatch(
+                create, fans, args.number
+            )
+            if sent != 1:
+                raise Exception(
+                    "{} sent {} packets per message.".format(name, sent)
+                )
+            rows.append((fans, name, listeners, round(microseconds, 2)))
+    harness.print_table(
+        ("fans", "dispatch", "listeners", "us per message"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark of the ir packet lookups.
+
+Compares rebuilding the packets dictionary per lookup, as done before
+the lookup table, with a table flattened from the dictionaries, with
+decoding the packet from the codebook on every lookup and with
+get_ac_packet and get_fan_packet, which decode each packet once.
+
+Usage:
+  python bench/bench_packet_lookup.py --number 100000
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+from typing import Callable, Dict, List, Tuple
+
+import harness  # sets the stand-in, apps and tools import paths first
+import ir_packets_manager
+import ir_packets_source
+
+
+def rebuild_ac_packet(ac_type: str, mode: str, speed: str, temp: int) -> str:
+    """Use for looking up a packet by rebuilding the dictionary."""
+    return ir_packets_source.ac_type_to_packet_func[ac_type]()[mode][speed][
+        ir_packets_manager.TEMP_PREFIX.format(temp)
+    ]
+
+
+def rebuild_fan_packet(fan_type: str, command: str) -> str:
+    """Use for looking up a fan packet by rebuilding the dictionary."""
+    return ir_packets_source.fan_type_to_packet_func[fan_type]()[command]
+
+
+def main() -> None:
+    """Use for running the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--number", type=int, default=100000, help="lookups per round"
+    )
+    args = parser.parse_args()
+
+    ac_table = ir_packets_source.build_packets_table(
+        ir_packets_source.ac_type_to_packet_func
+    )
+    fan_table = ir_packets_source.build_packets_table(
+        ir_packets_source.fan_type_to_packet_func
+    )
+    codebooks = ir_packets_manager.codebooks
+    ac_key = ("elco_small", "cool", "low", 24)
+    fan_key = ("hyundai_ceiling_fan", "off", None, None)
+    cases = [
+        ("ac rebuild per lookup", lambda: rebuild_ac_packet(*ac_key)),
+        ("ac lookup table", lambda: ac_table[ac_key]),
+        (
+            "ac codebook decode",
+            lambda: codebooks[ac_key[0]].get_packet(ac_key[1:]),
+        ),
+        (
+            "ac get_ac_packet",
+            lambda: ir_packets_manager.get_ac_packet(*ac_key),
+        ),
+        ("fan rebuild per lookup", lambda: rebuild_fan_packet(*fan_key[:2])),
+        ("fan lookup table", lambda: fan_table[fan_key]),
+        (
+            "fan codebook decode",
+            lambda: codebooks[fan_key[0]].get_packet(fan_key[1:]),
+        ),
+        (
+            "fan get_fan_packet",
+            lambda: ir_packets_manager.get_fan_packet(*fan_key[:2]),
+        ),
+    ]  # type: List[Tuple[str, Callable[[], str]]]
+
+    expected = {}  # type: Dict[str, str]
+    rows = []
+    for name, lookup in cases:
+        device = name.split()[0]
+        packet = expected.setdefault(device, lookup())
+        if lookup() != packet:
+            raise Exception("{} returned a different packet.".format(name))
+        # rebuilding is slow, keep its rounds short
+        number = args.number // 100 if "rebuild" in name else args.number
+        rows.append(
+            (
+                name,
+                round(harness.measure(lookup, number), 3),
+                round(harness.peak_allocation(lookup, 100), 1),
+            )
+        )
+    harness.print_table(("lookup", "us per call", "peak KB per 100"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark of the StateReportResponse construction.
+
+Compares the response construction with the timestamp helpers used
+before, reimplemented here as a reference, parsing last_updated on
+every call and taking a now per helper, with the current helpers,
+sharing a now and caching the parse, once with the same last_updated
+on every response, hitting the parse cache, and once with a new
+last_updated on every response.
+
+Usage:
+  python bench/bench_state_report.py --number 10000
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+import contextlib
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import harness  # isort:skip, sets the apps import path first
+import alexa_request
+import alexa_response_success
+import little_helpers
+import load
+
+ENTITY = "climate.living_room_ac"
+
+
+def strptime_elapsed_in_milliseconds(
+    from_datetime: str, now: Optional[datetime] = None
+) -> int:
+    """Use for calculating the elapsed time as before, ignores now."""
+    fixed_from = (
+        from_datetime.rsplit(":", 1)[0] + from_datetime.rsplit(":", 1)[1]
+    )
+    return int(
+        (
+            datetime.now(timezone.utc)
+            - datetime.strptime(fixed_from, "%Y-%m-%dT%H:%M:%S.%f%z")
+        ).total_seconds()
+        * 1000
+    )
+
+
+def utcnow_iso_datetime_utc_tz_str(now: Optional[datetime] = None) -> str:
+    """Use for creating the time of sample as before, ignores now."""
+    return str(datetime.utcnow().replace(tzinfo=timezone.utc).isoformat())
+
+
+@contextlib.contextmanager
+def strptime_helpers() -> Iterator[None]:
+    """Use for constructing the responses with the reference helpers."""
+    current = (
+        little_helpers.get_elapsed_in_milliseconds,
+        little_helpers.get_iso_datetime_utc_tz_str,
+    )
+    little_helpers.get_elapsed_in_milliseconds = (
+        strptime_elapsed_in_milliseconds
+    )
+    little_helpers.get_iso_datetime_utc_tz_str = utcnow_iso_datetime_utc_tz_str
+    try:
+        yield
+    finally:
+        (
+            little_helpers.get_elapsed_in_milliseconds,
+            little_helpers.get_iso_datetime_utc_tz_str,
+        ) = current
+
+
+def create_entities(number: int) -> List[Dict]:
+    """Use for creating entity states with different last_updated."""
+    started = datetime.now(timezone.utc) - timedelta(hours=1)
+    return [
+        {
+            "entity_id": ENTITY,
+            "state": "cool",
+            "attributes": load.climate_attributes(),
+            "last_updated": (started + timedelta(microseconds=n)).isoformat(),
+        }
+        for n in range(number)
+    ]
+
+
+def main() -> None:
+    """Use for running the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--number", type=int, default=10000, help="responses per round"
+    )
+    args = parser.parse_args()
+
+    request_object = alexa_request.create_request(
+        load.create_directive(
+            "Alexa",
+            "ReportState",
+            little_helpers.entityId_to_endpointId(ENTITY),
+            {},
+        )
+    )
+    entities = create_entities(args.number)
+    index = [0]
+
+    def same_last_updated() -> Dict:
+        return alexa_response_success.StateReportResponse(
+            request_object, entities[0], "CELSIUS"
+        ).create_response()
+
+    def new_last_updated() -> Dict:
+        index[0] += 1
+        return alexa_response_success.StateReportResponse(
+            request_object, entities[index[0] % len(entities)], "CELSIUS"
+        ).create_response()
+
+    cases = [
+        ("parse per call", strptime_helpers, same_last_updated),
+        ("shared now, cached", contextlib.nullcontext, same_last_updated),
+        ("shared now, uncached", contextlib.nullcontext, new_last_updated),
+    ]  # type: List[Tuple[str, Callable, Callable[[], Dict]]]
+
+    rows = []
+    for name, helpers, construct in cases:
+        with helpers():
+            properties = construct()["context"]["properties"]
+            microseconds = harness.measure(construct, args.number)
+        rows.append(
+            (
+                name,
+                round(microseconds, 2),
+                properties[0]["uncertaintyInMilliseconds"] // 1000,
+            )
+        )
+    harness.print_table(
+        ("timestamps", "us per response", "uncertainty seconds"), rows
+    )
+
+
+if __name__ == "__main__":
+    main()
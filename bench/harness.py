@@ -0,0 +1,448 @@
+"""Offline harness running the apps without Home Assistant or Mosquitto.
+
+The apps are created from the apps.yaml configuration with the
+appdaemon stand-in of this directory, the events, state changes and
+api calls are fed by the benchmarks through the FakeHomeAssistant.
+
+Sync callbacks run on a pool of worker threads, like the AppDaemon
+threads, async callbacks run on an event loop thread.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import asyncio
+import concurrent.futures
+import importlib
+import itertools
+import os
+import sys
+import threading
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APPS_DIR = os.path.join(os.path.dirname(BENCH_DIR), "apps")
+TOOLS_DIR = os.path.join(os.path.dirname(BENCH_DIR), "tools")
+
+# the appdaemon stand-in must shadow an installed appdaemon
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(1, APPS_DIR)
+sys.path.insert(2, TOOLS_DIR)
+
+
+def create_entity(entity_id: str, state: Any, attributes: Dict) -> Dict:
+    """Use for creating an entity state as returned by Home Assistant."""
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "entity_id": entity_id,
+        "state": str(state),
+        "attributes": dict(attributes),
+        "last_changed": now,
+        "last_updated": now,
+    }
+
+
+class Listener:
+    """Object representing a registered event or state listener."""
+
+    def __init__(
+        self,
+        callback: Callable,
+        event: Optional[str],
+        entity: Optional[str],
+        attribute: Optional[str],
+        kwargs: Dict,
+    ) -> None:
+        """Initialize the object."""
+        self.callback = callback
+        self.event = event
+        self.entity = entity
+        self.attribute = attribute
+        self.kwargs = kwargs
+        self.namespace = kwargs.get("namespace", "default")
+        self.filters = {
+            key: value for key, value in kwargs.items() if key != "namespace"
+        }
+
+
+class Timer:
+    """Object representing a scheduled callback."""
+
+    def __init__(
+        self,
+        callback: Callable,
+        due: float,
+        interval: Optional[float],
+        kwargs: Dict,
+    ) -> None:
+        """Initialize the object."""
+        self.callback = callback
+        self.due = due
+        self.interval = interval
+        self.kwargs = kwargs
+
+
+class FakeHomeAssistant:
+    """Object standing in for Home Assistant, Mosquitto and AppDaemon.
+
+    Keeps the entities states, records the service calls and
+    dispatches the events, state changes and timers to the listeners
+    the apps registered, the way AppDaemon does.
+
+    Args:
+      threads: the number of worker threads for the sync callbacks,
+        0 runs them inline on the calling thread.
+      service_latency: seconds each service call takes.
+      verbose: print the apps logs.
+
+    """
+
+    def __init__(
+        self,
+        threads: int = 10,
+        service_latency: float = 0.0,
+        verbose: bool = False,
+    ) -> None:
+        """Initialize the object."""
+        self.service_latency = service_latency
+        self.verbose = verbose
+        self.states = {}  # type: Dict[str, Dict]
+        self.apps = {}  # type: Dict[str, Any]
+        self.endpoints = {}  # type: Dict[str, Callable]
+        self.service_calls = []  # type: List[Tuple[str, str, Dict]]
+        self.errors = []  # type: List[BaseException]
+        self.listeners = {}  # type: Dict[int, Listener]
+        self.timers = {}  # type: Dict[int, Timer]
+        self._handles = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pending = []  # type: List[concurrent.futures.Future]
+        self.executor = (
+            concurrent.futures.ThreadPoolExecutor(threads) if threads else None
+        )
+        self.loop = None  # type: Optional[asyncio.AbstractEventLoop]
+
+    # the api used by the appdaemon stand-in
+
+    def log(self, app_name: str, msg: str, level: str) -> None:
+        """Print the app log if verbose."""
+        if self.verbose:
+            print("{} {}: {}".format(level, app_name, msg))
+
+    def listen_event(
+        self, callback: Callable, event: str, kwargs: Dict
+    ) -> int:
+        """Register an event listener, return its handle."""
+        return self._add_listener(
+            Listener(callback, event, None, None, kwargs)
+        )
+
+    def listen_state(
+        self,
+        callback: Callable,
+        entity: Optional[str],
+        attribute: Optional[str],
+        kwargs: Dict,
+    ) -> int:
+        """Register a state listener, return its handle."""
+        return self._add_listener(
+            Listener(callback, None, entity, attribute, kwargs)
+        )
+
+    def cancel_listener(self, handle: int) -> None:
+        """Cancel a listener."""
+        with self._lock:
+            self.listeners.pop(handle, None)
+
+    def get_state(
+        self, entity: Optional[str], attribute: Optional[str]
+    ) -> Any:
+        """Return the entity state, its attribute or all of it."""
+        if entity is None:
+            return dict(self.states)
+        entity_state = self.states.get(entity)
+        if entity_state is None or attribute == "all":
+            return entity_state
+        if attribute is None:
+            return entity_state["state"]
+        return entity_state["attributes"].get(attribute)
+
+    def set_state(
+        self, entity: str, state: Any, attributes: Optional[Dict]
+    ) -> Dict:
+        """Set the entity state, dispatching the state listeners."""
+        old = self.states.get(entity)
+        if state is None:
+            state = old["state"] if old else None
+        if attributes is None:
+            attributes = old["attributes"] if old else {}
+        new = create_entity(entity, state, attributes)
+        self.states[entity] = new
+        for listener in self._get_listeners():
+            if listener.event or listener.entity not in (None, entity):
+                continue
+            if listener.attribute == "all":
+                old_value, new_value = old, new  # type: Any, Any
+            elif listener.attribute is None:
+                old_value = old["state"] if old else None
+                new_value = new["state"]
+            else:
+                old_value = (old["attributes"] if old else {}).get(
+                    listener.attribute
+                )
+                new_value = new["attributes"].get(listener.attribute)
+            if listener.attribute != "all" and old_value == new_value:
+                continue
+            self._dispatch(
+                listener.callback,
+                entity,
+                listener.attribute,
+                old_value,
+                new_value,
+                listener.kwargs,
+            )
+        return new
+
+    def record_service_call(
+        self, app_name: str, service: str, kwargs: Dict
+    ) -> None:
+        """Record a service call made by an app."""
+        self.service_calls.append((app_name, service, kwargs))
+
+    def schedule(
+        self,
+        callback: Callable,
+        delay: float,
+        interval: Optional[float],
+        kwargs: Dict,
+    ) -> int:
+        """Schedule a timer, return its handle."""
+        handle = next(self._handles)
+        with self._lock:
+            self.timers[handle] = Timer(
+                callback, time.monotonic() + delay, interval, kwargs
+            )
+        return handle
+
+    def cancel_timer(self, handle: int) -> None:
+        """Cancel a timer."""
+        with self._lock:
+            self.timers.pop(handle, None)
+
+    # the api used by the benchmarks
+
+    def start_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the event loop thread running the async callbacks."""
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=self.loop.run_forever, name="event_loop", daemon=True
+            ).start()
+        return self.loop
+
+    def add_entity(
+        self, entity_id: str, state: Any, **attributes: Any
+    ) -> None:
+        """Add an entity without dispatching the state listeners."""
+        self.states[entity_id] = create_entity(entity_id, state, attributes)
+
+    def create_app(self, name: str, config: Dict) -> Any:
+        """Create and initialize an app from its apps.yaml configuration."""
+        module = importlib.import_module(config["module"])
+        app_class = getattr(module, config["class"])
+        args = {
+            key: value
+            for key, value in config.items()
+            if key not in ("module", "class", "global_dependencies")
+        }
+        app = app_class(self, name, args)
+        self.apps[name] = app
+        if asyncio.iscoroutinefunction(app.initialize):
+            asyncio.run_coroutine_threadsafe(
+                app.initialize(), self.start_loop()
+            ).result()
+        else:
+            app.initialize()
+        return app
+
+    def terminate_apps(self) -> None:
+        """Terminate the apps, waiting for the pending callbacks first."""
+        self.drain()
+        for app in self.apps.values():
+            if not hasattr(app, "terminate"):
+                continue
+            if asyncio.iscoroutinefunction(app.terminate):
+                asyncio.run_coroutine_threadsafe(
+                    app.terminate(), self.start_loop()
+                ).result()
+            else:
+                app.terminate()
+        self.apps = {}
+
+    def fire_event(
+        self, event: str, data: Dict, namespace: str = "default"
+    ) -> int:
+        """Dispatch an event, return the number of listeners called."""
+        called = 0
+        for listener in self._get_listeners():
+            if listener.event != event or listener.namespace != namespace:
+                continue
+            if any(
+                data.get(key) != value
+                for key, value in listener.filters.items()
+            ):
+                continue
+            self._dispatch(listener.callback, event, data, listener.kwargs)
+            called += 1
+        return called
+
+    def mqtt_message(self, topic: str, payload: str) -> int:
+        """Dispatch an mqtt message event from the mqtt namespace."""
+        return self.fire_event(
+            "MQTT_MESSAGE", {"topic": topic, "payload": payload}, "mqtt"
+        )
+
+    def call_endpoint(self, name: str, request: Dict) -> Any:
+        """Call the api endpoint, return its result."""
+        return self.endpoints[name](request)
+
+    def submit(self, func: Callable, *args: Any) -> None:
+        """Run a function on the workers, like the api calls are run."""
+        self._dispatch(func, *args)
+
+    def fire_timers(self, all_timers: bool = False) -> int:
+        """Dispatch the due timers, or all of them, return their number."""
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for handle, timer in list(self.timers.items()):
+                if not all_timers and timer.due > now:
+                    continue
+                due.append(timer)
+                if timer.interval:
+                    timer.due = now + timer.interval
+                else:
+                    del self.timers[handle]
+        for timer in due:
+            self._dispatch(timer.callback, timer.kwargs)
+        return len(due)
+
+    def drain(self) -> None:
+        """Wait for the dispatched callbacks to finish."""
+        while True:
+            with self._lock:
+                pending = self._pending
+                self._pending = []
+            if not pending:
+                return
+            concurrent.futures.wait(pending)
+
+    def close(self) -> None:
+        """Terminate the apps and stop the workers and the event loop."""
+        self.terminate_apps()
+        if self.executor:
+            self.executor.shutdown()
+        if self.loop:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _add_listener(self, listener: Listener) -> int:
+        """Use for registering a listener under a new handle."""
+        handle = next(self._handles)
+        with self._lock:
+            self.listeners[handle] = listener
+        return handle
+
+    def _get_listeners(self) -> List[Listener]:
+        """Use for iterating the listeners while they may change."""
+        with self._lock:
+            return list(self.listeners.values())
+
+    def _dispatch(self, callback: Callable, *args: Any) -> None:
+        """Use for running a callback like AppDaemon would."""
+        if asyncio.iscoroutinefunction(callback):
+            future = asyncio.run_coroutine_threadsafe(
+                callback(*args), self.start_loop()
+            )  # type: concurrent.futures.Future
+        elif self.executor:
+            future = self.executor.submit(callback, *args)
+        else:
+            try:
+                callback(*args)
+            except Exception as ex:
+                self.errors.append(ex)
+            return
+        future.add_done_callback(self._collect_error)
+        with self._lock:
+            self._pending.append(future)
+
+    def _collect_error(self, future: concurrent.futures.Future) -> None:
+        """Use for keeping the exceptions raised by the callbacks."""
+        exception = future.exception()
+        if exception:
+            self.errors.append(exception)
+
+
+def load_apps_config(path: Optional[str] = None) -> Dict[str, Dict]:
+    """Use for loading the apps configuration, apps.yaml by default."""
+    with open(path or os.path.join(APPS_DIR, "apps.yaml")) as config_file:
+        config = yaml.safe_load(config_file)
+    config.pop("global_modules", None)
+    return config
+
+
+def measure(func: Callable[[], Any], number: int) -> float:
+    """Use for timing a function, return the best microseconds per call.
+
+    Runs five rounds of number calls.
+    """
+    timer = timeit.Timer(func)
+    return min(timer.repeat(5, number)) / number * 1_000_000
+
+
+def measure_percentiles(
+    func: Callable[[], Any], number: int, percentiles: Sequence[int] = (50, 99)
+) -> List[float]:
+    """Use for timing every call, return the microseconds percentiles."""
+    func()
+    samples = []
+    for _ in range(number):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return [
+        samples[min(len(samples) - 1, len(samples) * percentile // 100)]
+        * 1_000_000
+        for percentile in percentiles
+    ]
+
+
+def peak_allocation(func: Callable[[], Any], number: int) -> float:
+    """Use for measuring the peak kilobytes allocated by number calls."""
+    func()
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def print_table(header: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Use for printing the benchmark results as an aligned table."""
+    table = [[str(cell) for cell in row] for row in [header] + list(rows)]
+    widths = [
+        max(len(row[index]) for row in table) for index in range(len(header))
+    ]
+    for row in table:
+        print(
+            "  ".join(
+                cell.ljust(width) if index == 0 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(row, widths))
+            )
+        )
@@ -0,0 +1,366 @@
+"""Load driver feeding synthetic events to the apps at a configured rate.
+
+Creates the apps of the selected modules from apps.yaml in the offline
+harness, feeds them round robin with the mqtt messages, state changes
+and Alexa directives they listen to, and reports the throughput, the
+service calls made and the latency of every instrumented callback.
+
+Usage:
+  python bench/load.py --rate 200 --duration 10
+  python bench/load.py --modules ir_packets_control --rate 0 \
+    --service-latency-ms 20 --threads 10
+
+A rate of 0 feeds the events as fast as possible.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+import itertools
+import json
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Tuple
+
+import harness  # sets the stand-in and apps import paths first
+import little_helpers
+
+MODULES = (
+    "automations",
+    "ir_packets_control",
+    "wallpanels_project",
+    "smarthome_custom_ac",
+)
+
+# an input feeds the n-th event of its stream
+Input = Callable[[int], None]
+
+
+def climate_attributes(**attributes: Any) -> Dict:
+    """Use for creating the attributes of a climate entity."""
+    return dict(
+        {
+            "friendly_name": "AC",
+            "operation_list": ["off", "cool", "heat", "fan_only", "dry"],
+            "fan_modes": ["low", "medium", "high", "auto"],
+            "fan_mode": "low",
+            "temperature": 24,
+            "current_temperature": 26,
+            "min_temp": 16,
+            "max_temp": 30,
+        },
+        **attributes,
+    )
+
+
+def battery_low_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for draining and charging the battery sensor."""
+    entity = config["sensor_entity"]
+    hub.add_entity(entity, 50)
+    return [lambda n: hub.set_state(entity, 50 - n % 40, None)]
+
+
+def sensors_control_switches_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for opening and closing the door sensor."""
+    entity = config["sensor_entity"]
+    hub.add_entity(entity, "closed")
+    return [lambda n: hub.set_state(entity, ("open", "closed")[n % 2], None)]
+
+
+def mqtt_router_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for publishing the routed rf codes."""
+    messages = [
+        (topic, str(payload))
+        for topic, payloads in config["topics"].items()
+        for payload in payloads
+    ]
+    return [lambda n: hub.mqtt_message(*messages[n % len(messages)])]
+
+
+def fan_router_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for publishing the fans commands and speeds."""
+    messages = []
+    for fan in config["fans"].values():
+        messages.append((fan["command_topic"], "on"))
+        messages.extend(
+            (fan["speed_topic"], speed) for speed in ("low", "medium", "high")
+        )
+        messages.append((fan["command_topic"], "off"))
+    return [lambda n: hub.mqtt_message(*messages[n % len(messages)])]
+
+
+def ac_unit_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for publishing the ac mode, temperature and fan commands."""
+    hub.add_entity(config["climate_entity"], "off", **climate_attributes())
+    modes = ("cool", "heat", "off")
+    speeds = ("low", "medium", "high")
+    return [
+        lambda n: hub.mqtt_message(
+            config["mode_command_topic"], modes[n % len(modes)]
+        ),
+        lambda n: hub.mqtt_message(
+            config["temperature_command_topic"], str(20 + n % 8)
+        ),
+        lambda n: hub.mqtt_message(
+            config["fan_mode_command_topic"], speeds[n % len(speeds)]
+        ),
+    ]
+
+
+def temperature_sensor_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for changing the temperature sensors by 0.1 degrees steps."""
+
+    def create_input(entity: str) -> Input:
+        hub.add_entity(entity, 24.0)
+        return lambda n: hub.set_state(
+            entity, round(24 + (n % 20) / 10, 1), None
+        )
+
+    sensors = config.get("sensors") or [config]
+    return [create_input(sensor["sensor_entity"]) for sensor in sensors]
+
+
+def wallpanel_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for publishing the wall panel battery reports."""
+    hub.add_entity(config["sensor_entity"], 80, friendly_name="Panel")
+
+    def publish(n: int) -> None:
+        hub.mqtt_message(
+            config["sensor_topic"],
+            json.dumps(
+                {
+                    "value": 80 - n // 10 % 20,
+                    "unit": "%",
+                    "charging": False,
+                    "acPlugged": False,
+                    "usbPlugged": False,
+                }
+            ),
+        )
+
+    return [publish]
+
+
+def create_directive(
+    namespace: str, name: str, endpoint_id: str, payload: Dict
+) -> Dict:
+    """Use for creating an Alexa directive request."""
+    return {
+        "directive": {
+            "header": {
+                "namespace": namespace,
+                "name": name,
+                "payloadVersion": "3",
+                "messageId": "message-id",
+                "correlationToken": "correlation-token",
+            },
+            "endpoint": {
+                "scope": {"type": "BearerToken", "token": "token"},
+                "endpointId": endpoint_id,
+                "cookie": {},
+            },
+            "payload": payload,
+        }
+    }
+
+
+# (namespace, name, payload) of the directives fed to AlexaCustomAC
+alexa_directives = [
+    ("Alexa", "ReportState", {}),
+    ("Alexa.PowerController", "TurnOn", {}),
+    ("Alexa.PowerController", "TurnOff", {}),
+    (
+        "Alexa.ThermostatController",
+        "SetTargetTemperature",
+        {"targetSetpoint": {"value": 23, "scale": "CELSIUS"}},
+    ),
+    (
+        "Alexa.ThermostatController",
+        "AdjustTargetTemperature",
+        {"targetSetpointDelta": {"value": -1, "scale": "CELSIUS"}},
+    ),
+    (
+        "Alexa.ThermostatController",
+        "SetThermostatMode",
+        {"thermostatMode": {"value": "COOL"}},
+    ),
+]  # type: List[Tuple[str, str, Dict]]
+
+
+def alexa_inputs(hub: Any, config: Dict) -> List[Input]:
+    """Use for calling the api endpoint with the Alexa directives."""
+    requests = []
+    for entity in config["entities"]:
+        hub.add_entity(
+            entity, "cool", **climate_attributes(friendly_name=entity)
+        )
+        for namespace, name, payload in alexa_directives:
+            requests.append(
+                create_directive(
+                    namespace,
+                    name,
+                    little_helpers.entityId_to_endpointId(entity),
+                    payload,
+                )
+            )
+    requests.append(
+        create_directive(
+            "Alexa.Discovery",
+            "Discover",
+            "",
+            {"scope": {"type": "BearerToken", "token": "token"}},
+        )
+    )
+    return [
+        lambda n: hub.submit(
+            hub.call_endpoint, "AlexaCustomAC", requests[n % len(requests)]
+        )
+    ]
+
+
+inputs_by_class = {
+    "BatteryLowSendNotification": battery_low_inputs,
+    "SensorsControlSwitches": sensors_control_switches_inputs,
+    "CallServiceOnMqttMessageRouter": mqtt_router_inputs,
+    "HandleMqttFanRouter": fan_router_inputs,
+    "HandleMqttACUnit": ac_unit_inputs,
+    "TemperatureSensorToMqtt": temperature_sensor_inputs,
+    "WallPanelsExtractAttributesFromMessage": wallpanel_inputs,
+    "AlexaCustomAC": alexa_inputs,
+}
+
+
+def create_apps(hub: Any, config: Dict, modules: List[str]) -> List[Input]:
+    """Use for creating the apps of the modules, return their inputs."""
+    inputs = []  # type: List[Input]
+    for name, app_config in config.items():
+        if app_config["module"] not in modules:
+            continue
+        create_inputs = inputs_by_class.get(app_config["class"])
+        if not create_inputs:
+            continue
+        inputs.extend(create_inputs(hub, app_config))
+        hub.create_app(name, app_config)
+    return inputs
+
+
+def feed(hub: Any, inputs: List[Input], rate: float, duration: float) -> int:
+    """Use for feeding the inputs round robin, return the events fed."""
+    started = time.monotonic()
+    counters = defaultdict(int)  # type: Dict[int, int]
+    fed = 0
+    for index in itertools.cycle(range(len(inputs))):
+        now = time.monotonic()
+        if now - started >= duration:
+            break
+        if rate:
+            ahead = started + fed / rate - now
+            if ahead > 0:
+                time.sleep(ahead)
+        inputs[index](counters[index])
+        counters[index] += 1
+        fed += 1
+        if fed % 100 == 0:
+            hub.fire_timers()
+    return fed
+
+
+def report(hub: Any, fed: int, elapsed: float) -> None:
+    """Use for printing the throughput and the callbacks latency."""
+    print(
+        "fed {} events in {}s, {} events/s, {} service calls, "
+        "{} errors".format(
+            fed,
+            round(elapsed, 2),
+            round(fed / elapsed),
+            len(hub.service_calls),
+            len(hub.errors),
+        )
+    )
+    rows = []
+    for callback, stats in sorted(little_helpers.callback_stats.items()):
+        if not stats.calls:
+            continue
+        rows.append(
+            (
+                callback,
+                stats.calls,
+                round(stats.total_seconds * 1000 / stats.calls, 3),
+                round(stats.max_seconds * 1000, 3),
+            )
+        )
+    harness.print_table(("callback", "calls", "avg ms", "max ms"), rows)
+
+    histograms = little_helpers.metrics.collect()[1]
+    directive_rows = []
+    for (metric, labels), values in sorted(histograms.items()):
+        if metric != "alexa_directive_seconds":
+            continue
+        calls = int(sum(values[:-1]))
+        directive_rows.append(
+            (
+                "{}.{}".format(
+                    dict(labels)["namespace"], dict(labels)["name"]
+                ),
+                calls,
+                round(values[-1] * 1000 / max(calls, 1), 3),
+            )
+        )
+    if directive_rows:
+        harness.print_table(
+            ("alexa directive", "calls", "avg ms"), directive_rows
+        )
+
+
+def main() -> None:
+    """Use for running the load driver from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        choices=MODULES,
+        default=list(MODULES),
+        help="the apps modules to load",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=100, help="events per second, 0 max"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10, help="seconds to feed"
+    )
+    parser.add_argument(
+        "--threads", type=int, default=10, help="callback worker threads"
+    )
+    parser.add_argument(
+        "--service-latency-ms",
+        type=float,
+        default=0,
+        help="time each service call takes",
+    )
+    parser.add_argument(
+        "--config", help="the apps configuration, apps/apps.yaml by default"
+    )
+    parser.add_argument("--verbose", action="store_true", help="print logs")
+    args = parser.parse_args()
+
+    hub = harness.FakeHomeAssistant(
+        args.threads, args.service_latency_ms / 1000, args.verbose
+    )
+    inputs = create_apps(
+        hub, harness.load_apps_config(args.config), args.modules
+    )
+    little_helpers.set_instrumentation(True)
+
+    started = time.monotonic()
+    fed = feed(hub, inputs, args.rate, args.duration)
+    hub.drain()
+    hub.fire_timers(all_timers=True)
+    hub.drain()
+    elapsed = time.monotonic() - started
+
+    hub.close()
+    report(hub, fed, elapsed)
+
+
+if __name__ == "__main__":
+    main()
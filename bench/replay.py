@@ -0,0 +1,212 @@
+"""Replay of a traffic capture into the apps running offline.
+
+Creates the apps of the selected modules from apps.yaml in the offline
+harness, feeds them the mqtt messages, state changes and Alexa
+directives of a capture made with traffic_replay.TrafficRecorder,
+and compares the service calls the apps made with the captured ones.
+Nothing reaches Home Assistant or the broker, the service calls are
+recorded by the harness.
+
+Dropped are captured service calls that were not made,
+duplicated are service calls made more times than captured.
+Each input is fed once the callbacks of the previous one finished,
+its latency is the time until its own callbacks finished,
+grouped by the mqtt topic, the entity or the directive.
+
+Usage:
+  python bench/replay.py /conf/captures/evening.jsonl
+  python bench/replay.py evening.jsonl --speed 10 --service-latency-ms 20
+
+The inputs are fed as fast as possible,
+or at the captured pace divided by speed.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import argparse
+import json
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+import harness  # sets the stand-in and apps import paths first
+import load
+
+
+def service_key(domain: str, service: str, service_data: Dict) -> str:
+    """Use for identifying identical service calls across runs."""
+    return json.dumps(
+        [domain, service, service_data], sort_keys=True, default=str
+    )
+
+
+def load_capture(path: str) -> List[Dict]:
+    """Use for loading the capture file records sorted by time."""
+    with open(path) as capture_file:
+        records = [json.loads(line) for line in capture_file if line.strip()]
+    records.sort(key=lambda record: record["t"])
+    return records
+
+
+def create_apps(hub: Any, config: Dict, modules: List[str]) -> None:
+    """Use for creating the apps, without capturing the replayed traffic."""
+    config = {
+        name: {
+            key: value
+            for key, value in app_config.items()
+            if key != "capture_file"
+        }
+        for name, app_config in config.items()
+    }
+    load.create_apps(hub, config, modules)
+
+
+def seed_entities(hub: Any, records: List[Dict]) -> None:
+    """Use for setting the entities to their first captured state."""
+    seeded = set()
+    for record in records:
+        if record["kind"] != "state" or record["entity_id"] in seeded:
+            continue
+        seeded.add(record["entity_id"])
+        hub.add_entity(
+            record["entity_id"], record["state"], **record["attributes"]
+        )
+
+
+def feed(hub: Any, record: Dict) -> str:
+    """Use for feeding a single captured input, return its label."""
+    kind = record["kind"]
+    if kind == "directive":
+        header = record["request"]["directive"]["header"]
+        hub.submit(hub.apps[record["app"]].api_call, record["request"])
+        return "{}.{}".format(header["namespace"], header["name"])
+    if kind == "mqtt":
+        hub.mqtt_message(record["topic"], record["payload"])
+        return "mqtt {}".format(record["topic"])
+    hub.set_state(record["entity_id"], record["state"], record["attributes"])
+    return record["entity_id"]
+
+
+def replay(
+    hub: Any, inputs: List[Dict], speed: Optional[float]
+) -> Dict[str, List[float]]:
+    """Use for feeding the inputs, return the latencies per label."""
+    latencies = defaultdict(list)  # type: Dict[str, List[float]]
+    started = time.monotonic()
+    first_time = inputs[0]["t"] if inputs else 0
+    for record in inputs:
+        if speed:
+            delay = (
+                started + (record["t"] - first_time) / speed - time.monotonic()
+            )
+            if delay > 0:
+                time.sleep(delay)
+        sent = time.monotonic()
+        label = feed(hub, record)
+        hub.drain()
+        latencies[label].append(time.monotonic() - sent)
+        hub.fire_timers()
+    hub.fire_timers(all_timers=True)
+    hub.drain()
+    return latencies
+
+
+def _milliseconds(seconds: float) -> float:
+    """Use for rounding seconds to milliseconds for the report."""
+    return round(seconds * 1000, 3)
+
+
+def report(
+    hub: Any, records: List[Dict], latencies: Dict[str, List[float]]
+) -> None:
+    """Use for printing the comparison with the captured service calls."""
+    expected_calls = Counter(
+        service_key(
+            record["domain"], record["service"], record["service_data"]
+        )
+        for record in records
+        if record["kind"] == "service"
+    )
+    made_calls = Counter()  # type: Counter
+    for _, service, service_data in hub.service_calls:
+        domain, name = service.split("/", 1)
+        made_calls[service_key(domain, name, service_data)] += 1
+    print(
+        "service calls captured {}, made {}, dropped {}, duplicated {}, "
+        "{} errors".format(
+            sum(expected_calls.values()),
+            sum(made_calls.values()),
+            sum((expected_calls - made_calls).values()),
+            sum((made_calls - expected_calls).values()),
+            len(hub.errors),
+        )
+    )
+    rows = []
+    for label, samples in sorted(latencies.items()):
+        samples.sort()
+        rows.append(
+            (
+                label,
+                len(samples),
+                _milliseconds(samples[len(samples) // 2]),
+                _milliseconds(samples[len(samples) * 99 // 100]),
+                _milliseconds(samples[-1]),
+            )
+        )
+    harness.print_table(
+        ("input", "samples", "p50 ms", "p99 ms", "max ms"), rows
+    )
+
+
+def main() -> None:
+    """Use for running the replay from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("capture", help="the jsonl capture file")
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        choices=load.MODULES,
+        default=list(load.MODULES),
+        help="the apps modules to load",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0,
+        help="the captured pace divided by, 0 as fast as possible",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=10, help="callback worker threads"
+    )
+    parser.add_argument(
+        "--service-latency-ms",
+        type=float,
+        default=0,
+        help="time each service call takes",
+    )
+    parser.add_argument(
+        "--config", help="the apps configuration, apps/apps.yaml by default"
+    )
+    parser.add_argument("--verbose", action="store_true", help="print logs")
+    args = parser.parse_args()
+
+    records = load_capture(args.capture)
+    hub = harness.FakeHomeAssistant(
+        args.threads, args.service_latency_ms / 1000, args.verbose
+    )
+    create_apps(hub, harness.load_apps_config(args.config), args.modules)
+    seed_entities(hub, records)
+    # the setup calls of the apps were not captured
+    del hub.service_calls[:]
+
+    latencies = replay(
+        hub,
+        [record for record in records if record["kind"] != "service"],
+        args.speed,
+    )
+    hub.close()
+    report(hub, records, latencies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""Pytest configuration, the apps are importable as top level modules.
+
+AppDaemon loads the apps directory modules by name,
+the tests import them the same way, and the tools modules next to them.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+sys.path.insert(0, os.path.join(ROOT_DIR, "apps"))
+sys.path.insert(1, os.path.join(ROOT_DIR, "tools"))
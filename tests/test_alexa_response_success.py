@@ -0,0 +1,60 @@
+"""Tests for the alexa_response_success global module.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import json
+from typing import Any, Dict
+
+import alexa_response_success
+import pytest
+
+ENTITY = {
+    "entity_id": "climate.living_room_ac",
+    "state": "cool",
+    "attributes": {"temperature": 24, "current_temperature": 26},
+    "last_updated": "2019-10-05T14:30:12.345678+00:00",
+}
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"state": "heat"},
+        {"state": "off", "temperature": 20, "current_temperature": 22},
+    ],
+)
+def test_change_report_json(changes: Dict[str, Any]) -> None:
+    """Test the serialized change report matches the event dict."""
+    attributes = dict(ENTITY["attributes"])
+    attributes.update(
+        (key, value) for key, value in changes.items() if key != "state"
+    )
+    new_entity = dict(
+        ENTITY,
+        state=changes.get("state", ENTITY["state"]),
+        attributes=attributes,
+    )
+    event_object = alexa_response_success.ChangeReportEvent(
+        ENTITY, new_entity, "CELSIUS", "token", "APP_INTERACTION"
+    )
+    event = event_object.create_event()
+    assert json.loads(event_object.create_json()) == event
+    changed = event["event"]["payload"]["change"]["properties"]
+    assert len(changed) == len(event_object.changed_values)
+    assert len(changed) + len(event["context"]["properties"]) == 4
+
+
+def test_change_cause() -> None:
+    """Test changes of a Home Assistant user are app interactions."""
+    assert (
+        alexa_response_success.get_change_cause(ENTITY)
+        == "PHYSICAL_INTERACTION"
+    )
+    assert (
+        alexa_response_success.get_change_cause(
+            dict(ENTITY, context={"id": "1", "user_id": "2"})
+        )
+        == "APP_INTERACTION"
+    )
@@ -0,0 +1,75 @@
+"""Tests for the ir_codebook global module and the packaged codebooks.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+from typing import Any
+
+import ir_codebook
+import ir_packets_manager
+import ir_packets_source
+import pytest
+
+source_tables = [
+    ir_packets_source.build_packets_table(
+        ir_packets_source.ac_type_to_packet_func
+    ),
+    ir_packets_source.build_packets_table(
+        ir_packets_source.fan_type_to_packet_func
+    ),
+]
+
+source_packets = {
+    device_type: ir_packets_source.device_packets(table, device_type)
+    for table in source_tables
+    for device_type in {key[0] for key in table}
+}
+
+
+@pytest.mark.parametrize("device_type", sorted(source_packets))
+def test_codebook_matches_source(device_type: str) -> None:
+    """Test every codebook entry is byte identical to the dictionaries."""
+    packets = source_packets[device_type]
+    codebook = ir_packets_manager.codebooks[device_type]
+    assert set(codebook.keys()) == set(packets)
+    for key, packet in packets.items():
+        expected = ir_codebook.decode_packet(packet)
+        assert codebook.get_raw_packet(key) == expected, key
+        assert ir_codebook.decode_packet(codebook.get_packet(key)) == (
+            expected
+        ), key
+
+
+def test_codebooks_are_packaged() -> None:
+    """Test every device of the dictionaries has a codebook."""
+    assert set(ir_packets_manager.codebooks) == set(source_packets)
+
+
+def test_get_packets_match_source() -> None:
+    """Test the apps lookups return the packets of the dictionaries."""
+    for table in source_tables:
+        for (device_type, mode, speed, temp), packet in table.items():
+            if device_type in ir_packets_source.fan_type_to_packet_func:
+                found = ir_packets_manager.get_fan_packet(device_type, mode)
+            else:
+                found = ir_packets_manager.get_ac_packet(
+                    device_type, mode, speed, temp
+                )
+            assert ir_codebook.decode_packet(found) == (
+                ir_codebook.decode_packet(packet)
+            )
+
+
+def test_get_packet_is_memoized() -> None:
+    """Test a packet is decoded once and then served from memory."""
+    first = ir_packets_manager.get_fan_packet("hyundai_ceiling_fan", "off")
+    second = ir_packets_manager.get_fan_packet("hyundai_ceiling_fan", "off")
+    assert first is second
+
+
+def test_write_and_verify_codebook(tmpdir: Any) -> None:
+    """Test a written codebook reads back the same packets."""
+    packets = source_packets["hyundai_ceiling_fan"]
+    path = ir_codebook.codebook_path("fan", str(tmpdir))
+    ir_codebook.write_codebook(path, packets)
+    ir_codebook.verify_codebook(path, packets)
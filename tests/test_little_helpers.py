@@ -0,0 +1,124 @@
+"""Tests for the little_helpers global module.
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import json
+from datetime import datetime, timedelta, timezone
+
+import little_helpers
+import pytest
+
+
+@pytest.mark.parametrize("value", little_helpers.true_strings)
+def test_to_bool_state_true_strings(value: str) -> None:
+    """Test every true spelling is classified as True."""
+    assert little_helpers.to_bool_state(value) is True
+
+
+@pytest.mark.parametrize("value", little_helpers.false_strings)
+def test_to_bool_state_false_strings(value: str) -> None:
+    """Test every false spelling is classified as False."""
+    assert little_helpers.to_bool_state(value) is False
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("TRUE", True),
+        (" on ", True),
+        ("oN\n", True),
+        ("ONLINE", True),
+        ("OPEN", True),
+        ("motion detected", True),
+        ("MOTION_DETECTED", True),
+        ("Motion_Detected", True),
+        ("FALSE", False),
+        ("\toff", False),
+        ("OfF ", False),
+        ("OFFLINE", False),
+        ("CLOSED", False),
+        ("no motion", False),
+        ("NO_MOTION", False),
+        ("No_Motion", False),
+    ],
+)
+def test_to_bool_state_case_and_space_variants(
+    value: str, expected: bool
+) -> None:
+    """Test case, surrounding whitespace and space vs underscore variants."""
+    assert little_helpers.to_bool_state(value) is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(True, True), (False, False), (None, None)]
+)
+def test_to_bool_state_non_strings(value: object, expected: bool) -> None:
+    """Test non string values are classified by their string form."""
+    assert little_helpers.to_bool_state(value) is expected
+
+
+@pytest.mark.parametrize(
+    "value", ["", "unknown", "unavailable", "1", "0", "yes", "onn", "o n"]
+)
+def test_to_bool_state_unknown(value: str) -> None:
+    """Test values that are neither true or false return None."""
+    assert little_helpers.to_bool_state(value) is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2019, 10, 5, 14, 30, 12, 345678, tzinfo=timezone.utc),
+        datetime(2019, 10, 5, 14, 30, 12, tzinfo=timezone.utc),
+        datetime(
+            2019, 10, 5, 14, 30, 12, 1, tzinfo=timezone(timedelta(hours=3))
+        ),
+    ],
+)
+def test_parse_iso_datetime(value: datetime) -> None:
+    """Test HA timestamps parse back, with and without microseconds."""
+    assert little_helpers.parse_iso_datetime(value.isoformat()) == value
+
+
+def test_get_elapsed_in_milliseconds() -> None:
+    """Test the elapsed time is measured until the shared now."""
+    now = datetime(2019, 10, 5, 14, 30, 12, 345678, tzinfo=timezone.utc)
+    last_updated = (now - timedelta(seconds=2, milliseconds=5)).isoformat()
+    assert little_helpers.get_elapsed_in_milliseconds(last_updated, now) == (
+        2005
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "plain",
+        'quoted "{braces}" @@value@@',
+        {"nested": ["list", 1, 2.5, None, True]},
+        24,
+    ],
+)
+def test_json_template_render(value: object) -> None:
+    """Test the rendered template parses back to the filled document."""
+    template = little_helpers.JsonTemplate(
+        {
+            "constant": {"list": [1, "{}"]},
+            "value": little_helpers.slot("value"),
+            "again": [little_helpers.slot("value")],
+        }
+    )
+    assert json.loads(template.render(value=value)) == {
+        "constant": {"list": [1, "{}"]},
+        "value": value,
+        "again": [value],
+    }
+
+
+def test_json_template_render_fragment() -> None:
+    """Test json fragments are inserted as is."""
+    template = little_helpers.JsonTemplate(
+        {"values": little_helpers.slot("values")}
+    )
+    fragment = little_helpers.JsonFragment("[1,2]")
+    assert template.render(values=fragment) == '{"values":[1,2]}'
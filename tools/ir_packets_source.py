@@ -0,0 +1,905 @@
+"""Codebooks converter source, the IR packets dictionaries.
+
+Not an AppDaemon module, the apps read the packets from the binary
+codebooks under apps/codebooks. Kept outside the apps directory so
+AppDaemon never imports it, the base64 literals of the dictionaries
+would otherwise stay in memory as code object constants.
+
+Generate and verify the codebooks after changing the dictionaries with:
+  python3 tools/ir_packets_source.py [target_dir]
+
+.. codeauthor:: Tomer Figenblat <tomer.figenblat@gmail.com>
+
+"""
+import os
+import sys
+from typing import Callable, Dict
+
+APPS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "apps"
+)
+sys.path.insert(0, APPS_DIR)
+
+import ir_codebook  # noqa: E402
+import ir_packets_manager  # noqa: E402
+
+
+def get_ir_dict_hyundai_ceiling_fan() -> Dict:
+    """Use to create a dictionary for the hyundai ceiling fan ir packets."""
+    return {
+        ir_packets_manager.COMMAND_LIGHT: "JgDOACoNKg0OKQ4pDikOKQ4oDygPKA8oDygPAAEEKg0qDQ4pDikOKSkOKQ0qDSoNKg0qDSrpKg0qDQ4pDikOKQ4pDikOKSkODikOKA8AAQQqDSoNDikOKQ4pDikOKQ4pKg0OKQ4pDgABBCoNKg0PKA8oDygOKQ4pDikqDQ4pDikOAAEFKQ4pDg4pDikOKA8oDygPKCoNDikOKQ4AAQUqDSoNDikOKQ4pDikOKA8oKg4OKA8oDwABBCoNKg0OKQ4pDikOKQ4pDikpDg4oDygPAA0FAAAAAAAAAAAAAA",  # noqa: E501
+        ir_packets_manager.COMMAND_OFF: "JgA2ASoNKg0PKA8oDygOKQ4pDikOKQ4pDikOAAEEKg0qDQ8oDikOKSoNKg0qDSoNKQ4qDSnpKg0qDQ4pDikOKQ4pDikqDQ4pDikOKQ4AAQQpDikODikNKg0qDikNKikODCsMKw0qDAABBioMKw0OKQ4pDikOKQ4pKA8MKwwrDCsMAAEGKA8oDwwrDCsMKwwrDCsnEAwrDCsMKwwAAQYoDygPDCsMKwwrDCsMKycQDCsMKwwrDAABBigPKA8MKwwrDCsMKw4pKQ4OKQ4pDikOAAEEKg0qDQ4pDikOKQ4pDikpDg4pDikOKQ4AAQQqDSoNDikOKQ4pDygOKSkODikOKQ4pDgABBCoNKg0MKw4pDCsMKwwrKA8MKwwrDCsMAAEGKQ8oDw4oDygPKA8oDygqDQ4pDikOKQ4ADQUAAA==",  # noqa: E501
+        ir_packets_manager.COMMAND_LOW: "JgD0ACoNKg0OKQ4pDikOKQ4pDikOKQ4pDikOAAEEKg0qDQ4pDikOKSoNKg0qDSoNKQ4pDinpKg0qDQ4pDikOKSoNDikOKQ4pDikpDSrpKg0qDQ4pDikOKSoNDikOKQ4pDikpDinpKg0qDQ4pDikOKSoNDikOKQ4pDikpDinpKg4pDg0pDikOKSoNDikOKQ4pDikpDinpKg4pDQ4pDikOKSoNDikOKQ4pDikpDinpKg0qDQ4pDikOKSoNDikOKQ4pDikpDSrpKg0qDQ4pDikOKSoNDikOKQ4pDikpDSrpKg0qDQ4pDikOKSkODikOKQ4pDigqDSoADQUAAAAA",  # noqa: E501
+        ir_packets_manager.COMMAND_MEDIUM: "JgACASoNKg0OKQ4pDikOKQ4pDikOKQ4pDikOAAEEKg0qDQ4pDikOKSoNKg0qDSoNKQ4pDinpKg0qDQ4pDikOKQ4pDikOKQ4pKgwPKQ4AAQQqDSoLESgOKQ4pDikOKQ4pDikqDA8pDgABBCoNKg0PKA8oDikOKQ4pDikOKSkODikOAAEEKg0qDQ4pDikOKQ4pDikOKQ4pKQ4OKQ4AAQQqDSoNDikOKQ4pDikOKQ4pDikpDg4pDgABBCoNKg0OKQ4pDikOKQ4pDikOKSkODigPAAEEKg0qDQ4pDikOKQ4pDikOKQ4oKg0PKA8AAQQqDSoMDykOKQ4pDigPKA8oDygqDQ8oDgANBQAAAAAAAA==",  # noqa: E501
+        ir_packets_manager.COMMAND_HIGH: "JgD0ACoNKg0OKQ4pDikOKQ4pDikOKA8oDygPAAEEKg0qDQ4pDikOKSoNKg0qDSoNKQ4pDSrpKg0qDQ8oDikOKQ4pDikOKQ4pDikOKSroKA8pDg0qDCsMKwwrDCsMKwwrDCsMKyjrJxAnEA4pDikMKw0qDigPKA4pDSoOKSrpKg0pDg4pDikOKQ4pDygOKQ4pDikOKSnpKg0qDQ4pDikPKA4pDikOKQ8oDikOKSnqKQ4pDQ4pDSoOKQ8oDikOKQ4pDygOKSrpJxApDQ0rDSkOKQwrDCsMKwwrDCsMKyjrKQ4pDg4pDigPKA8oDygPKA8oDygPKCoADQUAAAAA",  # noqa: E501
+        ir_packets_manager.COMMAND_TIMER_1H: "JgA2ASoNKg0OKQ4pDSoNKg4pDigPKA4pDygOAAEFKA8pDgwrDCsMKycQJxAnECcPKA8oDyrpKg0oDwwrDCsMKwwrJxAMKwwrDCsMKwwAAQYoDygPDCsMKwwrDCsoDwwrDCsMKwwrDAABBycQJxAMKwwqDSoNKigPDCsOKQwrDCsMAAEHKA8nEAwrDCsMKw4pJxAOKQwrDCsMKg8AAQQoDygPDCsMKwwrDikoDwwrDCsMKw4pDAABBioNKA8NKg4pDCsMKygPDCsMKwwrDCsMAAEHJxAnEAwrDCsMKwwrJw8NKg0qDSoOKQ4AAQUpDikMDyoNKg0qDikoDBEpDikOKQ4oDwABBCoLLA0OKQ4pDikOKSoNDikOKQ4pDikOAAEEKg0qDQ8oDygOKQ4pKg0OKQ4pDikOKQ4ADQUAAA==",  # noqa: E501
+        ir_packets_manager.COMMAND_TIMER_3H: "JgA2AScQJxAMKwwrDSoOKA8oDygOKQ4pDCsMAAEHKA8oDwwrDCsMKycQJxAnECcQJw8oDyjrKA8oDwwrDCsMKygPDCsMKwwrJxAnEAwAAQYoDygPDCsMKwwrKA8MKwwrDCsoDygPDAABBycQKQ4MKwwrDCooDw0qDSoMKygPKg0MAAEHKg0pDg4pDikOKSkODikOKQ4pKQ4pDgwAAQYqDSoNDikMKwwrKA8OKQ4pDikpDigPDgABBSkOKQ4MKw4oDikqDQ0qDikOKSgPKg0MAAEHKQ4oDw4pDikOKSkODikOKQ0qKQ0oDw4AAQUpDioNDCsOKQ4pKQ4OKQ4pDikpDikODgABBCoNKg0MKw4pDikqDQwrDCsOKScQJxAMAAEGKA8oDwwrDCsMKygPDCsMKwwrJxAnEAwADQUAAA==",  # noqa: E501
+        ir_packets_manager.COMMAND_TIMER_6H: "JgBqASgPKA8NKgwrDCsMKwwrDCsMKwwrDCsMAAEHJxAoDwwqDCsNKikOKA8oDygPKQ4oDyjrJxAnEAwqDSoOKQ4pDCsMKw0qDSopDgwAAQcnECcQDSoMKwwrDSkOKQwrDCsNKigPDAABBykOKQ4MKw4pDSoMKwwqDikOKQwrKQ4MAAEHKA8nEAwrDCsMKwwrDCsMKwwrDCooDw0AAQYoDygPDSoMKwwrDCsOKQ0qDSoNKigPDgABBCoNKg0PKA8oDikOKQ4pDikOKQ4pKg0OAAEEKg4pDg4oDygPKA8oDygPKA8oDikqDQ4AAQUqDCsMDykOKQ4oDygPKA8oDygPKCoNDwABBCoNKg0OKQ4pDikOKQ4pDigPKA8oKg0PAAEEKg0qDQ4pDikOKQ4pDikOKQ4pDikpDg4AAQQqDSoLECkOKQ4pDikOKQ4pDikOKSkODgABBCoNKg0PKA4pDikOKQ4pDikOKQ4pKQ4OAA0FAAAAAAAAAAAAAAAAAAA=",  # noqa: E501
+    }
+
+
+def get_ir_dict_elco_small() -> Dict:
+    """Use to create a dictionary for the elco small ac ir packets."""
+    return {
+        ir_packets_manager.MODE_OFF: "JgDKAJCMFzQSERM0EjQUEBMQEzQTEBMREjQVDxIREzQTMxMREjUSERI1EjQTNBM0ERISNRE2EDYRExATERIRExA2ERMQExE2EDcSNBQQEhESERMREhESEhATEBMRNhA3EDYRNhE2EKyPkhA2ERMQNhE2EBMRExA2ERMQExE2EBMRExA2ETYREhE2ERMQNhE2EDcQNhETEDYRNhE2EBMRExATERIRNhESERMQNxA2ETYREhETEBMREhETEBMSEhIREDcSNBE2ETYSNRIADQUAAAAAAAAAAAAAAAAAAA",  # noqa: E501
+        ir_packets_manager.MODE_PANEL_LIGHT_TOGGLE: "JgDKAI6SEDcQExE2EDYRExA3EBMQNhISETYQExMREDYRExA2ERMQNhE2ETYQNhISEDcQExA3EBMREhETEBMRNhATETYQExE2EBMRNhESERMQNhETEDYRExA3EBMQNxE1ERMQNhETEqqPkRE2ERMQNhE2EBMRNhATEzQREhE2ERMQExA3EBMRNhATEjUQNhE2ETYREhE2ERIRNhIRERMREhISETURExA2ERMRNRETETUSEg8UFTIQExE2ERITNBESEjURNhATETYSEREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+        ir_packets_manager.MODE_VERTICAL_BLINDS_TOGGLE: "JgDKAI+SEjQTERI0EzQTERIREzQSERMQEzQTEBMREjQTNBMREjQTERI0EzQTEBM0ExATNBM0EjUSERIREjUSERI1EhIREhE0EzUSNRIREhIREhIREhIQExIREhIQNhI1EjURNhA2EayOkhE2EBMRNhA2ERMQExE2EBMSEhI0ExESERI1EjUTEBI1ExATMxM0ExESNBMREjUSMxQ0EhETERI0ExESNRIREhETNBI1EjQTERIREhETERIRExESERIREzQSNRI0EzQTNBIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+        ir_packets_manager.MODE_COOL: {
+            ir_packets_manager.SPEED_LOW: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI6SEDcQExE2EDYRExATETYQExETEjQRExATETYQNhETEDcQNhETEBMRNhA3EDYRNhE2EBMRNhI0ExEQExISEhESERISEhESERMREhESERETEhERMxU1EjUTMxM0EjUTMxM0EquOkhA2ERMSNRI0ExEQExE2EhESERM0ExESERI1EjQRExI0ETYSEhATEDcSNBM0EjUSNBMREjUSNBETEhEREhETEBMSEhIREhEREhETEBMRExATEDcQNhE2ETYQNRI2ETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAI6SEDYSEhA2EjQTEhESEjUREhIREjQTERISEDYSNRMRETUSNRIREhIRNRI1EzQTNBI0ExESNBM0ExATERESExESERMQExESERI1EhETEBMREhETNBI0EzQVDxI0EzQTNBI0E6qOkhM0ExATNBM0EhETEBM0ExATERI0ExESERM0EzMTERI0EzQTERIREzQSNBM0EzQTNBIREjURNRMREhETEBMREhESEhESEhESNRMQExESERMQEjUSNRI1EhERNhE1EzQSNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI+REzQREhI1ETYQExISEDYRExATEDcSERESETYRNhATETYSNRATEBMRNhA3EDYRNhA3ERIRNhA2EhIQExETERIREhISEBMQNxA2ERMQExESERMQNhE2ERIRExIzEjYRNhA3EKyOkhI1EBMRNhA3EBMSERE2ERISEhA2FBAQExI1EDcQExA3EDYTERATETYQNhE2ETYRNhATEDcQNhETEBMREhETEBMRExATETYRNRETEBMREhETEDYRNhISEBMQNxA2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI+RETYRExE1ETYREhETETURExATEjUREhETEDYSNRATETYRNhESERMSNBI1EDcRNRE2ERIRNhE2EBMRExATERIREw8UERIRNhESEhIQExESERMQNhE2ERMRNRI1ETYTMxE2EayOkhA3EBMQNxA2ERMREhE2EBMRExI0ERMQExE2EDYRExA2EjUREhETEDcSNBI1EDcRNRETETUSNRESERMQExETEBMQExETEDYSEhATERIRExATETYQNxESEDcQNhI1ETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI+SEDYRExA2ETYREhETEDYRExATETYQExETEDYRNhESETYRNhATERMQNhE2EDcQNhE2ERIRNhE2EBMRExATEBMRExATETYQNhETEBMREhETEBMRNhATERMQNhE2ETYQNhE2EayOkhA2ERMQNxA2ERMQExA3EBMQExE2ERIRExA2ETYRExA2ETYQExETEDYRNhE2EDYRNhESETYRNhATERMQExIRERMQExI1EDYRExATERMQExATETYQExETEDYSNRE2EjQRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDKAI6SETYREhI1ETYQExESEjUREhISEDcSERATETYRNhATETYQNxATEBMRNhA3EDYSNRE2EBMRNhA3EBMQExETEBMREhETEDYSNRE2ERIRExATERIRNhESEhIQExE2ETYQNhE2EK2OkhE1EhIQNhE2ERIRExA3ERIQExE2ERIRExA2ETYREhE2ETYQExETETUSNRE2ETUSNRMRETUTNBATERMQExESERMQExE2EDcQNhISEBMREhETEDYRExATERIRNhE2EDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAJGPEzQSERM0EjQTERMQEzQTEBMREjQTERIREzQTNBIREzQSNBMREhETNBI0EzQTNBM0EhETNBI0ExESERMREhETEBMREjQTERI0ExESERMQExESNBMREzMTERM0EjQTNBM0EqqRjxM0ExATNBM0ExATERI0ExESERM0EhETEBM0EzQTEBM0EzIUERMQEzQTNBMzEzQTNBMQEzQTNBIRExATERMQExESERMzExETNBIRExATERIREzQSERM0ExATNBM0EjQTNBMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAI6SEjUREhE2ETYREhIREjUREhETEDYSEhATEjUSNRATETYQNhETEBMRNhA3EDYSNRE2ERIRNhE2ERIQExETDxQQExETETUSEhATEhERExESExEQNhETEDYRNhE2ETURNhE2EauPkRE2ERISNRE2EBMUEBA2ERMQExE2ERIREhE2ETYREhE2ETYREhATETYRNhA2ETYTNBESEjURNhATEBMSEhATERIQFBA2EhIQExESEhIQExISEDYSEhE1EjURNhA2ETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI+REjUREhE2ETYQExETEDYRExATETYQExESETYSNRATEjUQNxATERISNRE2EjQTNBE2ERIRNhA3EBMQExETERISERE2EjUQExESERMQExISEBMQExMREDYRNhE2EDYSNRE2EKyPkhI0ERMQNhE2ERISEhE1ERMQExE2EBMRExA2ETYREhE2ETYREhETETURNhA3EDYTNBESETYRNhATERMQExATERMRNRE2ERIRExATERMREhESERMQExA3EDYRNhI1EDYRNhMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDKAI6SEjUQExE2EDcQExATETYQExETEDYRExATETYQNhETEDcQNhISEBMRNhA2ETYRNhA3EBMRNhA2ERMQExMREBMQExE2ETYQExE2EBMRExATEBMRExATEDcQExA3EDYRNhE2EKyPkRE2ERMQNhE2ERIRExA2ERMQExE2EBMRExA0EzYREhE2ETYQExETEDYSNRA3EDYRNhESETYRNhATERMQExATERMQNhE2ERITNBETEBMQExETEBMQExE2EBMRNhE2EDYSNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAI+SEDYRExA2ETYRExATEDcQExATETYREhETEDYRNhETEDYRNhATERMQNhE2ETYQNhE2ERMQNhE2EBMRExATERIRExA3EBMQExE2EBMRExATEBMRExA2ETYREhE2ETYQNxA2EayOkhE2EBMRNhA2ERMQExE2EhERExE1ERMQExE2EDcQExA3EDYRExATETYQNhI1ETYQNxATETYQNhETEBMRExATEBMRNhESERMQNhETEBMRExATEBMRNhE2EBMSNRA3EDYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAJCQEjQTERI0EzQTERIREjQTERMQEzQTEBMREjQTNBMREjQTNBMQExESNBM0EzQSNBM0ExESNBM0ExATERIRExATERI0ExESERMREhESERMREhETEBM0EzQSNBM0EzQSNBM0E6qQkBI1EhESNBM0ExESERM0EhETEBM0ExATERI0EzQTERI0EzQTEBMREjQTNBM0EzMTNBMREjQTNBMQExESERMREhETNBIRExATERIRExATERIRExATNBM0EjUSNBM0EzQSNBMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAI6SEDcSERA3EjQTERIRETYQExIREzQRExIREjQTNBETEDYRNhISEBMSNRE1EzQSNRI0ERMSNBM0EhISERIRERMSERA3EBMSNRIREhETERATERIRExA2ExEQNxA2ETYSNRA2E6qOkhE2EhERNhA3EBMSERE2EBMRExA2ERMQExE2EDcQExA3EDYRExATETYQNhE2ETYQNxATEDcQNhETEBMQExETEBMRNBITETYQExETEBMQExETEBMRNhATETYQNxA2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDKAI6SEjUQExA3EjQRExATETYSERISEjQRExIREDcQNhETEjQTNBETEhEQNxI0ETYSNRA2ExESNBM0EhISERIRERMQExE2EhERNhA3EBMQExISEhESERI1ERITERI0ETYSNRI1EKyOkhM0ERIRNhI1EBMSEhI0ERMQExA3EhESERE2EjUQExI1EDcQExIRETYSNRA3EjQSNRIRETYSNRATEhISERIRERMQNhETEDYRNhIRERMQExISEhEQNxIREBMRNhIzEjYRNhIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_MEDIUM: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI+SEjQSEhI0EzQREhMREjQTERATEjUSERETEDYTNBIREzQSEhA2EhISNBM0EjUSNBM0EjUSERIwFRMRExIRERMQExIREhIQExIRERMSERIRExEQNhM0EjUQNxA2ETYSNRA2EayOkhE2EBMSNRA3EBMQExM0ERIRExI1EhEQExE2EjUSERA3EhEQNxATETYQNxI0EjUSNRA2ERMQNxATEhERExATEBMRExATERIRExATERMQExATETYSNRA2ETYRNhA3EDYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAI+SEDYRExA2ETYREhETEDcQExATETYQExETEDYRNhETEDYRExA2ERMQNhE2EDcQNhE2ETYQExE2EBMRExATERIRExATERIRExA2ERMQExETEBMQNxA2ETYRExA2ETQSNxA2EayOkhA3EBMRNhA3EBMQExE2EBMRExA2ERMQExE2EDYRExA3EBMQNxATEDcQNhE2ETYQNxA2ERMQNhETEBMREhETEBMREhETEBMRNhATERMQExATETYQNxA2ERMQNxA2ETYQNRIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI+RETYSERE2EjUQExISEjQSEhATEDcQExESETYRNhIREzQTEBM0ExATNBM0EzQSNBM0EzQSERM0EhETEBMREhETERIRExATNBM0EhETEBMREhETNBI0ExESERM0EzQSNBM0E6qQkBI0ExESNBM0ExESERM0EhETEBM0ExESERM0EjQTERI0ExESNBMREjQTNBM0EzQSNBM0ExATNBMQExESERMQEhIQExIRETYRNhATERMQExATETYSNRATEhISNBM0EjUSNBIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI6SEDYSEhI0ETYSEhATEDYRExATETYSERISEDYTNBESEzQSEhA2ERMSNBE2EjUQNhE2EDcSERE2EhERExATEBMRExATEBMRNhIRERMQExESExEQNhM0EhIQNhE2EDcSNBM0EquOkhI0ERMQNhE2ERMQExA3EBMQExE2EBMRExA2ETYREhE2ERMQNhETEDYRNhA3EDYRNhE2EBMRNhATERMQExATERMQExATETYQExETEBMREhETEDcQNhETEDYRNhA3EDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI6SEjUQExI1EjQRExATEjUSERESEzQSERMREjUSNBMREjMTEhA2EhISNBE2EjUSNRE1EjUSERE2EhERExATEhETERATETYQNxIREBMRExATEBMRNhESERMQNhE2ETYQNxA1EqyOkhA3EBMQNxA2ERMQExE2EBMRExA2ERMQExA3EDUSExA2ERMQNxATEDcQNhE2EDcQNhE2ERIRNhETEBMQExETEBMQExE2EDcQExESERMSERESETYRExATEDcQNhI1EDcQNhMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDKAI6SEDYRExA2ETYRExATEDcQExATETYQExETEDYRNhETEDYRExA2ERMQNhEzFDYQNhE2ETYQExE2EBMRExATEBMRExATEDcQNhE2ERMQExATERMQNhETEBMQExE2ETYQNhE2EayOkhA2ERMQNxA2ERMQExA3EBMQExE2EBMRExA2ETYRExA2ERMQNhETEDYRNhA3EDYRNhE2EBMRNhATERMQExATERMQExA3EDYRNhESERMQExETEDYRExATEBMRNhA3EDYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAI6SETYQExE2ETYQExESETYRExATETYQExATETYQNxATETYQExE2EBMRNhA3EDYRNhA3EDYRExA3EBMQExETEBMQExETETUTERA2ERMQExETEBMQNxATEDcREhE2EDcQNhI1EK2NkxA2EhIQNhE2ERMQExA3EBMQExE2EBMRExA2ETYRExE1ERMRNRETETURNhE2EDYRNhE2ERIRNhESEhIQExESERMREhI1ERIRNhESEhIPFBATETYSEhA2ERMQNhE2EDcRNRIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAI6SEjUSERE2EjQTERIRETYSERISEDYTERATEjUSNBETEDYTERA2ExESNBM0EjIVNRI0ETYREhM0EhETERIREhIQExIRETYQExMREhESERMREBMSNRIREjURNRM0EjUQNhM0E6qOkhE2EBMSNRI0ExEQExI1EhESERM0EhISERI1EjQSEhA2ExESMxITEDYRNhE2EDcSNBM0EhERNhIRERMSERIRExESERE2EhESEhIREhESEhIREDcSERE2EDYTNBI1EDcQNhIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI6SEjUSERE2EjUSERIRETMVERETEjQTERIREjUSNRATEjQRExA3EBMQNxI0EzQSNRI0EzQTEBM0EhISERATEhISERI1EjQTERIREhETERIRERITERATEjUSNRI0EzQSNRI0E6qOkhI1EhESNRI0ExESERE2EhESEhMzExESERA3EjQTERI0ExEQNhMREjQRNhI1EDYUMxI1ERITNBIRERMSERETEhESNRI0ERMSERIRExESERESExESERI1EjUSNBE2EDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDKAI6SETYSERI1EjUSERATEjUSERMREjQTERIREjMSNxATETYQExE2EBMRNhA3EDYRNhA3EDYRExA2EhIQExETEBMQExE2EDcQExE2EBMREhETEBMRExATEDcQExA3EDYRNBM2EKyPkRE2ERIRNhE2EBMRExA2ERMQExE2ERIREhI1ETYQExE2EBMRNhATETYRNhA3EDYRNhA3EBMQNxATEBMRExATEBMRNhE2EBMRNhATERMQExATERMQExA3EBMRNhA2EjURNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAI+SEDYRExA2ETYREhETEDUSExATETYQExETEDcQNhETEDYRExA2ERMQNxA2ETYQNxA1EjYRExA2ERMQExATERMQExA3EBMQExE2ERMQExATERMQExA3EDYRExA2ETUSNhA3EKyOkhE2EBMRNhA3EBMREhE2ERIRExA3EBMQExE2EDcQExA3EBMQNxATETYQNxA2ETYQNxA2ERMQNhISEBMRExATEBMRNhATERMQNhETEBMRExATEBMRNhA3EBMQNhE2ETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAI+SEjQTERI0ETYSERMREjQUEBIREjUQExISEjQTNBATEzQSEhI0EhIQNRQ0EjUSNBE2EjMUERE2EBMRExATEBMRExA2ERMQExETEBMQExETEBMQExE2EDcQNhE2ETYQNhE2EayOkhA3EBMQNxA2ERMQExE2ERIREhE2ERMQExA3EDYRExA2ERMQNhETEDYRNhE2EDcQNhE2EBMRNhESERMQExETEBMQNxIREhERExIREhETERATERIRNhI1EjUSMxI2EDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAI6SETYQExE2EDcQExATETYREhETEDYRExATETYQNxATEDcQExA3EBMQNxA2ETYRNhA2ETYRExA2ERMQExATERMQExE2EBMRNhATERMQExATERMQExA3EBMQNxA2ETYSNRI1EqqOkhI1EhESNRA3EBMQExE2EhERExA2ERMQExE2EDYRExA3EBMQNxIREDYRNhI1ETYQNRM1EhIQNhETEBMREhETEBMUMxATEDcQExESERMQExETEBMRNRISEDcSNBM0EDcRNRIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDKAI6SEDYRExA2ETYRExATEDcQExATETYQExETEDYRNhETEDYRExA2ERMQNhE2EDcQNhE2ETYQExE2EBMRExATEBMRExA2ERMQNhE2ERIRExATERMQExA3EBMQExE2ETYRNRE2EayOkhI0FBASNRI0ExESERI1EBMSERM0ExAUEBI0EzQTERI0EhISNBMREjQRNhI1EjMUNBI1EhESNRIREhISERIRExEQNhETEjQTNBETEhESERMREBMSNRIREhETNBI1EjQTNBMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_HIGH: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI6SETYQExE2EDcQExATETYREhETEDcQExATETYQNxATEDcQExATETYRNhA3EDYRNhA3EDYRNhATERMQExESERMQExESERMQExETEBMQExETEBMQNxA2ETYRNhA2ETYRNhA3EKyOkhE2EBMRNhA3EBMREhE2ERMQExA3EBMQExE2EDcQExA3EBMREhE2ETYQNxA2ETYQNxA2ETYREhETEBMREhETEBMRExATEBMRExATEBMRExATETYQNhE2ETYQNxA2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAJCQEzQSERI1ETUSEhESEjUQExETEDYRExATEDcQNhETEjQTERATEjUSNRI0EjUQNxA2ETYRNhATERMQExATERMQExATERMQExA3EBMREhETERIRNhA3EDYRExA2ETYRNRI2EKyOkhE2EBMRNhA3EBMREhE2ERISEhA3ERIQExI1EjUQExA3EBMQExI1ETYSNBI1EjUSNRA2ETYREhISEBMRExESEBMSEhATERISNRIRERMQExIREjURNhA3EBMQNxE1EDcRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI6SEDcQExA3EDYRExATETYSERETEDYSEhESEDcQNhETEDYSEhATEjUQNxE1EjURNhA2ETYRNhATEhIQExATEBQREhESERMPNxM0EhERExESERMPNxE2EBMRExA2ETYRNhI0EquOkhA3ERIRNhE1ERMQExI1EBMSEhA2ERMQExE2EzMSEhA2ERMREhE2ETYRNRE2ETYRNRI1EzQREhETEBMQExETEBMQExETEDYSNRESERMQExESEzQRNhESERMQNhE2EDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI6SEjUQExI1EjUSERATEzQTEBMREjUSERATEzQRNhIRETYSERMREjQTNBI1EjQTNBI1EjUSNBMREhESERMREhESERETEhESNRIRExESERATExESNBM0ERITNBI1EjUSNBM0E6mPkhI0FBASNBMyExITERI1EhESERI1EhERExA2EzQSERM0EhISERI1EDYTNBI1EDYRNhIzEjcSERATERMQExATERMQExATETYREhETEBMREhETEDcQNhETEDYRNhA3EDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI6SEjUSERI1EjQTERIREjUSERISEjQRExATEjUSNBETEDcQExIRETYSNRI0EjUSNRA3EjQSNRIRExESERISEhEQExETEjQTNBATEhIQExIRExESNBMREBMSNRI1EjQSNRI1EqqPkRM0EhETNBI1EhESEhI0ERMQExA3ExASERM0EzQQExI1EhESEhI0ETYSNRI0ETYRNhA3EDYRExATEBMRExATEBMRExA2ETYREhETEBMREhETEDcQExATETYQNxA2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDKAI6SEDcQExI1EjQSEhIREjUQExETEjQTERIREjUSNBQQEzMTERIREjUSNRA2ETYRNhA2ETYRNhATERMQExATERMQExESETYRNhA3EBMQExETEBMQNxATERIRExI0ETYRNhA3EauOkhI1EBMRNhE2EBMRExA2ERMQExA3ERIQExI1EDcREhE2ERIRExA2EjURNhE1EjUSNRA3ETURExATEBMRExIRERMPFBA3ETUSNRESEhIREhIREjURExATEBMSNRA3EDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAI6SEDYRExA2ETYRExATEDcQExATEjUQExISETURNhESETYRExATEDcRNRI1ETYQNhE2ETYQNhETEBMRExATEBMSEhATEDcQExUyEBMRExATEBMSNRMQETYREhE2EDQTNhE2EauPkhE1ERMQNxA2EhIQExE2EhEQExM0ERIQFBE1ETYQFBA2EBQQExI1EDYSNRA3EDcQNhE2ETYQExESEhIQExESERMQExE2ERIRNhESERMQExMQETYSERE2EBMSNRE2EDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAI6QEzQSExE1ETYSEhATETYREhATETYQExETEDcRNRISEjQSEhATETYRNRI1ETYQNxE1ETYQNxATEBMRExESERMREhATEDcREhETDxQQExISEBMRNg8UETYQNxI0EjUQNxE1EquOkRE3ERIQNxE1ERMQExA3EBMREw83EhIQExA3ETURExA3EBMQExI1EDcQNhI1ETYQNhE2ETYQExETEBMREhETEBMREhI1ERIRExATERISEhESETYQExE2ETYQNhI1EDcRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI6SEjUQExE2EDcSERATETYREhMREDcQExATETYQNhETEDcSERESETYRNhE2EDYRNhI1EjQRNhISEhESERETEBMQExE2EjUQExISEhESERISEBMSERETEjQTNBE2EjUSNBE2EKyPkhA2ERMQNhE2ERMQExA3EBMQExE2ERIRExA2ETYRExA2ERMQExE2EDYRNhE2EDUSNhE2ETYQExESEhIQExISEBMQNxA2ERMQExETERIQExETEBMQExE2EjURNRE2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDKAI6SETYQExE2EDcQExATETYQExETEDYRExATETYQNxATEDcREhATEjURNhA2EjUSNRE2EDYRNhIREhIREhIREhIREhI1ETYREhE2ERIREhISERIREhETETUSEhE1EjURNhE2EauQkBI1ERISNRA3ERIREhI1EhESEhE1ERMREhE2ETYQExE2EBMQExI1ETYQNhI1EjUQNhE2ETYQExETEBMQExETEBMQNxA2ERMQNhETEBMRExATEBMRExA2ERMQNhE2ETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAI+RETYQFBE1ETYUDxISEDYREw8UEjUQExETETURNhESETYRExATEzQRNRI1EDcQNhI1ETYRNRISERIRExESEBMQFBA2ERMQExE2EBMQExMRERISEhE1ETYREhE2EDcQNhI1EquNkxA2ERMQNxA2ERMQExA3EBMQExE2ERIRExA3EDYRExA2ERMREhA3EDYRNhE2EDcQNhI1EDcREhESEhISERESEBQQNhETEBMSNRATEhIPFBATERMRNRI1EhIQNhE2ETYRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAI6SETYREhE2ETURExATETYWDRETETUSEhESETYQNhUPEDYSEhATEjURNhA2EjUQNxA2EzQRNhESEhEQFBESERMQExA3EhEQExETEBMTEBETEBMQExE2ETYRNRI1EjUQNxA2EayOkhA3EBMPNxI1ERMQExE2EBMREhE2EBMRExA2ETYSEhE1EhIQExE2ETURNhE2EDYRNhE2ETUSEhATERMREhESERMRNRISEBMQExETEBMQExETEBMRNRE2ETYRNhA2ETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAI6QFDUQExA3EDYSEhATETYQExETEDYRExATEDcQNhETEDYRExATEDYRNhE2ETYQNhE2ETYQNxATEBMRExATEBMRExE1ERMQNhETEBMQExETEBMRExA2ERMQNhE2ETYQNhE2E6qOkRI1ERMQNhI1EBMRExA2EhIQExE2ERIREhE2EjUREhE2ERISEhE1EDcQNxE1ETYQNxA2EjUREhETEBMREhETERIRNhESEjUQExETERIQExETERIQNxESETYRNRE2EzQQNxEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDKAI+REzQRExA2EjUSERISEjQTERATEjUSERESEzQRNhIREzQTEBMREjQTNBM0EjQTNBI1EjMUNBMREhESERMREBMSERM0ExATNBI1EhETERATEhERExI0EhISERE2EDYRNhE2EKyPkRE2ERMQNhE2EBMRExA2ERMQExA3EBMREhE2ETYQExE2EBMRExA2ETYRNhA2ETYRNhA3EDYRExATEBMRExIREhETNBIREzQSNRATERMSERATExEQNhMREhESNRI0ETYSNRAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_AUTO: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI+RETYQExE2EDcQExESETYREhETEDYRExATETYQNxATEDcQNhETEDYRNhA3EDYRNhE2EBMRNhATERIRExATERMSERATERIRExATEhISERIRERMQNhE2EDcSNBI1EjUSNBM0EquOkhI0ERMQNhM0ERISEhA2ERMQExE2EBMSERM0EjUQExI1EDcQExA3EDYRNhA3EDYRNhESETYREhMREBMRExATEBMRExATEBMRExIREhERExIREDcQNhE2EjUSNBE2ETYSNBMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAI+RETYRExA2ETYQExETEDYRExATETYQExESETYRNhATETYQNxESEDcQNhE2EDcQNhE2ERIRNhETEBMQExETEBMQExETEBMQExE2EBMRExATERIRNhE2EDcQExA3EDYRNhE2EKyPkRE2EBMRNhE2EBMRExA2ERMQExA3EBMQExE2EDcQExE2EDYRExA3EDYRNhA3EDYRNhATETYREhETEBMRExATEBMRExATEBMRNhESERMQExESETYRNhA3EBMQNxA2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI6SETYQExE0EjcQExATETYQExETEDYRExATEDcQNhETEDYRNhETEDYRNhA3EDYRNhI1EBMRNhIRERMQExATERMQExIRExEQNhE2EhISERATEhIQMxQ2EBMTERI0ETYQNxI0E6qOkhM0EhESNRI0ExESERI1EhESERM0ERIRExA3EjQRExA2ETYQExE2EDcQNhE2ETYQNxATEDcQExATERMQExATERMQExATETYRNhATERMQExATETYQNxATEBMRNhA3EDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI6SEjQTERI1EzMTERATEjUSERIREzQSERMREjUQNhISEjQSMxQRETYQNxA2ETYRNhA3EBMQNxATEBMRExATEBMRExATEBMRNhESERMQExESEhIQNRI2ExEQNhE2EDYRNhE2EK2OkRE2ERMQNhE2EBMRExA2ERMREhA3EBMQExE2EDcQExE2EDYRExA2ETYSNRE2EDYRNhATETYREhETERIQExETEBMRExESETYQExIREBQPFBESETYQNxATEDcSNBI1ETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI6SEjUQExI1EjUQExIREzQSERETEjQRExIREjUSNRIREDcQNhETEDYRNhE2EDcQNhE2EBMRNRETERMQExESERMQExETEDYRNhATERMQExATERMQNhETEBMRNhA2ETYRNhI1EqqOkhE2EBMRNhA3EBMREhIzExIRExA3EBMQExE2EDcQExA3ETURExA2EzQRNhA3EDYRNhATETYQExETEBMQExETEBMSERE2ETYQExETERIQExISEDYRExATEDcQNhI1EDcRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDKAI6SEjUQExE2EDcQExESETYRExATEDcQExATETYQNxATEDcSNBMREDYTNBI1EjUTMxM0EhESNRIRExESERETEBMQExESETYRNhA3EBMQExETEBMQNxATERIRExA1EjYRNhA3EKyOkRI2EBMRNhI1EBMQExI1ERIRExE1ERMQExE2EDcREhA3EDYRExA1EjYRNhA2ETYRNhATETYQExMREBMQExETEBMREhE2ETYQNxESEBMRExESEDcQExATEhIQNhE2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAI6SEDcQExA3EDYRExATETYQExETEDYRExATEDcQNhETEDcQNhETEDYSNRI1EjQTNBI1EhESNRIRERMQExATERMQExATETYQExE2ERIRExATERMQNhETEDYSEhA2ETYQNxA2EquOkhA3EBMQNxA2EhIPFBA3EBMRExA2ERMQExA3ETUSEhMzETYREhE2EjUTNBA2EjUQNxATEDcSERESERMREhESERMQExI1ERIRNhESERMREhESETYQExE2ERIRNhE2EDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAJCQETYSERE2ETUSEhATEjUQExETEDYRExATEDcQNxATEDcQNhMREjQTNBI1EDcQNhE2EBMRNhATERMQExESERMQExETEDYRExATEBMRExATEBMRNhESETYRNhA3EDYRNhA3EKyOkhE2EBMRNhE2EBMREhE2ERMQExAyFRMQExE2EDcQExA3ETURExA3EDYRNhE2ETURNhESETYREhETEBMRExATEBMRExA2ERMQExATERMREhESETYREhI1ETYQNxA2ETYQNxEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI6SEjUQExE2EDcSERATETYQExISEDYTERIREjURNhIRETYQNhMREDcQNhE2EDcSMhM2EBMRNhESERMQExETEBMQExE2EDcQExATERMQExATERMQExETEDYRNhA3EDYRNhA3EKyOkhE2EBMRNhA3EBMREhE2ERIRExA2ERMQExE2EDcQExA3EDYRExA2ETYRNhA3EDYRNhATETYQExETEBMREhETEBMRNhA3EBMQExETEBMQExETEBMQExE2EDcQNhE2ETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDKAI6SEjUREhE2EDYTERIREzQSERETEjQTERIREjUSNBMREjQUMxISEjQSNRA3EjQTNBIzEhMTNBMQExESERIRExEQExI1EjQTERI1EhESERISEhEQExMREjQTERA2EzQRNhI1EqqOkhE2EBMRNhA3EBMQExE2EBMRExA2ERMQExE2EDYRExA3EDYRExA2ETYQNxA2EjURNhATETYQExETERIQExISEBMRNhE1ERMQNxATERIRExESEBMRExA2ERMRNRI1ETYRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAI6SEDcQExA3EDYRExATETYQExETEDYRExATEDcQNhETEjQRNhATETYRNRE3EDQTNhA2ERMQNxATERIRExATERMQExA0ExMSERE2EBMRExATEBMSEhE1ETYRExA2ETYQNxA2EayOkBI3EBMQNxA2ERMQExI1ERIRExA2ERMQExA3EDYRExA2ETYREhM0ETYQNxA2ETYQNxATEDcQExESERMQExESERMQNhETEBMRNhATERMQExATERMQNhE2EBMRNhE2EDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAJOPEzQSERM0EjQTERMQEzQTEBMREjQTERIREzQSNBMREzMTNBMREjQTNBM0EjQTNBM0EhETNBIRERMQExETEBMQExE2EBMSEhIREhETERIREhERExI0EzQRNhA3EDYRNhA3EKyPkRE2EBMRNhE2EBMRExA2ERMQExA3EBMREhE2ETYQExE2EDcQExA2ETYRNhA3EjQRNhETEDYRExATERISEhATEBMRNhESERMQExETEBMQExISEBMQNxA2ETYQNxA2ETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAI6SEDcQExI1EDcQExATETYSEhATEDcQExATETYSNRESEjUQNxESEDcPNxI1ETYQNhE2ERMRNRETERIREhETEBMQExE2EBMRNhATERMQExETEBMQExEyFBMRNhA3EDYRNhE2EKyPkRI1ERISNRE2EBMSEhE1EhIREhA3EBMREhE2EDcQExE2EDcQExA3ETUSNRE2EDYSNRETEjQQFBATEBMSEhESERIRNhESETYREhISEBMREhETERISNRATETYQNRI2EjMSNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDSAAkAAUIbAAI6jpISNBIREjUSNRMRERIQNxATERIRNhIREhIRNRI1EhIQNhI1ERISNRA3ETUSNRI1ETYQExE2ERIREhISERIRExATEDcQExA3ETURExATERMQExESETYREhETEDYRNhI1EDYRrI6SETYQExE2EDcQExATETUSEhETEDYRExATETYQNxATEDcQNhETEDYRNhE2EDcQNhE2EBMSNRATERMQExESERMQExE2EBMSNRA3EBMQExISERISERE2ERIRExE2ETURNhA3EAANBQAAAAAAAA==",  # noqa: E501
+            },
+        },
+        ir_packets_manager.MODE_HEAT: {
+            ir_packets_manager.SPEED_LOW: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI6SETYQExE2ETYQExETEDYREhETEDcQExATETYQNxESETYQNhETEBMSNRA3EDYRNhA0ExMQNxA2ERMQExETEBMQExETEBMQExETETURNhATERMQNhE2EjUQNxATERIRNhA3EKyOkhE2EBMRNhA1EhMREhE2ERIRExA3EBMQExI1EDcQExA3EDYRExATETYQNhE2ETYQNxATEDcQNhETEBMREhETERIREhETEBMSEhA2ETYQExETEDYRNhE2EDcQExATEjUQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAI6SEDcQExA3EDYRExATEDcQExETEDYREhETEDYRNhETEDYRNhATERMQNhE2ETYQNhE2ERMQNhE2EBMRExATEBMRExATEBMRExA2ETYRNhATERIRNhE2EDcQExATERMQNhE2EayOkhA2ERMQNRI2ERMQExA3EBMQExE2EBMRExA2ETYREhE2ETYQExETEDYRNhA3EDYRNhESETYRNBITERMQExIRERMQExIRERMQNhE2ETYQExETEDYRNhI1EhESERISEDYSNRIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI+RETYRExA2ETYQExETEDYRExATEzMRExISEDYRNhATEjURNhATEhIQNhI1FDMRNRE2ERIRNhI1EBMRExESERISEhATEBMSNRE2EDYRNhISERIQNxA2ERMQExATERMQNhE2EayOkhA2ERMQNhI0EhMQExA3EBMQExI1EBMRExA2EjUREhA3ETYREhETEDYRNhE2EDYRNhETEDYRNhATERMQExATEhIQExATETYRNhE1EzQRExESETYQNhETERIREhETETYQNhIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI6SETYQExE2ETYQExESETYQExETEDYRExATFDMQNhISETYQNhETFA8QNxA2ETYVMhE2EBMQNxE1ERMQExMQEBQREhESERMQNhISETYQNhETEBMQNxA2ERMQNhETDxQRNhA3EKyOkhE2EBMRNhA3EBMREhE2EBMRExcvERMSERE2ETUQFBA0EjcREw8UEDcRNRM0EDcSNBETEDYRNhISEBMQExETEBMQExETEDUSExA2ETYREhETEDYRNhETEDYRExATEDUSNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI6SEDYRExA0EzYRExATEDcQExAUEDYRExATEDcQNhETEDYRNhATERMQNxA2ETYQNxA1EhMQNhE2ERMQExATERMQExATETYQNxATEDcQNhETEBMRNhATERMQNhETEBMQNRI2EayOkhE2EBMRNhA3EBMQExE2ERIRExA3EBMQExE2EDcQExA3EDYRExATETYQNxA2ETYQNxATEDcQNhETEBMREhETEBMRExA2ETYQExE2ETYQExETEDYRExATEDcQExATETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDKAI6SETYQExE2EjUQExATETYSERISEDYTERIREzQSNRIREjUQNhETEBMRNhA3EDIVNhA3EBMRNhA2ERMQExETEBMQExETEDYRNhE2EDcQNhETEBMQNxESEBMRExATERMQNhE2EauPkhA2EhIRNRE2ERIRExA2EhISERE2EhESEhA2EzQREhI1EzQREhETEDYSNRYxEDYRNhESETYSNRATEhIREhATERMREhE2ETURNRI2EDcQExATETYQExETERIREhETETYPNxIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAJOQEjUSERM0ETQUERIREzQREhMRETUSEhESETYQNhETEDcQNhETEBMQNxA2ETYRNhA2ERMQNxI0ERMSERIRExESERIREzQSEhA2EzQSNRATEBMRNhESETYRExATEBMRNhA3EKyOkhE2EBMRNhE2EBMRExA2ERMQExA3EBMQExE2EDcQExE2EDcQExESETYQNxA2EjURNhESETYQNxATEBMRExESERIRExE1ERMRNRE2ETYQExAUETURExE1EBQQExESETYSNRAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAI6SETYREhE2EDcQExESEzQREhETETURExIRETYQNxESEDcRNRETEhERNhE1EzQRNhA3EBMRNhA2ERMQExATERMPFBESETYRExATEDcQNhISERIRNhATETYQNhISERIRNhA3EKyOkhE2EBMRNhE2ERITEBE2ERISEhA2EhIQExA3ETURExE1ETYRExESETYPNxE1ETcRNRETEDYSNRETEBMSERISERIREhE2EBMTERA2EjUREhISEDYSEhA3EDYQFBATEDcRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI6SEzQREhM0EDcSERATEDcREhETETURExATEjUQNxESEjUQNhISERIRNhA2EjUSNRA3EhEQNxE1EhIREhATERMQExE2ETUSEhATEjURNhESEBMSEhATEDcXLxETERIRNhE1EquOkhE2EBMSNQ83ExEQExE2EBMSEhA2EhIQExA3EjQRExA2ETYRExIRETYQNhE2EDcSNBETEDYRNhETEBMQExETEBMQNxA2ERMQExA3EDYRExATERIRExA3EDYRExESEDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDKAI6SEjUSERM0EjUQExIREzQSERMREjQTERIRETYSNRIREjUQNRITEBMQNxA2ETYRNhA3EBMQNxA2ERMQExATERMQExA3EDYRExA3EDYRNhATERMQExATETYSERETEBMSNRA3EauOkhE2EBMRNhE2EBMQExE2EBMRExA2ERMREhE2ETUSEhA2ETYQFBESEDcRNRQzETYRNRISEDYRNhETEBMREhETEBMPOBA2ERMQNhI1ETYREhIRERMQExE2EBMREhISETUSNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAI+QEjYREhI1EDcQExMRETURExATEDcREhESEzQRNhESETYQNxATEBMSNBI2EDYSNRE2ERIRNhE2ERIQExETDxQREhE2ERIRExE1EzQTNBESERMREhA3EDYRExATEhESNRE2EauOkhE2EBMRNhE2EBMRExA1EhMQExA3EBMQExE2EDcQExA3ETURExATEjUQNhE0EzYQNxATEDcQNhETERIQExETEBMRNhATERISNRE2EDcREhATERMQNhE2ERISEhATETYRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAI+REzQREhE2ETYQExETETURExATEDcQExESETYRNhESETYRNhESEBMRNhA3ETURNhA3ERIQNRQ0ERMQExESERMQExE2EBMRExATEDcQNhISEBMQExE2EDcQNhETEBMRNhE2EauOkhE2EBMTNBE1EhIQExE2ERIRExE1EhIQExA3ETURExA2ETYREhETEDcQNhE2EDcRNRETETURNhETERIQExETEBMQNxESEBMRExA2ETYSERETEBMRNhA3EDYRExATETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAJCSEjUTEBM0EjUSERMQETYREhMREjQUEBIREjUSNRESEjUSNBETEBMSNRI1EzMTNBI1EhESNRA2ExESERISEhEQExE2EhETNBIRETYRNhIREhIQExI1EhESNRATEBMRNhI1EKyPkRE2EBMRNhE2EBMRExA2ERMQExA3EBMQExE2EDcQExE2EDYTERATETYQNxA2ETYQNxATEDcQNhETEBMSERETEBMRNhATETYQExI1ETYQExESERMQNxATEDcQExESETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDKAI6SETYQExE2EjUQExATETYREhETEDcQExATETYQNxATEDcQNhETEBMRNhA2ETYRNhA3EBMQNxA2ERMQExETEBMQExE2EBMRNhA3ETURNhATERMQExE2EBMRExATERIRNhA3EKyOkhE2EhERNhA3ExAREhE2EhERExA3EBMQExE2EDcREhA3ETUTERESETYQNxE1EDcSNRIRETYRNRISEBMSEhATEBMTNBESETYRNhA2EjURExATDxQRNhATEhIQExATETYQNhMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_MEDIUM: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI+REzQREhE2ETYQExETEDYSEhATETYQExETEDYSNRIRETYSERI1EBMSNRI1EjQUMxI1EjUREhI1EhESERMREhEQExISEBMQExMREjQRNhIRERMQNhM0EjUQNhMREhERNhA3EqqOkhI1EhERNhA3ExASERI1ExATERI0ExESERI1EjQTERI1EhEQNxMQEjUSNBM0EjUSNBM0ERIRNRITEBMQExETEBMQExETEBMQExE2ETYQExESEjURNhA3EDYRExESETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAI6SEjUSERI1EzQSERIREzQQExMREDYUEBIREjUSNRIRETUTERA3EhESNRI0EzQSNRA3EzMTERI0ExESERETEhESERISEhEQExM0EjUQNhMREhESNRI1EjQTERMQEhETNBI0E6qPkRM0EhERNhI1EhESEhI0EhIQExI1EhESERMyFDUQExI1EhERNhIRETYSMxQ0EzQSNRA2ExESNRIREhESEhIREhETERIREBMRNhI1EjUSERIREzQSNRI0ExESERISEjQTNBIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI6SETYQExE2EDcQExATETQTExESETYQExATETYQNxATEDcREhA3EBMRNhA2ETYRNhE2ETUSEhE1ERMQExESERMQExESERMRNhE1ETYRNhESEBMQNxE2EBMRExATERISNRE2EauOkhE2EBMSNRE2ERIREhE2EBMRExA2ERMQExA3EDYTERE2EBMQNxATEDcPNxE2EDcRNRI1EhIRNRISERIQExETEBMREhETETURNhI1ETYQExESETYQNxESEBMRExESETYQNhIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI6SEDYRExA2EzQSERISEDYRExIREjUQExISEjQRNhIREjUQExM0EhETNBI1EjQTNBI1EDcQExI1EhESERMREBMSERMREhERNhIRETYSNRIREhESNBE3EhESNRIRERITNBE2EqqPkRM0EhETMBY1EBMSERE2EhISERI1EhESERM0EjUSERI1EhESNRATETYSNRI0EzMRNxI0ERMQNhMREhESERMREBMSERMREjQRExI1EjQSEhIREjUSNBETEjQRExIRETYSNRIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI+RETYRExA2ETQSExETEDYRExATETYQExETEDYRNhESETYREhE1EhMQNhE2EDcQNhE2ETYQExE2EBMRExATEBMRExATETYQNhETEDcQNhETEBMQNxATERIRNhETEBMQNxA2EayOkhI1ExASNRI0ExEQExE2EBMRExA2EhIQExA3EDYRExA2ERMQNxATEDcQNhI1ETYQNhE2EhIQNhETEBMQExETEBMQExE2EjUQExE2EDcQExATETYQExETDzcRExATETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDKAI+SEDYRExE1ETYREhETEDcQExATETYQExETEDYRNhESETYRExA2EhIQNhE2ETYRNRE2ETYREhE2ERIRExATEBMRExESEDcQNhI1EjURNhESEhERNhESEhIQExESERMQNxE1EayOkhE0FBEQNw83EhIREhA3DxQREhE2ERIRExA2EjUSEhA2ERMRNRISETURNhA3ETUSNRE2EBMSNRATERMREhESERMQExI1ETYQNhI1EDcREhESETYRExATEBMRExATEDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAI6SETYQExE2EDcQExATETYQExETETURExATEjUQNxATEDcQExA3EBMQNxA2ETYRNhA2ETYRExA2ERMSERIREhISERIREzQSERE2EjUSNRATEBMRNhATETYQExETEBMQNxA2EayOkhE2EBMRNhA3EBMQExE2EBMRExA2EhIQExE2EDYRExA3EBMQNxATEDcQNhE2ETYQNxA2EhIQNhETERITEBISEBMQExE2ERISNRI1EDcQExATEjUREhI1ERIQFBATFTIQNxEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAI6SETYQExA3EDcQExATEDcREhISETYQExATEjURNhATEDcREhE2EBMQNxE2EDYRNhE2ETUSEhE1ERMQExESEhIREhETETUSEhATEDcQNhISEBMRNhATETYQNxATEBMRNhA3EKyOkhE2EBMRNhE2EBMRExI0ERMREhE2EBMQExE2ETUSEhE2EBMRNhATETYRNhA2ETYQNxA2ERMRNhATEBMRExATEBMRExA2ERMQExA3EDYSEhATEjUQExI1EDcREhESETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI6SEDcQExA2EjUSEhATETYQExETEDYRExATETYRNRETEDYRExA3EBMQNxA2ETYQNxE1ETYREhI1EBMRExATERMREhE2ETURExATEDcQNhETEBMREhISEDcQNhAUERIRNhI0E6qOkhE2EBMRNhE1EhIREhE2ERIRExE1ERMREhA3ETUSEhA3ERIQNxATETYRNRI1ETYSNBE2ERMSNBISEBMQExISEBMQNxE1EBQQExE2EDcQExATEhIREhE2EDYSEhATETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDKAI6SEDcQExA3EDYRExATEDcQExETEDYRExATEDcQNhETEDYRExA2ERMQNhE2ETYQNxA1EjYQExE2EBMRExATEBMRExE1ETYRExA2ETYQNxATEBMRExATEDcREhETEBMQNhE2EayOkhA3EBMRNhA2EhIQExA3EBMQExI1ERITERA3EDYSEhA2ERMQNhETEDYRNhE2EDcQNhE2ERIRNhESERMQExETERIQNxA2ERMRNRE2ETYREhISEBMQExE2ERIRExATETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAJCQEzQTEBM0EzQSERMREjQTERESEjUSERIREjURNhATETYQExE2EBMRNhA3EDYRNhI1EjMUERI1EhESERMREhESEhA2ERMQExA3EDYRNhATERMQExE2EDYRExATERMQNhE2EK2OkhA2ERMQNBM2ERIRExA3EBMQExI1EBMSEhA2ETYREhE2EhERNhISEDYRNhA3EDYRNRE3EBMRNhESEhERExATERMQNhETEBMQNxA2ETYRExATEBMSNRA3EBMQExETEDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAI+REzQRExA2EjUQExETEDYRExATETYQExESETQTNhATETYQExE2EBMRNhA3EDYRNhE2EjQRExA3EBMQExETEBMQExE2EBMRExATEDQTNhETEBMREhM0ETYQNRITEBMRNhA3EKyOkhE2EBMRNhA3EBMSERE2ERITERI0ERMQExE2EDcQExA3EBMQNxATEDcQNhE2EjUSNBE2ERMQNhETEBMSERETEBMSNRATEBMRExA2EzQREhMREBMRNhA3EDYRExATEjUQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAI6SEzQSERM0ETYSERISEjQTERIREzQSERIREjUSNRMQEjUSERM0ExARNhI1EjQTNBI1EDcSERI1EBMSERMREBMSEhI0ERMQNhETEDYRNhESERMQExE2EhERNhATERMQNhE2EK2OkhA2ERMQNhE2ERIRExA2ERMQExE2EBMSEhA2EjUREhE2EhIQNhISEDYRNhA2EzQRNhI1EhESNRIREhISERIREhISNBISEDYTERI0EzQSEhIREBMRNhIREzQSERMREDYRNhIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDKAI6SETURExE1ETYRExATEDcQExATEjUQExETEDYRNhESETYRExA2ERMQNhE2EDcQNhE2ETQSExE2EBMRExATEBMSEhA2ERMQNxA2ETYQNxATEBMRExA2ERMQExESERMRNRE2EayOkhE2EBMQNxA2ERMREhA3EBMREhE2EhIQExA3EDYRExA2ERMPNxETEDcQNhE2EDcQNhE2ERIRNhETEBMQExETEBMQNxATEDcQNhE2ETYREhETEBMQNxESEBMRExATETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_HIGH: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI6SEjUSERE2EjQTERATEzQSERMREjQTERIREjUSNBMREjQTERATEjUSNRA2ETYQNxA2ETYQNxATERIRExATERIRExATERMQExATETYQNxATEBMRNhA3EDYRNhESERMQNhE2EayOkhA2ERMQNhE2ERMQExA3EBMQExE2EBMRExA2ETYRExA2EhIQExE2ETUSNRI1EDYSNRI1EjQSEhIRExEREhESExESERIRExESERI1EjQTERIREzQSNBM0EzQSERMREjMUNBMADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAI6SEjUSERI1EjUSERIREzQSERMREjQRExIREjUSNRIREjUSERIRETYSNRMzEzQSNBE3EjQTNBESExEQExIRERMSERETEhESERMzEzUQNhETEBMRNhA3EDYRExATERIRNhE2EKyPkhA2ERMQNhM0EBMRExA2ERMQExE2EBMRExA2ETYQExE2ERIRExA3EDYRNhA3EDYSNRE2EDYRExATERMQExESERMQExATERMQNhE2ETYQExETEDYRNhA3EBMREhETEDcRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI6SEDcQExA3EDYRExESETYREhATETYREhETEDYRNhISEDYRExATEDcRNRI1ETYQNxA2ETYRNhATEBMRExESERISEhESERIRNhE2EDYRNhETEBMQNxA2ERMQExATERMQNhE2EayOkhA2ERMQNRI2ERIRExA2ERMQExE2EBMRExA2ETYQExE2EBMRExE1ETYRNhA2ETYRNhA3EDYRExATEBMRExATERIRExATETYQNBM2EjUQExETEDYRNhESERMQExETETUSNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI6SEDcQExA3EDYRExATETYQExETEDYRExATETYQNxATEDQTExATETYQNxA2ETYRNhA3EDYRNhATERMQExATERMQExESERMQNhETEDcQNhETEBMQNxA2ERMSNBETEhERNhA3EKyOkhEyFBMRNhA3EBMQExE2ERIRExA2ERMQExE2EDcQExA3EBMQExE2ETYQNhE2EjUQNxA2ETYQExETEBMQExETEBMREhETEDYRExA3EDYRExATEDcQNhETEDYRExATETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI6SEjQRExI0EzQSERETEDcQExATETYQExETEDYRNhESETYREhETEDYRNhE2EDcQNhE2EDcQNhETERIREhETEBMQExETEDYSNRISETURNhATExEQNhISEBMRNhATERIRNhI1EKyPkRE2ERMQNhE0EhMRExA2ERMQExA1EhMQExI1ETYQExE2EBMREhI1ETYQNxA2ETYQNxE1ETYREhETEBMQExETEBMRExA2EjUREhE2ETYQExATETYSERISETUSEhATETYTMxEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDOAAsAAsmOkhA2ERMQNhE2ERMQExA3EBMQExE2EBMRExA2ETYREhE2ERMQExA3EDYRNhA3EDYRNhE2EDcQExATERMQExATERMQExA3EDYRNhE2EDYRExATETYQExETEBMQExETETURNhGsjpIQNhETEDYRNhETERIQNxATEBMRNhATERMQNRI2ERIRNhETEBMQNxA2ETYQNxA2ETYRNhA2ExEQExETEBMQExETEBMQNxA2ETYRNhA2ERMQExE2EBMRExATEBMRExA2ETYRAA0FAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAI6SEDcQExA3EDYRExATETYREhETEDYRExESEDcQNhISEDcQExATETYQNxA2ETYQNxA2EjURNhATERMQExATERMREhATETYREhI1ETYQNhETEBMRNhATETYREhETEBMQNxA2EayOkhA3EBMQNxA2ERMQExE2EBMRExA2ERMQExE2EDYSEhA2ERMQExE2ETMUNRM0ETYQNhE2ETYQExISERIQExISERIREhE1ERMRNhE2EDcQExATEjUREhE2ERISEhESETYQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAI+SEDYRExA2ETYQExETEDYRExATETYQExETEDYRNhATETYQExETEDYRNhE2EDcQNhE2EDMUNhETEBMREhETEBMRExATEDcQExATETQSNxATERIRNhESETYRNhATERMQNhE2EayOkhE0EhMQNhE2ERMREhA2ERMQExE1ERMRExE1ETURExE2EBMRExA3EDYRNhA3EDYRNhE2EDYRExATERMQExATERMQExA3EBMQExE2ETYQExETEDQTExI0ETYQExETETURNhIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI6SETYQExE2EDcQExATEjUQExETEDYRExATETYQNxATEDcQExATETYRNBI2ETYRNhA1EjYRNhATERMQExATERMQExA2ETYRExATETYQNxATDxQRExATEDcQNhETEBMQNxA2EayOkhA3EBMQNxA2ERMQExA3EhERExA2ERMQExA3EDYRExA2ERMQExA3ETURNhA3ETURNhE0EjYRExESERMREhESERMQNhI1EBMTERA2EDcREhISEBMREhE2ETYREhETETUSNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDKAI+REzQTERIyEzYSERMREDYSEhIREjUSERIREzQRNhATETYQExETEDYRNhA3EDYRNhE2EjQTNBMQExESERMQExESERM0EjQTERI0EzQTNBMQExESERMQEzQTEBMREhETNBI0E6qRjRUzExETMxM0ExESERM0EhETEBM0ExATERI0EzQTEBM0ExATERI0EzQTNBI0EzQTNBI0EzQTERESERISEhESEBMRNhA3EBMQNxA2ETYSERISEhETEBM0EhETERIRETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAI6SETYQExE2EDcQExATETYSERETEDYTERIREjUSNRIREjUSERIRETYRNhA3EDYRNhA2ETYRNhESERMQExETERIQExE2EBMRExA2ETYSNRATERMQExA3EDYRExESERIRNhE2EKyPkBM1ERMQNhE2ERIRExE1ERMREhA3EBMREhE2ETYQExE2EBMRExA2EjUQNxA1FTMRNhE2EDYRExATEhERExESERIRNhETEBMQNxA2ETYQExISEBMRNhA2EhIQExETETURNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAJCQEjMUERI0EzQTEBMREjQTERIREzQTEBMREjQTNBMQEzQTEBMREjQTNBM0EjUSNBI1EjURNRMREhESEhESERISEhA2EhIREhESETYQNxATERIRExA2ETYRNhATERMQNhE2EKyPkhA2EhISNBM0EhETERI0ExESERE2EhESEhA2ETYSERE2EBMRExA2ETYQNxA2ETYRNhA3EDYRExATEBMRExATEBMRNhATERMQExE2EDcQExATERMQNhE2EDcQExESETYQNxEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAI+SETYQExE2EDcQExATETYREhETEDYRExATETYQNxATEDcQExATETYRNhA2ETYRNhA3EDYRNhATExESERATExESERI1EhERNhMQETYSNRIREhETERA2ERMQNhETEBMRNBI2EayOkhA3EBMRNhA3EBMQExE2EBMRExA2ERMREhE2EDYRExA2ERMSERE2EDcQNhE2ETYRNhA2ETYQExETEBMQExISEBMQNxESETYQExE2ETYREhATERMQNhETEDYRExATETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDKAI6SEDYRExE2EDYRExATETQSExETETURExATEDcQNhETEDcQExATETYQNxA2ETYQNxA2ETYRNhESERMQExATERMQExE2EBMRNhA3EDYRNhATEhIQExA3ERIQExMRERIRNhE1EquOkhI0ExERNhA2ERMQExE2EBMRExA2ERMQExA3EDYSEhA2EBQQExE2ETUSNRE2ETYQNhI1EDcREhESERMQExETEBMQNhETEDcQNhE2EDcQExESERMQNhETEBMREhETEDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_AUTO: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDKAI+RETYRExA2ETYREhETEDYSEhATEDcQExATETYRNhATETYQNxATEDcQNhE2EDcQNhE2ERIRNhETEBMQExETEBMQExETERIQExETEDYRNhESERMQNxA2ETYQNxATEhERNhA3EKyPkRE2EBMRNhA3EBMREhI1EhERExA2ERMQExE2EDcREhA3EDYRExE1EjURNhA3EDYRNhESETYQExETEBMQExETEBMREhETEBMREhE2EjUQExETEDYRNhA3EDYRExESETYRNREADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDKAI6SETYREhE2EDcREhATEjUREhISETURExATEDcQNhISEDcQNhETEDYRNhE2EDYRNhA3EBMQNxATERMQExATERMQExATERMQExA3ETUSNRATEhIQNhE2ETYQExETEBMQNxA2EK2OkhE1EhIQNxE1ERMQExE2EhEQExI1ERIRExE1ETYREhI1ETUSEhA3EzMWMRI1ETYQNhETEDYRExATERMREhATERMQExESERMQNhI1ETYQExATEjUSNRI0EhISERETETUTNBEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDKAI6SETYSERI1EDYTERIREjUSERISEjQTERIREzQSNRIREjUSMhMTEjQTNBE2EDYTNBI1EBMRNhATERMQExATERMQExATERMQNhE2EDcQNhETEBMRNhA2EhIQExESERMQNhE2EayOkhE1ERMQNhE2EhIQExE2EBMQExE2EBMSEhA2ETYQExE2EDcQExE0EzUSNRQzETYQNhISETUSEhATERIRExESEhEVDxATFDMQNhI1EjUREhETETURNhESERMPFBATETYSNRAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDKAI+RETYRExA2ETYQExETEDYRExATETYREhESETYRNhATETYQNxATEDcQNhE2ETYQNxA2ERMQNhETEBMQExETEBMQExETEBMQNxATEDcQNhETEBMRNhA3EBMQNxATEBMRNhA3EKyOkhE2EBMRNhA3EBMREhE2ERISEhA2ERMQExE2EDcQExA3EDYRExA2ETYQNxA2ETYRNhATETYQExETERIQExETEBMQExISEDYRExA2ETYREhISETYRNRETDzcRExATEDcQNhIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDKAI6SEjUSERI1EjQRExIREDcQExESETYREhETEDcQNhETEDQTNhATETYRNhA2ETYRNhA3EBMQNxATEBMRExATERIRExASEjYQNxATEDcQNhETEBMQNxATEBMRNhETEBMQNhE2EayOkhA2ERMQNxA2ERMQExA2ERMQExE2EBMRExA2ETYREhE2ETYQExE2EDcQNhE2EDcQNhETEDYRExATERIRExATERMQExA2ETYRExA2ETYQExETEDYRExATETYQExETEDYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDKAI6SETYQExE2EDYRExATETYQExETEDYRExATETYQNxATEDcQNhETEDYRNhA3EDYRNhE2EBMRNhATERMQExATERMQExATETYRNhA2ETYRNhATERMQNhETEBMQExETEBMRNhA3EKyOkhE2EBMRNhA3EBMQExE2EBMRExA2ERMQExA3EDYRExA1EjYSERE2ETYQNxA2ETYQNxATEDcQExATERMQExATERMQExE0EjcQNhE2EDcQExATETYQExETEBMRExATEDYRNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDKAI+SEDYRExA2ETYREhETEDcQExATETYQExETEDYRNhESETYRNhATETYQNxA2ETYQNxA2ERMQNRITEBMRExATEBMRExATEDcQExE1ETYRNhETEBMQNxATEDcQExESERMQNhE2EayOkhA2ERMQNhE2ERMQExA3EBMQExE2EBMSEhE1ETYRExA2ETYQExE2EDcQNhE2ETYQNxATEDQUEhATERMQExATEhIQExE2EBMRNhA3EDYRExATEDcQExE2EBMRExATEDcQNRIADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDKAI6SEDcQExA3EDYRExATETYQExETEDYRExATEDcQNhETEDcQNhETEDYRNhE2EDYRNhE2EBMRNhESERMQExESERMQExETEDYRExATEDcQNhETEBMQNxATETYQNxATEBMRNhA3EKyOkhE2EBMRNhE2EBMREhE2EhIQExA3ERIQExE2ETYQExE2EDcQExA3EDYRNhA3EDYRNhESEjUREhETEBMRExATEBMRExA2EhIQExE2EDYRExATETURExE2EDcQExATETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDKAI6SEDYRExA3EDYRExATEDcQExATETYREhETEDcQNhETEDYRNhATETYRNhA3EDYRNhA3EBMQNxATERIRExATERMREhA3EDYRExATEDcQNhETEBMRExESEDcQNhETERIQNxA2EayOkhE2EhERNhA3EBMQExE2EBMRExI0ERMQExE2EDcQExA3EDYRExA2ETYRNhA3EDYRNhESETYREhETEBMRExESEBMRNhE2EBMQExI1ETYQExMREhEQExE2EDcREhESETYRNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDOAJGPEjQTERI0EzQTERIREzQSERMQEzQSERMREDcQNhETEDYRMhUSETQTNhA3EjMUNBM0EhESNRIRERMSERATEhIQExI1EDYRExA2ETYRNhATERMQExATETYQExETEBMQNxA2EayOkhE2EBMRNhA3EBMQExE2ERIRExA2ERMQExE2EDcQExA3EDYRExA2ETYRNhA3EDYRNhATETYQExETEBMREhETEBMRNhA3EBMQNxA2ETYREhETEBMRExA2ERMQExATETYQNxAAAo0JAA0FAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDKAI6SEDcQExA3EDYRExATETYQExESETYRExATEDcQNhETEDYRNhETEDYRNhA3EDYRNhA3EBMQNxATEBMRExATERMQExA3EBMQExE2EDcQNhETEBMQExE2EDcQExESERMQNhE2EayOkhA2ERMQNhE2ERMQExA3EBMQExE2EBMRExA2ETYQExE2EDcQExE2EDYRNhE2EDYRNhETEDYRExATEBMRExATEBMRNhESERMQNxA2ETYQExETEBMQNxA2ERMQExATETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDKAI6SEDcQExA3EDYRExATETYQExETEDYRExATEDcQNhETEDYRNhETEDYRNhA3EDYSNRA3EBMQNxATERIRExATERIRExA2ERMQExETEDYRNhATERMQExA3EDYRNhATERMQNhE2EayOkhA2ExEQNhI1ERMQExA3EBMREhE2EBMRExA2EzQQExE2ETYQExE2EDYSNRE2EDcQNhETEDYRExATERIRExATERIRNhESERMQExE2EDcQExATERMQNhE2EDcQExATEjURNhAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDKAI+RETYREhE2ETYQExETEDYRExESEDcQExATETYQNxATETYQNhETEDcQNhE2EDcQNhE2ERIRNhETEBMQExETEBMQExE2EBMRNhATETYQNRITERMQExA3EBMQNxATEBMRNhA3EKyOkhI1EBMRNhE2EBMREhE2ERIRExA3EBMQExE2EDcQExA3EDYRExA2ETYRNhA2ETYRNhATETYQExETEBMQExETEBMRNhATETYQExE2EDcQExATERMQNhETEDcREhATETYQNxAADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDKAI6SETYQExE2EDYRExATETYQExETEDYRExATETYQNxATEDcQNhETEDYRNhA3EDYRNhE2EBMRNRETERMQExATERMREhE2EBMRNhA3EDYRNhATERMQExA3EBMREhETEBMRNhA3EKyOkBM2EBMRNhA2ERMQExE2EBMRExA2ERMQExA3EDYRExA2ETYRExA2ETYQNxA2ETYQNxATEDcQExATERMQExETEBMQNxATEDcQNhE2EDcREhATERMQNhISEBMRExATEDcQNhEADQUAAAAAAAAAAAAAAAAAAA==",  # noqa: E501
+            },
+        },
+    }
+
+
+def get_ir_dict_electra_classic_35() -> Dict:
+    """Use to create a dictionary for the electra classic 35 ac ir packets."""
+    return {
+        ir_packets_manager.MODE_OFF: "JgDYAAABKpUTNxI4ExQTExQUFBQUNxI5EzgTOBM4ExQTFBMUFDcTOBUUEzgTNxMUFBMVOBI3FDgTOBQTFTgSExQUExQTFBMUFBMTFBQTExQUExM4FDgSFRMUExQTFBMUExQTFBMVExQUExMUFBMTFBQUEjgUFBQUFBQTFBMUFBQTFBQUExQTFRMUExQUFBMUFBQTFBMUFBQUExQUExQUFBMUExQUFBMUFBQTFBQUExQTFBQUExQTFBQ3FRQROBUUExQUExQUExUTFBM4EhQUNxM4FDgTOBM4FgANBQ==",  # noqa: E501
+        ir_packets_manager.MODE_PANEL_LIGHT_TOGGLE: "JgDYAAABKpUSOBI4FRMUFBMUFBMUOBI4ExQTFBQUFDgRFBQUExQTOBMUExQVNxIUFBQSFBQUExQTOBMUExQVExQUExQUFBMUFBQTFBQTFBQTFBQ4ETgUFBUTFBQTFBQUExQTFBQUExQUFBMUFBQTFBMUFDgSFBMUExQUExMUFBMTFBQUEhQVFBIUEhQTFBMUFRMUFBMUFBQUExQUExQUExQUEzgSFBQUExQTFBMUExQTFBMUExQTFBM4FBMVOBIUEzgTFBMUFBUTOBIUEzgUFBMUFBMUFBMUFgANBQ==",  # noqa: E501
+        ir_packets_manager.MODE_HORIZONAL_BLINDS_ON: "JgDYAAABKZYROg87EBYRFhEWEhYSOg87EToROhI5EjkTFRMVEhUTORIUExQTFBMUExQTFBMUFBQSFBQ4EjgVFBMUFBMUFBMVExQTFBQUExQUExQ4EjgTFBQUFBQTFBQUExQUExQUExUTFBMUFBQTFBQTFDgSFBMUExQUExMUFBQSFBQUEhQUFBMUExQTFBMUExQTFBMUFBQSFBQUEhQUFBMTFDgTExQUFRMUFBMUFBQTFBQTFBQTFBQ4EjgTFBQUFBQTFBQTFBQUNxI4FBQUOBI4EzgTOBM4FgANBQ==",  # noqa: E501
+        ir_packets_manager.MODE_HORIZONAL_BLINDS_OFF: "JgDYAAABKJcSORA6ERYRFhIXERYROhA6EjoQOhI6EDoSFhIWExUROhEVExURFRMVERUTORE5FDkSFBI5EzgSFRQUEhQUFBIVExQTFBMUExQTFBM4EzgTFBQUEhQUFBMUExQTFBMUExQUExMUFBQSFBQUEjgUFBQUFBQTFBMUFBQTFBMUFBQTFRMUExQUFBMUExQUFBMUFBQTFBQUExQTFBQUEzgSFBQUEhUTFBIVExQTFBMUExQTFBM4FDcTFBQUEhQUFBIUFBQTOBM4ExQTOBM4FBQUOBM4FwANBQ==",  # noqa: E501
+        ir_packets_manager.MODE_VERTICAL_BLINDS_ON: "JgDYAAABKJcROhA6ExYRFhEXEhUSORI5EhUSFRMVEzkRFRIVEhUSORIVExQVFBMUExQUOBI4FDgTFBIUFDgSFBQUFBQUExQUFBQTFBMUFBQTFBQ3EjgUFBQUFBQTFBQTFBQTFBQUExQUFBMUFBMUFBMUFDcSFBQUExQTFBMUExQTFBMUExQUFBIUFBQSFBQUExQTFBMUExQTFBQTExQUFBIUFDcTFBQUFBQUExQUExQUFBMUFBMUFBQTFDgSFBMUExQTFBMUExUSOBQUFBQTFBQ4ERQUOBI5FgANBQ==",  # noqa: E501
+        ir_packets_manager.MODE_VERTICAL_BLINDS_OFF: "JgDYAAABKpUTOBI3ExQTFBMUFRMUOBI4FDgTNxQ4EzgTFBQUFBQTOBIUFBQSFBQUEhQUOBI4FTgTNxMUFDcTFBQUEhQUFBIVExQTFBMUExQTFBQ4EjgTFBQUEhQUFBIUFBQTFBMUExQUExMUFBMTFBQTEzgUFBQUFBQTFBMUFBQTFBQTFBQTFRMUExQUFBMUFBMUFBMUFBQTFBQUExQUExMUEzgVExIVEhQUFBQVExQTFBQUExQUFBMUFDcSFBQUEhQUFBMUExQTOBMUFRMUOBI4ExQUOBI4FgANBQ==",  # noqa: E501
+        ir_packets_manager.MODE_COOL: {
+            ir_packets_manager.SPEED_LOW: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABK5QTOBI4ExMTFBQTFRQTOBI4FDcTOBQ4EhQUFBMTFDgTFBMVFDgSOBQTFRMUOBI4EzgTFBQ3ExQUFBQUExQUFBMUFBQTFBQTFBQTFBQ3EjgUFBUTFBQTFBQUExQUExQUExQUFBMUFBQSFBQTFDgSFBIVEhQUFBQUExQUFBMUFBMUFBQTFBQTFBQUExQUExQUExQUFBMUFBQTFBQTFDgSFBMUExQUExMUFBQSFBQUEhQUFBM4ExQUExQUExQSFBMUExQTOBM4FBQUExQ4ExMTFBQ3GAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABKpUTOBI4ExQVExQUExQTOBM4FDgSNxU4EjgSFBQUFDgSFBQTEzgUOBIUFBQSOBQ4EzgTFBU3EhQUFBIUFBQTFBMUExQUExMUFBMTFBI4FDgSFBMUFBMTFBQTExQUFBIUFBQTFBMUExQTFBMUEzgTFBMVFBQTFBQUExQUExQUExQUFBMUFBQTFBQTFBQTFBQUExQUFBMUFBMTFBMUFDgSExMUExQUExUUExQUExQUExQUFBMUFBQTFBMUFBQTFBQUExQTFRM4EhQTOBM4FBQTFRI5FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKZYSORI4ExUTFBMVEhUTOBE5EzkTOBI5EhUSORIVEzgTFBMVETkTOREVFBQRORM5EjoRFRQ4ERUTFREVExURFhIVEhUSFRIVEhUSFRI5EjkUFRIVExQTFRIVExUSFRIVExUTFBMVEhUTFRIVEjkSFRIVExQSFRMUEhUTFREVEhUSFRMVEhUTFRIVEhUTFRIVExUSFRMVEhUSFRMVEjkRFRMVERUTFREWEhURFhIVEhUSFRIVExURFRMVERUTFREVExUSFRI5EhUSFRMVEjkRFRE5FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABKpYRORI5EhUTFRIVERURORI5FDkRORI5EzkSOREVEzkRFhIVEjkSOREWEhUSORI5EjkTORE5ExUTFRIVExUSFRMVEhUTFRIVEhUTFRI5ETkTFRMVEhUTFRIVExUSFRIVExUTFBMVEhUTFRIVEjkRFRMVEhUSFRIVEhUSFRIVEhUSFhEVExURFRMVEhUSFRIVEhUSFRMUExQTFBMUFDcTFBQUFBQUExQUExQUFBMUFBMUFBQUExQTFBQUExQUExQUExUTOBI4ExQVNxIUFDgSFBQ4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABKpYSOBI4ExMTFBQTFRQTOBI4FDgSOBQ4EhQUFBM3FDgTFRMUEjgUOBEVExQSORM4FDgSORI4FRQSFRMUExUSFRMVEhUTFRIVExQTFRI5EzgSFRIVFBQUFBIVExUTFBIVExUTFBMVExQTFRMUEzgRFRQUEhUTFBMUExQTFBIVEhUSFhEVFBQSFBMVERUUFBIVEhUSFRMUExQTFBMUEzgTFBQUFBQUExQUExQUFBMUExQUFBMVExQTFBQUExQTFBQUExUTOBI4ExQUFBQ4EjgTFBQ4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABKpUTNxI4ExQSFBQUFBQTOBI4FDgTNxQ4EzgTFBQ4EjgUFBQUFDcSOBQUFBQTOBI4FDgTNxQ4ExQTFBMUExQTFBMVEhQUFBIUFBQSFBQ4EjgVFBQTFBQTFBQTFBQTFBQUExQUFBMUFBQTFBMUFDgSFBMUFBQSFBQUEhQUFBMUExQTFBQTExQUExMUFBQSFBQUEhUTFBMUExQTFBMUEzgTFBUUExQUFBMUFBMUFBMUFBQTFBQUExQUExQUExQUFBMUFBQTOBI4ExQVNxI4FDgTExQ4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABKpUTOBI4ExQUFBQUExQTOBI4FDgTNxQ4ExQTOBM4FDgTFBMUEzgTOBQUExQUOBI4EzgVNxM4ExQTFBQUFBQTFBQUExQUExIUFBQUFBM4EjgUFBQUFBMUFBMUFBMUFBMUFBQUExQUExQUFBMUEzgSFBQUExQTFBMUExQTFBMUExQTFRIUFBQSFBQUEhQUFBMUExQTFBQUFBQTFBQTFDgTExMUFBQSFBQUExQTFBMUExQTFBQTExQUFBIUFBQSFBQUEhUTOBM4FBQUExQUExQUOBI4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKpUTOBI4ExQVExQUExUTOBI4FDgTNxQ4EzcUOBM4EzgTFBQTEzgUOBIUFBQSOBQ4EzgTOBM4ExQVExQUExQUFBMUFBQTFBQTFBQTFBQ4EjcUFBUTExQTFBQUExQSFBMUEhUTFBMUExQTFBMUEzgTFBUUExQUFBMUExQUFBMUFBMUFBQUExQTFBQUExQUExQUExUTFBMUFBQTFBQTFDgSFBMVEhQSFBIUExQUFBQUExQUFBIVExUTFBMUFBQTFBQUExQTORE4FBQUOBIUExQTOBQ4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKJcROhA6ERURFhIWEBYROhA7EjoQOhE6EhYSFhEWEhYROhEWEDoSOhAXERYQOxE6EToROhE6EhYSFhEWEhYRFhEXERYRFhIWEhYRFhI5EDoRFhEWERYTFhEWERYSFhEWEhYRFhIWERYRFhIWEToQFhEXEBYSFhAXERYQFxEWERYRFhEWEhYQFhIWEBYSFhAWEhYRFhIWERYSFhEWEjoPFxAXEBYSFhAWEhYQFhIWEBcRFhEWERYRFhEWERYRFhEWEhYQOhI6EBcRFhE6ERYSOhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABKpUTOBI4FBQTFBQTEhUTNxM4FTgSOBM4FDgTFBMTFBQTOBMUFTcSOBQUFBQTOBI4FDgTNxQ4ExQTFBMUExQTFBQUEhQUFBIVFBMTFBQ3EzgVFBMUFBMUFBMUFBQTFBQTFBQUExQUExQUFBMUFDcTFBMUFBMTFBQTExQUFBIUFBQSFRMUExQTFBMUExQTFBQTExQUFBMUEhQTFBITEzgVExQUFBMUFBMUFBQTFBQTFBQTFRMUExQUFBMUFBMUFBMUFBQTOBI4FBMVOBI4ExQUOBI4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKpUTOBM4ExQUExQUEhQSOBM4FTcTOBM4FBQTOBQUEhMTOBIUFDcTOBUTFBQTOBM4EzgUFBQTFDgTExMUFBMTFBQUExQTFBMUExQTFBM4EzgUFBQUExQUExQUExQUFBMVExQUFBMUFBQTFBQTFDgTExMUFBQSFBQUExMUFBMUExQTFBQTExQUExMUFBQSFBQUEhUTFBMUExQTFBMUEzgUExUUFBMUFBMUFBMUFBMUFBQTFBQUExQUExQUExQUFBMUFBQTFBQTFDgSFBMUEzgTOBM4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKJcROhA6ExUSFRIWDxYROhE6EzkROhA6EzoQOhIVERYTOhAWEToSORMVERYSOhE5EjkUFRIVEjkSFREWEhUSFRIVEhUTFRAWEhYRFRM5ETkUFRIVExUSFRIVExUSFRMVEhUTFRIVERYSFRIVEzkTFREVEhUSFRMVExUSFRMUExUSFhIVEhUTFRIVEhUTFRIVExUSFRMVEhUTFBMVEjkRFRMVERYSFRIVEhUSFRIVEhUSFhEVExUQFhMVERUTFREWEhUSFRIVEjkSORIVEjkSORM5FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABLJUTNxI4FRMUFBMUFBMUOBI4EzgUOBM3ExQUExU4EhQTOBMUFDcTOBQTFRQTOBI4EzkSFBQUEjgUFBQUFBMUFBMVExQTFBQUExQUExQ4EjgTFBUUExQUExQUExQUFBMUFBQTFBMUExQTFBIUEzgSFBQUFRMUFBMUFBMUFBMUFBQTFBQUExQUFBMUExQUFBMUFBQTFBQUExQUExQUEzgSFBQUEhQUFBIUFBQTFBMUExQTFBMVExQTFBMUExQUExMUFBQSFBQUEjgUFBQ4EjgTOBM4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABKpUTOBM3FBQUExQUEhMTOBM4FTcTOBM4FDgTExM4FBMVOBIUEzgTOBQUFBQTOBM3EzgVFBMUFDcTFBMUExQTFBMVEhQUFBIUFBQSFBQ4EjgVFBQTFBQTFBQTExQUExQUEhQTFBIUFBMVFBMUFDgRFBQUExQTFBMUExQTFBQTExQUFBMUExQTFBMUExQTFBMUExUSFBQUEhQUFBIUFDgSFBQUFRMUFBMUFBQTFBITExQUFBQUFBMUFBMUFBMUFBMUFBQUExQUEzgSOBM4EzgUNxM4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABKpUTNxM4FBMUFBMUEhQTOBI5FDgTNxM4FRMUOBI4ExQTORIUFDgSOBUTFBQUNxM4EzgUFBQTFDgTExMUFBQSFBQUExQTFBMUExQTFBM4EzgUFBQUExQUFBMUFBMUFBMUFBQUExQUExQUExQUEzgTFBMUExQTFBMUExQUExMUFBMTFRMUExQTFBMUExQTFBMUExQUFBIUFBQSFBQUEjgUFBQUFBQTFBQTFBQTFBQUExQUFBMUFBQTFBMUFBQTFBQTFBQUFBMUEzgSFBQUEhQUFBIUFwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABK5QTOBI4FBQUExQUExQUOBI4EzcVOBI4EzgUOBM4EhQUOBMUEzgTOBQUFBMUOBM3EzgVFBMUEzgTFBMUExQTFBMUExQUExMUFBQSFBQ4EjgVFBQTFBQTFBQTFBQTFBQUExQUFBMUFBMUFBMUFDgSFBMUFBQSFBQUEhQUFBMTFBQUFBQUExQUExQUFBMUFBMUFBQTFBQUExQUExQUEzgSFBQUEhQUFBMTFBQTFBMUExQTFBMUFBMTFBQUEhQUFBIUFBQTFBMUEzgTOBMUFBMTFBQUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKpYSOBI4EhQRFhEWExYROhA6EjoQOhI6EBYSFhAWEjoQOxIWEToSOREWERYSOhA6ETsQFxEWEDsRFhIWEhYRFhEXEhYRFhIVEhYRFhI6EDkSFhMVEhYRFhIWERYSFRIWEhYRFhEWEhYRFhIVEjoQFhEWERYSFhEVEhYQFhMVEBYSFhEWERYRFhEWERYRFhMVERYRFhIVEhYRFhMVEToRFREXEBYSFhAWEhcPFhIWEBcRFhEWERYSFRIWERUSFhAWEhYRFhIVEToSFRI6ERUSFhAXEwANBQ==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_MEDIUM: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABKJcQOhA6ERYQFhIWEhYROhA6EjoQOhI6ERYPFhEWEToSFhMVERYRFhIWERYTORA6EToSOhE6EBcRFhIWERcRFhEXERYRFhIWERYSFhEWEToQFxEWEBcRFhEWERYRFhEXERYRFhEWERYRFhEWEToRFhMWERYSFhEWERYSFhEWEhYRFhIWERYSFhEWERYSFhEWERcRFhIWERYRFhIWEToQFhEXEBYSFhAWEhYQFxEWERcQFhE6ERYTOg8WEhYQFxEWEBcRFhE6ERYTFhE6EDoROhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABKJcROhA6EBcQFhIWEhYROhA6EjoQOhI6EDoSFhIWEToQFxEWERYRFhEWERYROhE6EToSOhA6EjoQOhIWEhYRFhIWEhYRFhEWEhYRFhEWEjoQFhEWERYSFhAWEhYQFhMWDxcQFhEWERYSFhIWEToQFhIWEBcRFhAXERYRFhEWERYRFxAWEhYQFhIWEBYSFhAXERYRFhEWERYRFhEWEToRFhEXEhYRFhIWERYSFhEWEBYSFhIWDxYRFhEWERYRFhEWERYSOhAWEhYSFhEWEhYRFhE6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKpUSOBM4ExUTFBMUEhQSORI5FDgSOBM4FBQUOBIUEzgTFRQUExQUFBMUExQTOBM4FDgSOBQ4EjgTOBQUExQUFBMVExQTFBQUExQTFBQUEzgTFBMUExQTFBMUExQTFBMUExUSFRMUEhUTFBIVEzgTFBMUFRQTFBMUFBQTFBMVExQTFRMUExQUFBMUExUTFBMUFBQTFBQUExQTFRMUEzgSFBQUEhUTFBIVExQTFBMUExQTFRIUFBQSFBQUEhQUFBIVExQTOBMUFBQUOBIUExQTFBM4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABKpUTNxI4FRQTFBMUFBQTOBI4EzgUOBM4EjgVOBIUEzgTFRQUExQTFBMUExQSOBM4FDkROBQ4EjgUOBIVExQSFRMUExQTFBMUExUSFBQUEjgUFBQUFBQTFBMUFBQTFBMVExQUFBMUExQUFBMUEjgTFBUUExQUFBMUExQUFBMUFBQTFBQUExQTFBQUExQUFBMUExUTFBMUFBQTFBQUEzgSFBMVEhQUFBIUFBQSFBQUEhUTFBMUExQTFBMUExUTFBMUExUSOBQUFBQTFBQ4ERUTFBI5FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABKJcTORI6ERYQFhEWEBcROhA7EjoROhA6ExYRFhE6EToQFxEWEhYSFhEWEhYROhA6ETsQFhIWEBYSFhA6EhYSFhEXERYSFRIWERYSFhEWEToQFxEWERYRFhEWERYRFhEWERYSFhAWEhYQFhIWEDoSFhIXERYRFhMVERYTFBIUExUUFBMVExQTFBMVExQTFBQUExUTFBMUExUTFBMUFDgRFRMUExQTFRIUExUSFBQUEhQUFBMUExQTFBMUExQTFBMUExUSFBQ4EhQUOBI4FBQUFBM5FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABKJcROg87EhYRFhIWERYROhA7EDoSOhE6EDsSFhE6EToQFxEWEhYSFhEWEhUSOhA6EToRFhIWEBYRFhA6ExYRFhEXERYSFhEWERYSFhEWEToRFhEWERYRFhIWEBYSFhAWEhYRFhEWERYRFhEWEToRFhEXEhYRFhIWERYRFhIWERYSFhAWEhYRFhAWEBcQFhIWEBcRFhEWERYRFhEWEToRFhMWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWERYSFhEWERcRFhE6EBYSFhAWEjoQFhM6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABKJcROhA6EBYSFhIWERYSOg87EToROhE6ERYROhE6EjoRFhEWERYRFhEWERYSOhA6EToSFhIWERYSFRI6EBYRFhEWEhYQFhIWEBYSFhAWEjoQFxEWEhYSFhEWEhYRFhEWEhYRFhIWERYSFhEWEToQFhIWEBcRFhEWERYRFhIWDxcQFhEWERYTFhEWERYSFhEWEhYRFhIWERYRFhIWEToQFhIWEBcRFhAXERYRFhEWERYRFxAWEhYQFhIWEBYSFhAXERYRFhE6ERYROhEWEToRFhE6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKJcQOhA6EhcRFhEWEhYROhA6EToSOhE6EDoSOhM4EjkSFhIWERYRFhIWERYTORA6EToSFhIWERYRFhI6EBYRFhMVEhUTFBAXERYSFRMUEToRFxIWExQSFRIWERYSFhEWExUTFBMVERYTFBIWEToQFhMVEBYSFhIUExYRFhEWEhYRFxMUExQSFhEWERYSFhMUExUTFBIWERYRFhIWEToRFhAXERYRFhEWERYRFhEWEhYQFxEWEBcRFhEWERYRFhEWERYSFhA6EhYSFhE6EDoSFRM6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKZYSOBE5FBQUFBIVExQUOBI4EzgUOBI4ExQTFRQUEhUTORIUExQTFRMVEhUSORI4FDkSFBIUEhUTFBQ4EhQUFBEWExQTFBMUExQTFBMUEjkTFBMVFBQTFBQUExQTFBQUExUTFBMUFBQTFBMUFDgRFRMUExQUExMUFBQSFBQUEhQUFBMUFBQSFBIUExQTFBUTFBQUExQUExQUFBMUEzgSFBQUExQTFBMUExQTFBMUExQTFRIUFBQSFBQUEhUTFBMUExQTFBM4ExQTOBQ4FTgSExM4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABKJcQOhA6ERYQFhIWEhYROhA6EjoQOhI6EDsRFhIWEhYROhAWEhYQFhIWEBYSOhA6EzoQOhEWERYTFhE6EBYRFhEWEhYQFhIWEBcRFhAXEToRFhEWExYRFhEWEhYRFhEXERYSFhEWERYSFhEWEToQFhIWERYQFhAWERYQFhIWEBcRFhEWERYRFhEWERYSFhAWEhYRFhEWERYRFhEWEToRFhEXEhYRFhEWEhYRFhIWERYRFxEWEhYRFhEWEhYRFhEWEhYROhA6EhYSFhEWEhYROhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKJcROhA6ERYTFRIWERYSOhE5EzgTOBM4ExQTOBMUExQVOBIUExQTFBMUExQROhE6EjsQOhEWERYSFhI6DxcRFhEWEBYSFhEWERYRFhIWEToQFhIWEBYSFhAWEhYQFxEWERYRFhEWERYRFhIVEToSFhIWEhYRFhEWEhYRFhEWEhYRFxEWERYSFhEWERYSFhEWERYSFhEWERYQFhEWEDoSFhIWEhYRFhIWERYRFhIWERYSFhEWEhYRFhEWEhYRFhIVEhYSORA6EhYSOhEVERYROhE6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKJcROhA6ExYRFhEXERYROhA6EjoQOhI6EDoSOhEWERYROhEWExYRFhEWEhYROhA6ETsQOhIWEhYRFhI6EBYRFhEWEhYSFhEWEhYRFhEWEjoQFxAWEhYQFhIWEBYSFhAXERYRFhEWERYRFhEWEjkRFhIWEhYRFhIWERYSFhEWERYSFhIVEhYRFhIWERYRFhIWERcRFhEWEhYRFhEWEjoQFhEWERYRFhEWEhYQFhIWEBYSFhEWERYRFhEWERYRFhEWERcQOhI6EBcRFhA6EhYSOhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABK5USOBI4EhQTFBIUFBQSOBQ4EzgTOBM4ExQVExQ4EhQTOBMUFBMVFBMUFBMUOBI3FDgTOBQTFRQTFBM4EhQUFBIVEhMTFBMUExQUFBQUEzgSFBQUEhQUFBIUFBQSFBQUExQTFBMUFBMTFBQTEzgUExUUFBMUFBMUFBQTFBQTFBQTFBQUExQUFBMUFBMUFBMUExQUExQUEhQSFBMUEzgTFBQUFBQTFBQUExQUExQUExQUFBQTFBQTFBQTFBQTFBQUExQUOBI3FBQUOBI4FBMVOBE4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABKJcSOhI6ERYQFhAXEBYSOhA7EjoQOhE6EjoRFhA7ERYSOw8WEhYQFxEWEBcROhA7EjoROhAWEhYSFhE6EBYSFhAXERYRFhEWERYRFhEWEToRFhIWEhYRFhIWERYRFhIWERYSFhEWEhYRFhEWEjoPFxEWERYRFhEWERYRFhIWEBYSFhEWERYRFhIWDxcQFhEWERcSFhEWERYSFhEWEjoPFxEWERYRFhEWERYRFhEXEBYSFhAXERYRFhEWERYRFhEWERcQOhI6EBYSFhAWEjoQOhM6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABK5QTOBI4ExQVFBMUExQUOBI4FDgTNxM4FRMUOBM3ExQUOBMTFBQTFBMUExQTOBM4FDgTOBIUFBQUFBM4EhQUFBIVExQTFBMUExQTFBMUEzgTFBQUFBQTFBQUExQUExQUExQUFBMUFBQTFBQTFDgSFBMUExQUExMUFBQSFBQUEhQUFBMUExQTFBMUExQTFBMUFBQSFBQUExQTFBMUEzgTFBMUExQUExMUFBQSFBQUEhQUFBMUExQTFBMUExQTFBMUFBQSOBQ4ExMUOBMTFDgTNxQ4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABKpUTNxM4FBMUFBMUEhQTNxM4FTgTNxM4FDgTOBM3FRQTOBMUExQTFBMUExQTOBM4EzgUFBQ4EhQTFBM4ExQVExQUFBMUFBMUFBQSFBMUEjgUFBUTFBQTFBQUExQUExQUExQUFBMUFBQTFBQTFDgSFBMUExQUExMUFBMTFBQUEhQUFBMUExQTFBMUExQTFBMUFBQSFBQUExMUFBMUEzgTExQUFRMUFBMUFBQTFBQTFBQTFBQUExQUFBMUFBMUFBMUFBQTFBQUEzgSFBM4EzgUOBM4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKJcROg86ERYRFhEWEhYSOg87EToROhE6ERYRFhEWEToROhMWERYRFhIWERYSOhA6EToSFhI6EBYRFhE6ERYRFhMWERYSFhEWERYSFhEWEjoPFxEWERYRFhEWEBYQFhEWERcSFhEWEhYRFhEWEjoQFhEWERYSFhAWEhYQFhIWEBYSFhEWERYRFhEWERYRFhEWERcQFxEWEBcRFhAXEToRFhEWExYRFhEWERYRFhIWDxcQFxAWEhYQFhIWEBYSFhAWEhYRFhEWEToROhE6EToROhE7FAANBQ==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_HIGH: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABKZYSOBE5ExUTFRIVExUSORE5EzkRORM5ERUTFREVEzkSFRIVFBQTFRIVExUSORI4EjoRFRMVETkUFBQ4ERUTFBIVEhQSFRIUExUTFRI5EhQUFBIUExUSFRIVEhUSFRIVExURFRMVERUTFREVEzkRFRMVExUTFRIVEhUTFRIVExUSFRMVEhUTFBMVEhUTFRIVEhUSFRMVEBUSFRIVEjkSFRIWExUSFRMUExUSFRMVEhUTFRI5ERUSFRIVExQSFRMVERYSORI4FDkRORI5ExUTOREVFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABKZYTOBI4FBQTFBMUEhQTOBQ4EjgTOBQ4EzgSFBQUFDgSFBMVEhQUFBEVFBQRORM5EjkSFRQUFDgRFRM4ExQSFRQVExQSFRQUEhUTFRM5ERQTFRIVEhUTFBIVExQTFBMUExUSFRMUEhUSFRIVEjkTFBMUFRQTFBMUFBQSFRMUExUTFRIVEhUUFBMUExQUFBIVFBQTFBQUExQTFRMUEjkRFRQUEhUTFBIVExQTFBIVExQTFREVFBQSFBMVERUTFRIVExQTFBI5EzgUFBMVEjkTOBIUFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKpUSOBI4FBQUFBMUFBQTOBI4FDgSOBQ4EhQUOBIUFTgRFRIUExQTFBUUExQTOBI4FDgTFBMUFDgSFBM4ExQTFBUUExQUFBMUExQUFBM4EhQUFBIVExQTFBMUExQTFBMUExUSFBUTEhQTFBMUFDcSFBQUExQTFBMUExQTFBMUExQUFBIVExQTFBMUExQTFBMUExUSFBQUEhQUFBIUFDgSFBQUFBQUFBMUExQUFBMUFBQTFBQUFBQSFBIUExQTFBQUFBQUExQ4ETgUOBMUEzgTOBQUFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABK5USOBI4FBQUFBMUFBMUOBI4FDcTOBQ3EzgUOBIUFDgSFRMUFBQUFBMUFBMUOBI4EzgTFBQTEzgUExU4EhQTFBMUFBMTFBQUEhQUFBI4FBQUFBQUExQUExQUExQUFBMUFBQTFBQTFBQTFBQUEzgSFBMVEhQUFBIUFBQSFBQUExQTFBMUFBMTFBQTExQUFBIUFBQTFBMUExQTFBMUEzgTFBMVFBQTFBQTFBQTFBQUExQUFBMUFBQTFBMUFBQTFBQTFBQUExQ4EjgTFBQ4EjgUOBIUFwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABKJcQOhA6ERYTFhEWERYSOhA6EToROhE6EhUSFhA6EjoRFhEWERYSFREWERYROhE6EToSOhEVEjoQFhI6EBcRFhEWERYRFhEWERYSFRE6EhYSFhIWERYRFhIWERYRFhIWERcRFhEWEhYRFhEWEjoQFhEWERYSFhAWEhYQFhIWEBYSFhEWERYRFhEWERYRFhEWEhYQFxEWEBcRFhEWEToRFhEWExYRFhEWEhYRFhIWERYRFxEWERYSFhEWEhYRFhAWEBcROhI6EDoQOxI6EDoROhIWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABK5QTOBI4FBMVFBMUFBMUOBI4FDcTOBQ3EzgUExU4EjgTFBQUEhMTFBMUExQUOBI4FDgTNxQUFDgSFBM4ExQUExUUFBMUFBMUFBMUFBM4EhQUFBMUExQTFBMUExQTFBMUExUSFBUTFBQTFBQUEzgTFBIVExQTFBMUExQTFBMUExQTFBQUEhQUFBMTFBQTFBMUExQUExMUFBMTFBQUEjgUFBQUFBQTFBQTFBQTFBQTFBQTFRMUFBMUFBMUFBQTFBMUFBQUNxI4FDgSFBQUEhQUFBI4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABKZYTOBE4ExUUFBQUExQTOBE5EzkSOBQ4ExQSORM4FDgTFBIVEhUSFRMUEhUTOBI5FDgTOBIUEzkSFRI5EhUTFBQVExQTFBQUEhUTFBQ4EhQTFBMUExQSFRQUERUTFRIUExUSFRMUExQTFBIVEzgTFBMVFBQSFRMVExQTFBMVEhUUFBMUFBQTFBMUFBQTFBQUExQUFBMUExQUFBMUFDgRFRMUExQTFBMUExQTFBQTExQUFBIVExQTFBMUExQTFBMUExUSOBQ4EjgUOBIUFBQSFRM4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKJcQOhA6ERYQFhIWEhYROhA6EjoQOhI6EDoSOhA7EToRFhIVERYSFhAWExUSOBM5EjkTOBMUEzgTFBM4ExQTFBMUFBQSFBIWEhQSFhA7ERYSFxEWERcRFhIWERYRFhIWERcRFhEWEhYRFhEWEjoQFhEXEBYSFhAWEhYQFhIWEBYSFhEWERYRFhEWERYRFhEWEhYQFxEWEBcRFhEWEToRFhEWExYRFhAWEhYRFhIWDxYRFxAWEhYQFhIWEBYSFhAWEhYROhE6EToRFhI6EBYUFBA7FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKJcROg86EhYSFxEWERYSOhA6EToROhE6ERYSFhAWEhYQOxEWEhYSFhEWERYSOhA6EToROhIVEzoPFxE6EBcRFhIXERYRFhEWERYSFg86ERYRFhEWExYRFhEWEhYRFhEXERYSFhEWERYSFhEWEToQFhIWERYRFhEWERYRFhEWERYRFxAXERYQFxEWEBcRFhEWERcQFhIWEBYQFhEWEDoTFhEWEhYRFhEWEhYRFhIWERYRFxEWERYSFhEWEhYRFhEWEhYROhE6EDsSOhA6ERYRFhM6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABKJcROhA6EhYRFhEWEBYROhA7EjoROhA6EzoQFhEWERYROhIWEhYRFhIWERYROhA6EjoROhEWEjoQFxE6ERYRFhIXERYRFhIWERYSFhE6EBYRFxAWEhYQFhIWEBcRFhAXERYRFhEWERYRFhEWEjkRFhIWEhYRFhIWERYSFhEWERYSFhIWERYRFhEWERYRFxEWEBYRFhAWEhYQFxEWEDsRFhIXERYRFhIWERYRFhIWERYSFhEWEhYRFhEWEhYRFhIWERYSOg86EjoQFxEWEToRFhI6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKpUSOBI4FRMUFBMUFBMUOBI4EzgUOBM3ExQUNxMUFBQSORMUFBQUFBMUFBMUOBI4EzgTOBQTFTgSExQ4ExMUFBQUFBQTFBQUExQUExQ4EhQTFBMUFBMTFBQTExQUFBIUFBQTFBMUExQTFBMUEzgTFBMVFBQTFBQUExQUExQUEhQUFBQTEhQTFBMUExQTFBMUExQUExMUFBQSFBQUEjgUFBQUFBQTFBQTFBQTFBQUExQUFBMUFBMUFBMUFBQTFBQTFBQUNxI4FDgSOBQUFDgSFBM4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKpUTNxI4ExQTFBIUExQTOBM4EzgUNxM4FDcTOBQUFBQTORITFBQTFBMUExQTOBM4FDgTFBI4FDgTFBM4ExQTFBMVExQUExIUExQTFBM4ExQTFBUUExQTFBQUExQUExQUExUTFBMUFBQTFBQTFDgSFBMVEhQUFBIUFBQSFBQUEhQUFBMUExQTFBMUExQUExMUFRQTFBQTFBQTFBQUEzgSFBMUExQTFBMUExQTFBMUExQTFRIUFBQSFBQUEhQUFBMUExQTFBQTExQUNxM4FDgTFBM4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABKJgQOhA6ERYRFhAWEBYROhI7EDoROhI6ERYQFhI6EBYSOhEWERYRFhEWERYROhE6EjsSFBI5EzgSFRM4ExQTFBQVExQSFRMUExQUFBE4ExQTFBMUFRQTFBMUFBQTFBQUExQUFBMUERYSFhEWEjoPFxEWERYRFhEWERYRFhIVERYSFhAXERYRFhEWERYRFhEWERcRFhEWEBYSFhAWEjoQFhIWEhYSFhEWERYSFhEWEhYRFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWERYROhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABKpUVNxQ4ExQSFBMUEhQUOBI5FDgTNxM4FTcTFBM4ExQUORITFBQTFBMUExQTOBM4FDgTFBQ4EjgTFBU3EhQUFBIVExQTFBMUExQTFBM4FBMVFBQTFBQTFBQTFBQTFBQUExQUFBMUFBQTFBMUFDgSFBMUExQUExMUFBMVFBMUFBQTFBQUExQUExQUExQUExQUFBQTFBQTFBQTFBQTFDgSFBMVEhQUFBIUFBQSFBQUExQTFBMUFBMTFBQTExQUFBIUFBQTFBMUExQTOBUTFBQTOBI4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABKpUVOBM4ExURFBMUExQTOBM4FDgTOBI5FBQTOBM4EhQUOBMUExQTFBMUExQTOBM4FDkSFBM4EzgTFBM4ExQTFBQVExQTFRMUExQUFBM4EhQTFRIUFBQSFRMUEhUTFBIVExQTFBMVEhQUFBIUFDgSFBQUFBURFBMUExQTFBIUExQSFRMUFBQUFBMUExQUFBMUFBQTFBQUExQTFBQUEzgSFBMVEhUTFBIVExQSFRMUExQTFRIUFBQSFBQUEhQUFBIVExQTFBMUFBUTFBM4EhQTORI4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABKpUTOBE5ExQUFBMVExQTOBI5EzgSORM4EjkTOBI5ExQTORIVFBQTFBMVExQTOBI4EzkSFRM4EjkUFBM4ExQSFRMUExQUFRMUFBQTFBM4ExQSFRMVEhQTFRIUExUSFBQUEhUTFBMUExQTFBMUEzgTFBUUExQUFBMUExUTFBMUExUTFBQUExQTFRMUExQTFRMUExUTFBMVExQTFBMVEzgSFBMVEhQUFBIVExQSFRMUEhUTFBMUExUSFBMVEhQTFRIUFBQSFRMUEhUTOBI5FBQTORI4FwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKpUTNxI4ExQSFBQUFBQTOBI5EzgSORM4ExQTFBMUEzgTOBQUExQTFBIUExQSOBU4EjgTFBM4EzgUExU4EhQTFBMUFBMTFBQUEhQUFBI4FBQUFBQUExQTFBQUExQUFBMUExUTFBMUFBQTFBQUEzgSFBMVEhQUFBIUFBQSFBQUEhUTFBMUExQTFBMUExQUFBIUFBQTFBMUExQTFBMUEzgTFBMVFBQTFBQUExQTFBQUExQUFBMUFBQTFBMUFBQTFBQUExQUFBMUExQUFBMUEzgSOBQ4FgANBQ==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_AUTO: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABKZYSOBM4ExQTFRMUEhQSORI5FDgQOhM4FBQTFRMUEzgTFBMUExQTFBMVEhQTOBE6FDkSFBMUExQTOBM5EhQTFRIVExQRFhMUEhURFhE6ERYTOhAWERYRFhMUERYTFBIVExUSFBQUEhUTFBIUFDgUFBIUExQSFBQUFBQTFBQUExQUFBMUFBQTFBMUFBQTFBQUExQUFBMUExQUFBMUFDgRFRMUExQTFBMUExQTFBMVEhQUFBI5ExQTFBQUExQSFBIVEhUTOBI5FBQTFBQUEzgSORI4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABK5USOBI4FBMVFBMUFBMUOBI4EzgTOBQ3EzgUExUUEzgSFBQUEhQUFBIUFBQTNxQ4EzgUExUUExQTOBI4FBQUFBMVExQTFBQUExQUExQ4EhQTOBMUFBMVFBMUFBMUFBMUFBQTFBQUFBQTFBQTFDgSFBMUExQUFBIUFBQSFBQUEhQUFBUTFBQTFBQTFBQTFBQUExQUFBMUFBMUFBMUFDgSFBMUExQUExMUFBMTFBQUEhQUFBMUExQTFBEUExQTFBMUFBUTFBM4EhQUOBIUFDgSOBQ4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKpUTOBE4FRQTFBQTFBQTOBI4EzgUOBM4ExMUOBMUEzgTFBMUFRMUFBMUFBQTOBI4EzkSFBQUEhQUOBI4FRQTFBQUExQUFBMUExQUFBM4ExQSORMUFBQUFBMUFBMUFBMVFBQTFBQTFBQTFBQUEzgSFBMVEhQUFBIUFBQSFRMUEhUTFBUTFBQTFBQUExQTFBQUExUTFBMUFBQTFBMUFDgSFBMUExQUExMUFBQSFBQUEhQUFBMUExQTFBMUExQTFBMUFBQSFBQ4EhQUFBQ4EjgTOBM4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABKJcQOhA6EhYSFhEWEhYROhA6EjoQOhI6EDoSOhAWEjoQFxEWEhYSFhEWEhYROhA6ETsQFhIWEBYSOhA6ExYRFhEXEBYSFhEWEBYQFhE6EhYSOhEWEBYSFhAWEhYQFhIWEBcRFhEWERYRFhEWEToRFxIWERYSFhEWEhYRFhEWEhYRFxEWERYSFhEWERYSFhEWERYSFRIWERYQFhEWEDoSFhIWEhYRFhEXERYRFhIWERYRFxEWEhYRFhEWEhYRFhEWEhYSFhE6EBYROhE6EjoROhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABKJgQOhA6ERYTFhEWERYSOg87EToROhE6ERYRFhE6EDoRFhAXERYSFhEWEhYROhA6ETsQFxEWEBcROhA7EhYRFhIWERYSFhEWEhYRFhE6ERYQOxEWExYRFhEWEhYRFhEWEhYSFhEWERYSFhEWEToQFhIWERYRFhEWERYRFhEWERYRFxAWEhYQFxEWEBcRFhEWERcQFhIWEBYSFhAWEjoQFhIWEhYSFhEWERYSFhEWEhYRFhIWERYRFhIWERYSFhEWERcRFhE6EBYSFhAWEhYQFxEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABKJcSOQ87EhYRFhIWERYROhA6EToSOhE6EDsSFhE6EToQFxEWEhYSFhEWEhUSOhA6ETsQFhIWEBYSOhA6ExYRFhEXERYRFhIWERYSFhE6ERYQOxEWEhYSFhEWERYSFhEWEhYRFhIWERYRFhIWEToQFhEXEBYSFhEWERYRFhAWERYQFxEWERYRFhEWERYRFhEWERYSFhAXERYQFxEWEToRFhIXERYRFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWERYSFhE6ERYQOhEWERYTFhEWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABKpUTOBI4EhUSFBMVFBQTOBI4FDgSOBQ4EhUTOBI4FTgSFRIUFBQSFRMUEhUTOBI5FDgTOBIUFBQUOBI4ExQUFBQUExUTFBMUFBQTFBM4EhQUOBIVExQUFBMVExQTFBQUExUTFBMUExUTFBEWEzkQFhEWERYSFhAWEhYQFhIWEBYSFhEWERYRFhIWEBYQFxAWEhYSFhEWEhYRFhIWEToQFhEXEBYSFhAWEhYQFxEWEBcRFhEWERYRFhEXEBYSFhAWEhYROhE6ERYRFhE6ERYSFhIWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKJcSOBI4ExQSFBQUFBQTOBI4FDgSORM4EjkTOBM4EzgTFBQUEhQUFBIUFBQSOBQ4EjkTOBMUExQTOBM4ExQUFBQUExUTFBMUFBQTFBM4ExQSORMUFRQTFBMUFBQTFBQUExQUFBMUExQUFBMUFDgRFRMUExQTFBMUExQTFBMVEhQUFBIVExQSFRMUExQUFBMUFBQUFBMUExQUFBMUEzgTFBMUFBMTFBQUEhQUFBIUFBQSFRMUExQTFBMUExQTFBMUExQUOBI4FRQTOBM4EhQUFBQUFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKpUSOBI4ExQSFRMUFBQUNxI5EzgTOBM4ExQTFBMUExQTOBQUFBQTFBQUExQTOBI4FDgTOBMUFBQTORE5ExQTFRIUExQTFBMUExUSFBQ3ExQUOBMUExQTFBMUEhUTFBMUEhYRFRQUERUTFRIUEzkSFRMUFBQTFRIVExUSFRIVExUSFRMVEhUTFRIVEhUTFREVExUTFBMVERURFRIVEjkSFRIWExUSFRMVEhUTFBMVEhUTFRIVExUSFRMVEhUSFRMVEhUTORA6EhUTFRMVEjkRFRIVFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABKJcRORE6EhYRFhEWEBYROhA7EToROhI6EToQFhIWEhYROw8XERYQFxEWEBcROhA7EjoROhAWEhYSOhA6ERYSFxEWEhYRFhEWEhYRFhE7DxYSOhEWEhYSFhEWEhYRFhEXERYSFhEWERYSFhEWETsPFhIWERYRFhEWERYRFhEWERYSFhAXERYQFxEWEBcRFhEWERcQFhIWEBYSFhAWEjoQFhIWEhYRFhEWERcRFhAWEBYRFhIWEBcRFhAXERYRFhEWERYSORE6EhYSOhAWEToRFhMWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKJcROhA6EBYRFhEWExUSOhA6EToROhE7EBYSOhAWEhYSOhAWERYRFhIWEBYSOhA6EzoQOhEWERYTOg86EhYSFhIWERYSFhEWERYSFhE6EBYROxAWEhYSFhEWEhYRFhEXERYRFhAWERYRFhEWEToRFhIWEhYRFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWERcRFhEWEhYRFhEWEjoPFxEWExYRFhEWEhYTFBMUFBQTFRIUExQUFBEVEhQTFBMUExQUOBI4FBURFhM4EToSFRMUFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKJcSORA6EBYRFhEWExUSOhA6EjkROhI6EDoSOhAWEhYQOxAWEBYRFhEWERYROhE6EjsQOhEWERYSOhA6EhYSFhEXERYRFhIWERYSFRI6EBYROhEWEhUTFhEWERcRFhEWEhYRFhIWERYSFRIWEToQFhIWEBcRFhEWERYRFhEWERYRFxAWEhYQFhIWEBYSFhEWERYRFhEWERYRFhEWEToRFhIWEhYRFhIWERYSFhEWERYSFhIVEhYRFhIWERYRFhIWERYSOhA6ERYSOhA6EjoRFRIWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABKJcROhE5ExUTFBMUEBYTOBI5FDgSORA6FBURFhM4ERYSORMUExYTFBEWFBQROhI4EzkSFBQ4EhQTORI4FBQUFBMVExQTFBIWExQSFhE6EBYTORAWExUUFBMUExUTFBEWEhYSFhEWExQSFhEWEToSFBIWERYPFhEWEBcTFBIWEhYRFhQUERYTFBIWERYSFhMUExURFhIVEhYRFhMVEToSFBMVEhQUFBAWEhYQFxEWEBcTFBMUERYRFhIWEBYTFRAWFBQRFhEUEToUFBQUExQTOREVFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABKJcSOQ87ERYRFhEWERYROhE6EjoROhA6EzoQFhE6ERYTOhEVERYRFhIVEhUROhE6EjsRFRE6EhUSOhA6ExUSFhIWEhYRFhIVEhYSFRI6EBUSOhEWERYSFhMVERYSFhIVERcRFhEWEhYRFhIWEToRFRIWEBYSFhAWEhYQFhIWEBcRFhEWERYRFhEWERYSFhAXERcQFhIWEBYSFhAWEjoQFxEWExUSFhEWEhYRFhEWEhYRFxEWERYSFhEWERYSFhEWEhYRFhIWEToROREWEhYSOhAWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABKJgSOBA6ERYTFhEWERYSOg87EToROhE6ERYROhE6EhYSOhEWEBYSFhAWEhYQOhI6EDsRFhM6DxYSOhA6ExYRFhIWERYSFhEWERYSFhE6ERYQOxEWEhYSFhEWERYSFhEWEhYRFhIWERYSFhEWEToQFhIWEBcRFhEWERYRFhEWERYRFxAWEhYQFhIWEBYSFhAXERYRFhEWERYRFhEWEjoPFhIWEBYRFhAWEhYQFhIWEBcRFhEWERYRFhEWERYSFhAWEhYRFhEWEToRFhI6EBYSOhAWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABKJcQOhA6EhYSFhEWEhYROhA6EjoQOhI6EDoSOhA7ERYSOw8WEhYQFhIWEBcROhA7EjoRFhA6EhYSOhA6ERYTFhEWEhYRFhEWEhYRFhE7DxYSOhEWEhYRFhIWERYSFhEWERcRFhEWEhYRFhIWEToRFhAXERYQFxEWERYRFhEWERYRFhIWEBYSFhAWEhYQFxEWEBcRFhEWERYRFhIVEToSFhIWEhURFhEWEhYRFhAWEBcQFxEWERYRFhEWERYRFhEWERYSFhAWEjoQOhM6EBYTOBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKJcQOhA6EhYPFxAWEhYQOhI6EToROhE6EhYRFhIWEToROhEWERYSFhIWERYROhA6EjoRFhE6ERYROhE6ERYSFhIWEhYRFhEWEhYRFhE6EBYSOhEWERYSFhEWERYRFxEWEBYRFhAWEhYQFxEWEDsRFhIXERYRFhIWERYRFhIWERYSFhEWEhYRFhEWEhYRFhIWERYSFhEWERYSFhEWEjoPFxEWERYRFhEWEBYQFhEWERYTFhEWEhYRFhIVEhYRFhIWERYSFhEWETsPFhIWEDoSOhAXFAANBQ==",  # noqa: E501
+            },
+        },
+        ir_packets_manager.MODE_HEAT: {
+            ir_packets_manager.SPEED_LOW: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABKpUSOBI4ExQRFRQUFBQTOBI5EzgTOBM4ExQTFBMUEzgTFBQUFBQTFBQUExQTOBI4FDgTOBM4ExQTOBM4FBQTFBMVFBQTFBMUFBQTFBM4EzgTFBMUFRQTFBMUFBQUFBIUEhQTFBQTFRQTFBQTFBQTFBQ4EhQTFBMUExQTFBQTExQUFBMTFBQTFBMUExQTFBMUExUSFBQUEhQUFBIUFDgSFBQUFRMUFBMUFBMUFBMUExQTFBQ4FBQSFBIUFBQUFBQTFBQUExQ4EjgTFBQUFBQTFBQUFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABKZYSORE5ERUSFRIVFBUSORE5EzkRORI6EDoSFhIWEToQFxEWERYRFhEWERYROhE6EToSOhA6EhYSOhA6ERYSFhIWEhYRFhEWEhYRFhE6EDoSFhIWEhYRFhEWEhYRFhIWERYSFhEWERYSFhEWEhYRFhE7DxcRFhAXERYRFhEWERYRFxAWEhYQFhIWEBYSFhAXEhUSFREWERYSFhIWEToRFhEWEhUSFRIVEhUSFRIVEhUSFRMVERYSFREWEhUSFRIVEhUTOBIVEjkSORMVExUSFRMVEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKpUSOBI4ExQSFBQUFBQTOBI5EzgTOBM4ExQTOBMUEzgTFBQUEhQUFBIUFBQSOBQ4EjkTOBM4ExQVOBE4FBQUFBQUExQUFBMUExQUFBM4EjgTFRQUExQUFBMUFBMUFBMUFBQTFBQUExQUFBMUExQUFBM4EhQUFBIUFBQSFBQUEhUTFBMUExQTFBQTExQUFBIUFBQTFBMUExQTFBMUEzgTFBMVFBQTFBQUExQTFBQUExQUFBMUFBQTFBMUFBQTFBQUExQUOBEUFDgSFBQ4EhUTFBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABKJcSORA5ExUTFRIVEhYSORE5EjoRORM5ETkTORIVEjkSFRIVFBUSFREWExUROhE5EjoRORI6ERUTORE5FBUSFRMVEhUTFRIVEhUTFRI5EjkRFhIVExUTFRIVERYTFRIVEhYRFhMVERYSFRIWERYTFRI5EBYSFhAWExUQFhIWERYSFREWEhURFhIVEhURFxAWExUSFRIVEhUSFRIVEjkUFBMVExUSFRIVExUSFRIVExUSFhIVEhUTFRIVEhYSFRIVExUSOREVEjkSORM5EhUSFRIVFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABKpUTNxM4FBMUFBMUExQSOBI5ETgVOBE4ExQUExU4EjgTFBUUExQTFBQUExQUNxI4FDgTOBM4ExQTOBM4FBQUFBMUFBQTFBQTExQTFBQ3EjgTFBMUExQVFBMUExQUFBMUFBQTFBQUExQTFBQUExQUExQ4EhQUExMUFBQSFBQUEhQUFBMUExQTFBMUExQUExMUFBQTFBQUEhQUFBMUEjgSFBMUFBQUFBMUFBQTFBQTFBQTFRMUExQUFBMUFBMUFBMUFBQTOBIUFDgSFBQUFDgSFBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABKpUTOBI4FBQTFBQUERQTOBM4FDgTOBI4FTgSFBM4EzgTFBQUEhUTFBIVExQTOBM4EzgUExUUEzgSOBM4ExQUExMVExQSFRMUExQTFBM4EzgTFBQUEhQUFBIUFBQSFBQUEhUTFBMUExQTFBMUExQUFBI5ExQUFBQUExQTFBQUExQUFBMUFBQTFBMUFBQTFBQUExQUFBMUExQUFBMUFDgRFBIVEhQTFBMUFBQUFBMUExUTFBQUExQTFBQUExQUFBMUExUTFBM4ETkUOBIUFDgSFBQUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABKZYSORE5EhURFRMVExUSORE5EzkRORM5EhUSORI4FDkSFREVExURFhIVEhUSORI5EzkSFREVEzkRORQ5ERUSFRMVERUTFREWEhUSFRI5EjkTFRMVEhUSFRMVEhUTFRIVEhYSFRMUExUSFRMVEhUSFRM5EhURFRMVERUTFREWEhUSFhEVExUSFRIVERUSFREVExUTFRMVEhUTFRIVEjkSFRIWEhUSFREVEhURFRMVExUSFhIVExQTFRIVExUSFRIVExUTFBM5ETkSFRM5ETkTFRMVFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKpUTOBI3ExQTFBMUFRMUOBI4EzgTOBM4EzgUNxM4FDgSFRMUExQTFBMUExQTOBM4EzgUFBQUEzgSOBQ4EhQUFBIVExQTFBMUExQTFBM4EzgTFBQUEhUTFBIVExQTFBMUExQUFBIUFBQSFBQUEhQUFBI5ExQUFBQUExQUFBMUExQUFBQTFBQTFBQUExQTFBQUExQUFBMUFBQTFBMUFDgSFBMUExQUExMUFBQSFBQUEhQUFBMUExQTFBMUExQTFBMUFBQSFBQ4EjgVOBI4EzgUFBQUFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKpUUOBQ3FBQSFBIUExQTOBM4FTgSOBM4FBQUFBMUExQUOBMUEhQUFBIUFBQSOBQ4EjkTFBUTFDgSOBM4ExQTFBMUFBQSFBQUEhQTFRI4EzkSFRMUEhUTFBIVExQSFRMVERYSFRIVEhUSFRIVEhUSFRI5ExUTFRIVExUSFRIVExUSFRIVEhUTFRIVERUSFREVExUSFRIVEhURFhIVEToSFREXExUSFRIWERYSFRMVEhUSFhEWEhYRFhEWEhYRFhIWERYSFhE6EDoRFhMWERYROhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABKpUTNxI4ExQTFBUUExQTOBI4FDgTNxQ4EzgTFBQUFBQTOBIUFBQSFBQUEhQUOBI4FTgTFBIUFDgSOBU4EhQTFBMVFBQTFBQUExQTFBQ4EjgTFBUUExQTFBQUExQUExQUExUTFBMUFBQTFBQUExQTFBQ4EhQTFBMUExQTFBMUExQUFBIVExQSFRMUExQTFBMUExUSFBQUEhQUFBIUFDgSFBQUFBQTFRMUFBQTFBMUFBQTFBQUExQUFBIVEhUUFBIVFBQTFBM5ETgUOBIVEhUSORMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKJcROhA6EhYRFhIWERYSOg87EDoTOhA6ERYROhEWERYROhIWEhYRFhIWERYROhA6EjoRFhIVEjoQOhE6ERYTFhIVExURFhIVEhYRFhI5EDoSFhMVExURFhIWERYRFhIWERYSFhEWEhYRFhEWEhYSFRE7EBYSFREWERYRFhEWERcRFhEWERYRFhIWEBYSFhAWEhYRFhEWEhURFhIVEToRFhEXEhYSFRIWERYSFRIWERYTFREWExURFhIVExUSFRIWEhUTFRI5ETkSFRI7DxYSOhEWFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKpUTOBI4ExQUFBQUExQUNxI5EzgTOBM4EzgTOBMUExQTOBQUEhQUFBIVExQSOBQ4EzgUExUUEzgSOBM4ExQTFBMUFBQSFBQUExQTFBM4EzgTFBQTExQUFBIUFBQSFBQUEhUTFBMUExQVExIUExQTFBM4FBQUFBMUFBQTFBQUExQTFRMUFBMUFBMUFBQTFBMUFBQUExQUExQUFBMUEzgSFBQUExQTFBMUExQTFBMUExQUFBIUFBQSFRMUExQUFBMUFBQTFBQ4EjgTOBQ4ExQSOBQUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABKpUTNxI4FRQTFBQTFBQTOBI4EzgUOBQ4ExQTFBM4ExQTOBMUFBQSFBQUEhQUOBI4FTgTNxMUFDcTOBQ4EhQUFBMUExQTFBMUExQUExM4FDcTFBQUExQTFBMUExQTFBMUExQUFBIUFBQSFBQUEhQUFBM4ExQVExQUExQVExMUEhQSFRMUFBQUFBMUFBMUFBMUFBQTFBQUExQUExQUEzgSFBQUExMUFBMUExQTFBMUExQTFBMUFBQSFBQUEhQUFBIUFBQTOBM4EzgTFBUTFDgSOBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABKpUSOBI4ExQSFBQUFBQUNxI4FDgTOBM4EzgTFBU3EhQUOBQTFBQTFBQUExQTOBM4EzgUOBMUEjgUOBI4FBQUFBQUExQUFBMUExQUFBM4EjgTFRQUExQUFBMUFBMUFBMUFBQTFBQUExQUFBMUExQUFBM4EhQUFBIUFBQSFBQUEhUTFBMUExQTFBMUExQUFBIUFBQTFBMUExQTFBMUEzgTFBMVFBQTFBQUExQTFBQUExQUFBMUFBQTFBMUFBQTFBQUExQUOBE4EzkSOBQUFDgSOBMUFwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABKZYTOBE4ExQSFRIVFBQTORE5EjkSORM4ExQTOBM4FBQUOBMUEhQTFRIUExUSOBQ4EjkTOBMUEzgTOBQ4ExQSFRMUExQTFBMUExQTFBQ3EzgVFBMUFBQTFBMUFBQTFBQTFBQUFBMUExQUFBMUFBQTFBM5EhQTFBMUExQTFBMUExQTFRMUEhUTFBMUExQTFBMUExQUFBIUFBQSFBQUEjgUFBQUFBQTFBQUExQTFBQUExQUFBMUFBQTFBMUFBQTFBQUExQUOBE4FDgTFBM4EjgVOBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABKJUSOhE6ERYSFhEWEBYROhA7EjoQOhE6EjoROhA7EhYROxAWERYRFhEWERYTOhA6EjoROhEWEjoQOhE7EBYSFhAXERYRFhEWERYRFhE6EToRFhIWEBYSFhAWEhYRFhIWDxcQFhEWERYTFhEWERYSFhE6EBYSFhAWExURFhEWEBcRFhIVEhUSFRMVERUTFREVExUSFRIVEhUSFRIVEjkSFRIWExUSFRIVERUSFRMVERUTFRIVEhUSFRIVEhUSFRIVEhYRORM5ETkTORE5EzkROhIVFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKJcROg87EBYRFhEWEhYSOhA6EToROhE7EBYSFhAWEjoQOxIWERYSFhEWERYSOhA6EToTOhAWEToROhE6ERYTFhEWEhYRFhEWEhYRFhI6DzsRFhIWEhYRFhIWERYRFhIWERcRFhEWEhYTFBMUFBQTFBM5EhQTFBMUExQTFBMUExQTFRIVExQSFRMUEhUTFBMUExUSFBMVEBYUFBAWFDgRFhIWERYSFhEWERYSFhEWEhYRFhIWERYSFhEWERYSFhEWEhYROhE6EDoTFhEWERYSFhE6EwANBQ==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_MEDIUM: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABKJcSOhM5ERURFhEWFBMSORE6EzoQOhE6EhYSFhEWEToRFhEWERYRFhEWERYSORE6EjsQFhE6EjkROhE6ERYSFhAXERYSFhIWERYRFhIWEToQFhIWEBYSFhAXERYQFxEWERYSFREWEhYQFhIWEBYSFhA7ERYSFhIWERYSFRIWERYSFhEWEhYRFhIVEhYRFhIWERYRFhEWEhYRFhAWEDoRFhIWEhYRFhIWERYSFhEWERYSFhE6EBYSFhAWEhYQFxEWERYROhEWERYTOhAVEjoQOhM6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABKJcSOQ87ERYSFhIWERYROhA7EToROhI6EDoSFhIWEToQFxEWERYRFhEWERYROhE6EToSFhI6EDoROhE6ERYTFRIWEhYRFhEWEhYRFhIVEjoQFhIWEBYRFhAWEhYSFhEWEhYSFRIWERYSFhEWERYSFhE7EhMSFhAWEhYQFxEWERYRFhEWEhURFhIWEBYSFhAWEhYRFhEWERYRFhEWEToRFhEXERYRFhIWDxcQFhEWERYRFhIWEBcRFhEWERYRFhEWERYSFhAWEhYQFhI6EDoTOhA6FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKJcSORE4ExQSFRMUFBQUOBE5EzgTOBM4ExQTOBMUEzgTFRMUEhURFhIVExQROhE6EToSFhI6EDoROhE6ERYSFhIWEhUSFhEWEhYRFhEWEjoQFhEXERYRFhEWERYRFhEWERYSFhAWEhYQFhIWEBcRFhE6ERYTFhEWERYSFhEWEhYRFhIWERYRFhIWERYSFhEWERcRFhIVEhYRFhIWEToQFhEXEBYSFhAWEhYQFxEWEBcRFhEWERYRFhIWEBYSFhAWEhYRFhEWERYROhE6EjoROhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABKJcROhA6ERYTFhEWERYSOg87EToROhE6EToROhMUEzgTFRMUFBQTFBQUExQTORE4FDgTFBM4EzgUOBM4EhQUFBQUFBQTFBMUFBQTFBQUEzgSFBQUEhQVFBEUExQSFRMUFBUTFBMUFBQTFBMUFBQTFBQ4EhQTFBMUExQRFhMUExQSFhAXERYQFxEWERYRFhEWERcQFhIWEBYSFhAWEjoQFhIWEhYSFhAWEhYRFhAWEBcQFxEWERYRFhEWERYRFhEWERYSFhAWEhYQFhIWEBcRFhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABK5UTNxI4FBQUFBMUFBMUOBI4FDcTOBU3ExQTFBM4EzgUFBQUExQUExQUExQUOBI4EzgVExQ4EzcTOBQ4ExQTFBMUExQUExMUFBMTFBQUEjgUFBQUFBQTFBQTFBQSFBQUExQSFBMUExQTFBMUExQTFBM4ExQUExUUExQUExQUExQUFBQTFBQTFBQUExQUExQUExQUFBMUFBQTFBQTFDgSFBMUExQUExMUFBQSFBUTEhQTFBMUExQVExQUExQUFBMUFBQTFBQTFBQTOBIUFBMTFBQUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABK5USOBM4ExQUFBMUEhQTNxM4FTgTNxM4FDgTFBI4EjgTFBMUExQVExQUExQUNxI4FDgTFBM4EzgUOBM4EhQUFBQUFBQTFBQTFBQTFBQTFDgSFBQUEhQUFBIUFBQSFBQUExQUExMUFBMTFBQTExQUExM4FBQUFBQUExQUExQUExQUFBMUFBQTFBQTFBQTFBQUExQUFBMUFBMUFBMUFDgSExQUExQTFBMUFBMTFBQTExQUFBMUExQTFBMUExQTFBMUExUSFBQUEhQUFBI4FBQUFBQUFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABK5QTOBI4ExQTFBMUFRMUOBI4FDcTOBQ3ExQUNxM4FTcTFBMUFBMTFBQTExQUNxM4FTgTNxM4FDgTOBI4FRQTFBIUExQTFBMUExQTFBMUEzgTFBQUFBQTFBQTFBQUExQUExQUFBMUFBQTFBQTFBQTFBQ4EhQTFBMUExQTFBQTExQUFBMTFBQTFBMUExQTFRIUFBQTFBMUExQTFBMUEzgTFBQUFBQTFBQUExQUExQUExQUFBQTFBQTFBQTFBQTFBQUExQUOBIUExQTOBM4ExQTFBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKZYSORE5EhUTFRMVEhUSOhA6EToSORE6EToROhE6EToRFhIWEBYSFhAXERYQOxE6EToROhM4EzgTOBM5EhQUFBIVExQTFBMUExQTFBMUEzgTFBQUFBQTFBQUExQTFREWERcRFhEWEhYRFhIWERYRFhI6EBYRFhEWERYRFhIWEBYSFhEWERYRFhEWERYRFhEWERcQFhIWEBYSFhAXEToQFxEWExUSFhEWEhYRFhEWEhYRFxEWERYSFhEWERYSFhEWEhYROhAWEhYQFhIWEDoSFhIWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKpUTOBI3ExQTFBMUFRMUOBI4EzgTOBQ3ExQUFBIUFBQSORMUFBQUFBMUFBMUOBI4EzgTOBQ3EzgUNxM4FBQUFBMVExQUExQUExQUExQUEzgSFRMUExQTFBMUExQTFBMUExQUFBIUFBQSFBQUEhQUFBM4ExQVExQUExQUFBMUFBMUFBQUExQTFBQUExQUExQUExUTFBQTFBQTFBQTFDgSFBMUExQUFBIUFBQSFBQUExMUFBMUExQTFBQTExQUExMUFBQTNxQUFBQUOBEUFDgTExQUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABK5QTOBI4ExMTFBQUFBQTOBI4FDgSOBQ4EzcUFBQUFBMUOBIUFBMTFBQUEhQUOBI4FTgTNxM4FTcTOBM3ExQTFBMUFBMTFBQTExQUFBIUFDgSFRMUFBQUFBMUFBMUFBMUFBQTFBQUExQUExQUExQUExQ4EhQUFBIUFBQSFBQUExMUFBMUExQTFBQUEhQTFBIUFBQUFBQTFBQTFBQUEzgSFBQUEhQUFBIUFBQTFBMUExQTFBMUFBMTFBQUEhQUFBIUFBQTOBMUFRMUFBM4EjgUExUUFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKpUTNxI4ExQSFBQUFBQUNxI5EzgTOBM4ExQTOBMUExQVOBIUExQTFBMUExQTOBM4FDgTOBM4FDgTNxM4FRMUFBMUFBQTFBQUExQUExQUEzgTFBMUExQTFBMUExQTFBMUFBQSFBQUExQTFBMUExQTFBM4ExQUExUUExQTFBQUExQUFBMUFBQTFBQUFBMUFBMUFBQUExQUExQUFBMUEzgSFBQUExQTFBMUExQTFBMUExQTFRIUFBQSFBQUEhUTFBMUExQTOBMUFRQTOBI4EzgTFBMUFwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKpUTNxM4FBMUFBMUEhQTOBI5FDgTNxM4FDgTOBMUExQUOREUFBQSFBQUEhUTOBI4FTgTOBI4FTgSOBM4FBQUExQUFBQTFBMUFBQTFBMTFDgTFREVEhQTFBMUExQTFBMUFBQSFRMUExQTFBMUExQTFBM4ExQUExUUExQTFRMUExQTFRMUExUTFBQUEhUTFBQUExQTFRIVExUTFBIVETkTFBIVFRQSFRMUExUSFRMVEhUTFRIVExQTFRIVExUSFRMUExUTORAVExURFRMVEhUSORIVFQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABKpUSOBI4FBQUFBMUFBQTOBI4FDgSOBQ4EhQUFBI4FBQUOBIUFBQSFBQUEhQUOBI4FTgTNxM4FTcTOBM4FBQTFBQUFBMUFBMUFBQTFBMUFDgTFBIUFBQSFBQUExQTFBMUExQTFBIUExMTFBMUFRQTFBQ4EhQTFBMUExQTFBMUExQUFBIUFBQSFRMUExQTFBMUExQTFBQTExQUFBIUFDgSFBQUFBQUFBMUExQUFBMUFBQTFBMUExQUFBEUExQTFBMUExQUOBIUFBQUOBIUExQTOBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABK5QTOBI4ExMTFBQTFRQTOBI4FDgSOBQ4EjgUFBQ4EhQUOBIUFBQUFBQTFBQTOBI4EzkSOBQ4EjgUOBM3FBQUFBQUExQUFBMUFBMUFBMUFDgSFBMUExQTFBMUFBMTFBQTExUTFBMUExQTFBMUExQTFBM4FBQUFBMUFBQTFBQTFBQTFBMUFBMUFBIUEhQTFBQTExQUFBMTFBQTFBMUEzgTFBQVExQUExQUExQUExQUFBMUFBQTFBQTFBQUExQUExQUExQUOBIUExQTFBM4ExQTOBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABKJcRORE5ExUSFhEWEhYROhE5EjoQOhI6EBYSOhA6ExYROxAWERYRFhIWDxYROhA6ETsQFhIWEBYSFhAWEjoQFhIWEhYSFhEWEhYRFhEWEjoPFxEWERYRFhEWEhYQFhIWEBcRFhEWERYRFhEWERYRFhE6EhYSFhEWEhYRFhEWEhYSFhEWERYSFhEWEhUSFhIVEhYRFhIWERYSFRIWEToRFRIWERYSFREWEhURFhEWERYRFxAWEhYQFhIWEBcRFhEWERYRFhE6EhUROhE6EhUTOhAWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABK5UTOBI4FBMVFBMUFBMUOBI4EzgTOBM4EzgUNxM4FBMVOBIUFBMTFBQTExQUNxM4FTgTExMUFBMTFBQTEzgUFBQUFBQTFBQTFBQTFBQTFDgSFBQTExQUFBIUFBQSFBQUExQTFBMUExQTFBQTExQUExM4FBQUFBQTFBQTFBQUExQUFBMUFBMUFBMUFBQTFBQTFBQUFBMUFBMUFBMUFDcSFBQUExQTFBMUExQTFBQTExQUFBMTFBQTFBMUExQTFBMUExUSFBQ3ExQUFBQUEzgSOBQTFwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKJcSORA5EhUSFRIVExUTORE5EjoSORI5ExQSFRMUEjkTOBUTExUSFRMVEhUSORM4EjkTFRMVEhUSFRMVEjkSFREWEhUSFRIVEhUSFRIVEjkSFRMVExURFREVExUTFRIVExUTFBMVEhUTFRIVEhUTFRI5ERUTFREVExURFhIVEhUSFRIVExQSFRMVERUTFREVExUSFRIVEhUSFRIVEjkSFRIWExYSFRIVExUSFRMUExUSFhIVEhUTFRIVExQTFRIVExUTFBM5ERUSORIVEjkSORIVFQANBQ==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_HIGH: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABKJcSORE5ExUSFRIWEBUROhE6EzkSORA6FBUSFREWEjoQFxEWERYQFxEWEBcROhE6EjoROhEVEhYSFhEWEjoQFhEWERYSFhAWEhYQFhI6EBYSFhIWEhYRFhEWEhYQFhIWERYQFhEWEBcRFhEWERYRFhE7EBYSFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWERcRFhEWEhYRFhEWEjoQFhEWERYRFhEWEhYQFhMWDxYRFhE6EhYSFhEWERYSFhEWEhYRFhIWEToQOhEWERYTOg87FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABKJcROg86EhYSFhEWEhYROhA6EjoQOhI6EDoSFhIWETsPFxEWERYRFhIVERYSORI5EjkTOREWEhUSFRIVEjkSFRMWEhUSFRMVEhUTFRI5ERUSFhAWExURFhIVERYSFhEVEhYSFRIVERYRFhEWERYRFhE7EBYSFhIWERYSFhEWERYSFhIWERYRFhIWERYRFhIWERcRFhEWEhYRFhEWEjoQFhEXEBYSFhAWEhYQFhIWEBcRFhEWERYRFhEWERYRFhEWEhYQOhI6ERYRFhE6ERYSOhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKJcROhA6ERYSFhIWERYSOg87EToROhE6ERYROhEWEToRFhIWEBYSFhAXERYQOxE6EToROhEWEhYSFxEWEToQFhIWERYRFhEWERYRFhE6ERYTFRIWExQTFRMUExQSFhMUExURFhMVExQTFBMVERcTFBM5ERUTFBIVExQTFBMUExQTFRIVExQSFRMUEhUTFBIVExUSFBMVEhQUFBIUFDgSFBQUFBQUFBMUExQUFBMUFBQTFBQUExQTFRMUExQUFBMUExUTOBI4ExQVOBE4FBQUOBI4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABKpUUOBQ4ExQSFBMUEhUTOBI5FDgTOBI4FDkSOBMUEzgTFBQUEhQTFRAWFBQQOhQ4EDsTOBEWERYRFhIVEToSFhIWEhYRFhEWEhYRFhE6EBYSFhEWERYRFhEWERYRFhEWERcQFhIWEBcRFhAXERYRFhE6ERYRFhMWERYRFhIWEBYQFxEWEhYSFhEWERYSFhEWEhYRFhIWERYRFhIWEToQFhEXEBYSFhAXERYQFxEWERYRFxAWEhYQFhIWEBYSFhAWEhYROhE6ERYRFhEWEDoSOhA6FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABKJgQOhA6EBYRFhEXEhYSOg87EToROhE6ERYTFRI4EzkSFRMUEhUTFBMUExQTOBM4EzgUOBIUFBQSFRMUEjkTFBQVExQTFBQUExQTFBQ4EhQTFRIUFBQSFBQUEhQUFBIVExQTFBMUExQTFBMUEhYSFBM5EBcRFhIWEhYRFhEWEhYRFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWEToQFhEXEBYSFhAXERYQFxEWERYRFxAWEhYQFhIWEBYSFhAXERYROhE6ERYROhEWEToROhE7FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABKpUTNxM4FBMUFBMUEhQTOBI5FDgUNxI4EzgUFBQ3EjgUFBQUFBQTFBQTFBQTOBI4FDgTNxQUFBQUExQUEzgSFBQUExQTFBMUExQTFBM4ExQTFBUUExQUExQUExQUFBMUExUTFBMUFBQSFRMVEhUSFRM5ERUSFREWERYRFhIWEBYSFhEWERYRFhEWERYRFhEWERcQFhIWEBYSFhAXEToQFxEWExYRFhEWEhYRFhEWEhYRFxEWERYSFhEWERYSFhEWEhYROhA6EhYSFhE6EDoROhE6FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABKpUTOBI4FBQUFBMUFBMUOBI5EjgVOBI4ExQTOBM4EzgTFBQUEhQUFBIVExQSORM4EzgTOBMUFBQSFBQUEjgUFBQUFBQTFBMUFBQTFBQ4ERUTFBMUExQTFBMUExQUFBIUFBQTFBQUEhQSFBMUExQVExQ4EhQUExMUFBQSFBQUEhQUFBMUExQTFBMUExQTFBMUFBQSFRMUEhUTFBMUEzgTFBMUFRQTFBMUFBQTFBQUExQTFRMUExQTFBMUEhQTFBIVExQTOBM4ExQTOBM4FDgTOBI5FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKpUTOBI4ExQVExQUExQUNxI5EzgTOBM4EzgTOBM4EzgTFBQUExMUFBMUExQTOBM4EzgUNxMUFBQSFBQUEjgUFBQUFBQTFBQTFBQTFBQ4EhQTFBMUExQUFBMUEhQTExMUFBQUFBQTFBQTFBQTFBQUExQ4EhQUExMUFBMTFBQTExQUFBMUExQTFBMUExQTFBMUFBQSFBQUEhQUFBMTFDgTFBMUExQTFBQUExQSFBMUEhQUFBMUExQTFBMUExQTFBMUFBQSOBQ4ExMUFBMUExQTFBMUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKJcSORE5EhYSFg8XEBYROhI6EDoSOhA6ERYRFhIWEhYROw8WEhYQFxEWEBcROhA7EjoRFhA6EhYSFhEWEjoQFhEXEhQSFhIUFBURFBI5FBQTFRMUExUTFBMUFBQTFBQUExQUFBMUExQUFBMUFBQTFBM5ERUTFBMUExQTFBMUExQTFRIUFBQSFBQUEhUTFBIVExQTFBMUExQUFBIUEToSFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWERYSFhEWERcRFhEWEjoPOxEWEhYSFhEWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABKpUTNxI4ExQTExQUFBQUNxI5EzgTOBI3EzgVExQUExQUOBIUExQTFBMUExQTOBM4FDkSFBM4ExQVExQUEzgSFBQUEhUTFBMUExQTFBM4ExQTFBUUEhUTFBMVEhUTFRIVEhYSFRMUExUSFRMVEhUSFRM5ERUSFRIVERYRFhIWEBYSFhEWERYRFhEWERYRFhEXERcQFhIWEBYSFhIUEzkSFBQUFBQUFBMUExQUFBMUFBQTFBQUExQTFBQUExQUFBMUExURFhIVEjoQFhE6ERYRFhIXEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKJcROhA6EBYRFhEWExYROhA6EjoQOhI6EBYSOhAWEhYSOhAWEhYQFhIWEBYSOhA6EzoRFhI4ExUUFBMUEzkRFRMUExQTFBMUExQTFBM4ExQTFRQUExQUFBMUEhYRFhEWEhYSFRIWERYSFhEWERYQFhE6EhYSFhEWEhYRFhEWEhYRFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIWEToRFhAXERYRFhEWERYRFhEWEhYQFxEWERYRFhEWERYSFhIWERcRFhEWEjoQORI6EBcRFhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKJcROhA6ERYSFhIWERYSOhE5EzgSORM4EjkTOBMUExQTOBQUFBQTFBQUExQUOBE4FDgTFBM4ExQTFBQUFDgSFBMVEhQUFBIUEhYQFhI6EhQSFhIWEhYRFhEWEhYRFhIWERYSFhEWEhYRFhEWEhYRFhE7EBYRFhEWERYRFhEWERYRFxAWEhYQFhIWEBcRFhEWDxcQFhEWEhURFhIWEDoSFhIWEhYRFhEWEhYRFhIWERYRFxEWERYSFhEWEhYRFhEWEhYRFhIWEToQFhIVEToSFhIWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABKZcQOhA6ERYQFhEWERYQOhI6EToROhE6ExQUFRM4ERUTORIUExUUFBMUFBMUOBI4EzkSFBQ4EBYSFhIWEToQFhIWEBcSFhEWEhYRFhE6EBYRFhEWERYRFhEWERYSFhAWEhYRFhEWERYRFhEWERYRFhE7EBYSFhIWERYSFhEWERYSFhIWERYRFhIWERYRFhIWERcRFhAWERYSFhIWEToQFhEXEBYSFhAXERYQFxEWERYRFhEWEhYQFhMWEhYRFhEWEhYSFhEWEToROhAWEjoQFxEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABKJcROhA6EhYRFhEWEBYROhA7EToSOg86EzoPFxA6EhYSOhAWEhYQFhIWEBYSOhA6EzoRFhA6EhYSFhEWEjoPFxEWERYRFhEWERYRFhE6ERYSFhAWEhYRFhAWEBcQFhIWEBcRFhMUERYRFhEWERYRFhE6EhYSFhEWEhYRFhIWERYRFxEWEhUSFhEWEhYRFhEWEhYSFhEWERYSFhEWEToQFxAWExUSFhAWEBYRFhEWERYSFhAXERYRFhEWERYRFhEWERcQFhIWEDoSFhI6EDoRFhMWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABKpUSOBI4ExQQFhIWEhYROhA6EjoQOxE6ERYROhE6EhYROxAWERYRFhEWEhUROhI6EDsRFhI6EBYSFhAWEjoQFhIWEhYSFRIWERYSFhE6EBYRFxAWEhYQFhIWEBcRFhMUERYRFxEWERYRFhEWERYRFhE7EBYSFhIWERYSFhEWEhYRFhIWERYRFhQUERYSFhEWERcRFhEWEhYRFhIWEToQFhEXEBYSFhAWEhYQFhIWEBcRFhEWERYRFhIVERYSFhAWEhYRFhEWEToROhE6EToRFhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABKJcSORE6ERYRFxIWDxYROhE6EjoROhA6EzoQOhE6EhYSOhEWEBYSFhEWERYROhE6EToSFhI6EBYRFhEWEToRFhEXEhYRFhIWERYRFhI6EBYRFxAWEhYQFhIWEBYSFhAWEhYRFhEWERYRFhEWERYRFhI6EBYRFhAWERYQFhIWEBcRFhEWERYRFhEWERYSFhAWEhYRFhEWERYRFhEWEToRFhEXEhYRFhIWERYRFhIWERYSFhEWEhYRFhEWEhYRFhIWEBYSFhEWEDoQFxAWEhYSOhAWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKJcROg86EhYSFhIWERYROhA6EjoQOhI6ERYRFhEWEToROhIWEhYRFhEWERYQOhI6EDoROhI6ExQQFxEWEDsRFhIXERYRFhIWERYSFRI6EBYRFxAWEhYQFhIWEBYSFhAXERYRFhEWERYRFhEWEhURFhI6EBcRFhIWEhUSFhEWEhYRFhIWFBMSFhEWERYSFhEWEhYRFhIWERYRFhIWEToQFhEXEBYSFhAXERYRFhQTERYRFhEWEhYQFhIWEBYSFhAWEhYSOhAWEjoQOhMVEhYROhEWFAANBQ==",  # noqa: E501
+            },
+            ir_packets_manager.SPEED_AUTO: {
+                ir_packets_manager.TEMP_PREFIX.format(
+                    16
+                ): "JgDYAAABKpUTNxI4ExQTFBMUFBQUNxI5EzgTOBM4FBQSFBQUETgTFBMUFBMVFBMUFBMUOBI4EzgTOBQ3ExQUFBIUFDgSFBQUFBQUFBMUFBMUFBM4EhQUOBMTFBQUFBQTFBQSFBMUExQUExMUFBMTFBQUEhQUFBI5ExQVExQUExQUExQUExQUFBQTFBQTFBQTFBQTFBQUExQUFBMUFBQTFBMUFDgSFBMUExQUExMUFBMTFBQUEhQUFBM4ExQVExQUExQUExQUExUTFBQ3EjgUOBIUFBQSOBQUFgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    17
+                ): "JgDYAAABKJcQOhA6ERYQFhIWEhYROhA7EToROhE6EToRFhIWEjoQFhIWEBYSFhAWEhYQOhI6EDsROhE6ERYSFhIWEToQFhIWEBcRFhAXERYRFhE6ERYROhEWEhYQFhIWEBYSFhAWEhYRFhEWEhYRFhAWEBYRFhE7EBYSFhAXERYQFxEWERYRFhEWEhYQFhIWEBYSFhAWEhYRFhEWERYRFhEWEToRFhEXFBQTFBQUExQTFRMUExQTFBMUEhQUFBIVExQSFRMUExQTOBMUEzgTFBI5ERYSOhAWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    18
+                ): "JgDYAAABKpMVNxI4FBQUFBQTFBQTOBI4FDgSOBQ4ExMUOBMTFDgTFBQTExQUExMUEhQTNxU4EjgTOBM4ExQUFRIVEjkQFhIWERYRFhEWERYRFhE6ERYROxAWEhYQFhIWEBcRFhAXERYRFhEWERYSFhAWEhYQFhI6ERYRFhIWEhYRFhEWEhYRFxEWERYSFhEWERYSFhEWExUTFBMVExQTFRMUEzgSFBMVEhUTFBIVExQTFBMUExQTFRIUFBQSFBQUEhUTFBIVExQROhEWEzoPOhI6EBcROhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    19
+                ): "JgDYAAABKJcQOhA6EhYSFhEWEhYROhA6EjoQOhI6EDoSOhAXEToQFxEWExUSFhEWEhYROhA6ETsQFhIWEDoUFBQUEzgSFBQUExQTFBMUExQTFBM4ERYROxAWEhYQFhIWEBcRFhAXERYRFhIVERYSFhAWEhYQFhI6EhYQFhEWEBYSFhIWERYSFhEWEhYRFhIVEhYRFhIWERYSFhEWEhYRFhEWEjoQFhEWERYRFhEWEhURFhIWEBYSFhEWERYRFhEWERYSFhAWERYQFhI6EDsRFhIWEjoQORIWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    20
+                ): "JgDYAAABKJcROhA6EBYRFhEWExYROhA6EjoQOhI6EBYSFhA6EjoRFhEWERYRFhEWEhUROhI6EDsRFhIWEjoPFhIWEDsRFhIXERYRFhIWERYRFhI6EBYROhIWEBYQFhIWERYQFhAXEBYSFhIWERYSFhEWEhYRFhE7DxcRFhEWERYRFhEWERYRFxAWEhYQFhIWEBYSFhAXERYRFhEWERYSFREWEjoQFhIWEhYSFRIWERYSFhEWEhUSFhIWERYRFhIWERYSFhEWERcRFhE6EDoSOhAWEjoQOhMWEwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    21
+                ): "JgDYAAABKpUTOBI4ExQVExQUExQUNxI5EzgTOBM4EzgTFBU3EjgUFBUTFBQTFBMUExUSORE5ETsQFxEWEDsRFhIWEjoPFxEWERYRFhEWERYRFhE6ERYROxAXERYQFxEWERYRFhEWERcQFhIWEhcTFBMUFBQTFBM5EhQTFBMUExQTFBMUExQUFBIVExQSFRMUExQTFBMUExUSFBQUEhQSFhAWEjoQFhIWEhYSFhEWEhYRFhEWEhYRFhIWERYSFhEWERYSFhEWEhYRFhI6DzoSFhI6EDoROhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    22
+                ): "JgDYAAABK5USOBI4FBMVFBMUFBMUOBI4FDcTOBQ3ExQUOBI4FTgSFBMUFBQSFBQUEhQUOBI4FTgTFBIUFDgSFBQUFDgRFRIVEhUTFRAWEhYQFhI6EBYSOhEWERYRFhEWEhYSFhEWEhYRFhIWERYRFhIWERYSFhE6EBYSFhAWEhYQFhIWEBcRFhEWERYRFhEWERYSFhAWEhYRFhEWEhUTFBIVEzgTFBMVFBQTFBQTExQTFBQUExQSFBMUEhUTFBEWERYRFhEWERYSFhA6EjoQOhI6EDoSOhEWFAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    23
+                ): "JgDYAAABKpUTOBI3FBQUFBQTFBQTOBI4FDgTNxQ4EzgTOBM4EzgTFBQUEhQUFBIUFBQSOBQ4EzgUExUTFDgSFBMUEzgTFBUUExQUFBMUExQUFBM4ERUTOREVExUTFRIVExURFhEXERYSFhEWERYSFhEWEhYRFhE7DxcRFhAXERYSFRMUEhUTFRIUFBQSFBQUEhQUFBIVExQTFBMUExQRFhEWEToRFhIWEhYRFhIWERYSFhEWERYSFhIVEhYRFhIWERYRFhIWERcRFhE6EDoSFhIWERYSFhE6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    24
+                ): "JgDYAAABKJgROhA7ERUSFhAYDhgPOxA6EzoQOhE7ERcQFhIWEhYQPBAWEBcRFw8WEhcPOxE7EDoRFxEYEDoPFxEXEDsQGBEXEBYSFhIWERURGBA7DxgPOxAXERYSFxAXEBgQFxAXERcQFxEWERYSFxEXEBcRFhA8DhgRFw4YEBcQFxAWERcQFxAXERcQFhEXEBYRGA4XEhYQGBEVERcPGA8XED0OGA8YEhYQFxEYEBYQFxEZDhcRFxAXCR8RFw8XEhYQFxEYDxcRFxA9Cj8POxAYDxgKHBE8EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    25
+                ): "JgDYAAABKpUTOBE4ExQTFBMUFBQUOBE5EzgTOBM4EzgTFBUUExQTOhAWEhURFhIVEhUSOBM4FDgTFRIVEjgTFRIVEzgSFRMVERYSFRIVEhUSFRI4ExUSORQVEhUTFBMVEhUTFRIVEhYSFRMUExUSFRMVEhUTFBM5ERUTFBIVExURFRMVERUTFRIVEhUSFRIVEhUSFRIVExURFRMVERYSFRIVEjgTFRIVFBUSFRIVExUSFRMVEhUSFhIVEhUTFRIVExUSFRIVExUTFBM4EjkSFRM5ERUTFRE4FgANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    26
+                ): "JgDYAAABKZcROg86EhYSFhIWEhUROhA6EjoQOhI6ERYROhEWERYSOxAWERYSFRIWERYROhE6EDsTFRIWEToRFhAWEjoQFhIWEhYSFhIVEhUSFhE6ERUROxAWEhYTFREWEhYRFhIVEhYSFhIVERYRFhEWEhYPFxA7EBYSFRMWERYRFxIVERYTFREWExURFhIWEhURFhIWERcRFhIVEhYRFhEWEjoQFhEWEhURFxAWEhYQFhIWEBYSFhEWERYRFhIWEBcQFhAWEhcSFRI5EDoTORA6EhYSFhI6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    27
+                ): "JgDYAAABKpUTNxM4FBQTFBMUEhQTOBM4FDgTNxM4FTcTOBMUExQUORIUExQTFBMUExQTOBM4FDgTOBMTFDgTFBMUEzgTFBQVExQUExQUExQUExQ4EhQTOBMUFBMVFBMUFBQTFBMUExQUFBMUEhQSFBMUFBQSFBQ4ExQTFBQUFBQTFBQTFBQTFRMUExQUFBMUFBMUFBMUFBQUExQUExQUExQUEzgSFBQUExQTFBMUExQTFBMUExQUFBIUExQSFBQUFBQUExQUExQUOBI4EzgTFBMUEzgUExU4FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    28
+                ): "JgDYAAABK5QTOBI4FBQUExQUExQUOBI4FDgSOBM4ExQUExM4FBMVOBIUFBMTFBQTExQUNxM4FTgTNxMUEzgTFBQTEzgUExUUFBMUFBMUFBQTFBQ3EhQUOBMUExQUFBQUExQUExQUExQUFBMUFBQTFBQTFBQTFBQ4EhQTFRMUExQTFBMUExQTFBMUFBQSFBQUEhQUFBMTFBQTFBMUExQUExMUFDcTFBQUFBQUExQUExQUFBMUFBMUFBQTFBQTFBQUExQUExQUExQUOBM4FTcSOBMUEjgVFBM4FQANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    29
+                ): "JgDYAAABKJcRORE5EhYSFhEWEhYROhE5EjoQOhI6EDoSFhI6EBYROxAWEhYSFhEWEhYROhA6ETsQOhIWEjoRFREWEToRFhMWERYSFhEWERYSFhE6EBYROxAWEhYSFhEWEhYRFhIWERYSFhEWERYSFhEWEhYRFhE7DxcRFhEWERYRFhEWERYRFxAWEhYQFhIWEBYSFhAXERYRFhEWERYSFREWEjoQFhIWEhYSFhEWERYSFhEWEhYRFhIWERYRFhIWERYSFhEWERcROhA6EToRFhE6EToSFhI6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    30
+                ): "JgDYAAABKJgQOhA6ERYTFhEWERYSOhA6EToROhE6ERYSORE6EhYSOhEWEBYSFhAXERYQOxE6EToROhQTEjkRFhQTEzoQFhEWERYSFREWEhYQFhI6EBYSOhEWERYRFhEWERYRFhEWERcQFhIWEBYSFhAXERYRFhE6ERYRFhMWERYRFhIWERYSFhEWEhYRFhEWEhYRFhIWERYSFhEWEhUSFhEWEToQFhMWERYSFhEWEhUSFhEWEhYRFhIWERYSFhEWERYSFhEWEhYROhE5EjkROhE7EDoSFhI6EwANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    31
+                ): "JgDYAAABKJcROhA6EhYRFhEWEBYROhA7EjoRORE6EjoROhE6EhYROxIUExQTFBMUExQTOBM5EjkTOBIVEzgTFBMUFDgSFBQUEhUTFBMUExQTFBM4ExQTORAWFBQSFBIWEBYSFhAXERYRFhEWERYRFhEWEhYQFhI6ERYRFhIWEhYRFhEWEhYRFhIWERYSFhEWERYSFhEWEhYRFhIWERYRFhIXEToQFhEXEBYSFhAWEhYQFxEWEBcRFhEWERYRFhIWEBYSFhAWEhYROhE6EToRFhIWEhYROhA6FAANBQ==",  # noqa: E501
+                ir_packets_manager.TEMP_PREFIX.format(
+                    32
+                ): "JgDYAAABKJcQOw86ExUTFRIWERYROg87EjoQOxE6EBcSFRAYEDoROxAYERcQFxAXERcQOhE6EDwROxAWETkSFhIXEToQFhEXDxgPGA8XERcPGBE5ERYROxAXERcRFw8YEBcRFxAXEhYQFxEWEhYRFxIUERcRFxE7DhcSFw4YEBYRFhEXEBcQFxAXEBcRFhAYDhkQFxAYDxcOGREXCR4QGAkcCUESFhAYERgPFxEXEBgPGBAXEBYSFxAWEhgNHQgbERgQFRMWCR4RPQ07EDwOPBAaDxgPPAlCEQANBQ==",  # noqa: E501
+            },
+        },
+    }
+
+
+ac_type_to_packet_func = {
+    ir_packets_manager.AC_ELCO_SMALL: get_ir_dict_elco_small,
+    ir_packets_manager.AC_ELECTRA_CLASSIC_35: get_ir_dict_electra_classic_35,
+}
+
+fan_type_to_packet_func = {
+    ir_packets_manager.FAN_HYUNDAI_CEILING_FAN: get_ir_dict_hyundai_ceiling_fan
+}
+
+
+def build_packets_table(
+    type_to_packet_func: Dict[str, Callable[[], Dict]]
+) -> Dict[ir_packets_manager.PacketKey, str]:
+    """Use for flattening the ir dictionaries into a lookup table.
+
+    The table is keyed by (device_type, mode, speed, temp),
+    speed and temp are None for modes not requiring them.
+    """
+    table = {}  # type: Dict[ir_packets_manager.PacketKey, str]
+    for device_type, packet_func in type_to_packet_func.items():
+        for mode, value in packet_func().items():
+            if isinstance(value, dict):
+                for speed, temps in value.items():
+                    for temp_key, packet in temps.items():
+                        temp = int(temp_key.rsplit("_", 1)[1])
+                        table[(device_type, mode, speed, temp)] = packet
+            else:
+                table[(device_type, mode, None, None)] = value
+    return table
+
+
+def device_packets(
+    table: Dict[ir_packets_manager.PacketKey, str], device_type: str
+) -> Dict[ir_codebook.PacketKey, str]:
+    """Use for selecting the packets of a device keyed as in its codebook."""
+    return {
+        key[1:]: packet
+        for key, packet in table.items()
+        if key[0] == device_type
+    }
+
+
+def convert(directory: str = ir_codebook.CODEBOOKS_DIR) -> None:
+    """Use for generating and verifying codebooks from the ir dictionaries."""
+    os.makedirs(directory, exist_ok=True)
+    for type_to_packet_func in (
+        ac_type_to_packet_func,
+        fan_type_to_packet_func,
+    ):
+        table = build_packets_table(type_to_packet_func)
+        for device_type in type_to_packet_func:
+            packets = device_packets(table, device_type)
+            path = ir_codebook.codebook_path(device_type, directory)
+            ir_codebook.write_codebook(path, packets)
+            ir_codebook.verify_codebook(path, packets)
+            print("{}: {} packets".format(path, len(packets)))
+
+
+if __name__ == "__main__":
+    convert(*sys.argv[1:2])